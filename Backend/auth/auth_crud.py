@@ -2,39 +2,23 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from models import User
 from .auth_schema import NewUserForm
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__default_rounds=12)
-
-def hash_password(password: str):
-    """
-    비밀번호 해싱 함수
-    """
-    return pwd_context.hash(password)
 
 # 회원가입
-def create_user(new_user: NewUserForm, db: Session):
+def create_user(new_user: NewUserForm, hashed_password: str, db: Session):
     """
-    회원가입 - 비밀번호 해싱 후 저장
+    회원가입 - 해싱된 비밀번호(PasswordHasher.hash)와 함께 저장
     """
     user = User(
         email = new_user.email,
         name = new_user.name,
         nickname = new_user.nickname,
         phone = new_user.phone,
-        password = hash_password(new_user.password),
+        password = hashed_password,
         user_img = new_user.user_img)
     db.add(user)
     db.commit()
     return user
 
-def verify_password(plain_password, hashed_password):
-    """
-    로그인 시, 비밀번호 검증
-    """
-    return pwd_context.verify(plain_password, hashed_password)
-
-
 def update_user_password(db: Session, email: str, hashed_password: str):
     """
     사용자 비밀번호 업데이트 (OAuth2 사용자는 불가)
@@ -49,4 +33,13 @@ def update_user_password(db: Session, email: str, hashed_password: str):
             )
 
         user.password = hashed_password
-        db.commit()
\ No newline at end of file
+        db.commit()
+
+
+def upgrade_password_hash(db: Session, user_pk: int, new_hash: str):
+    """
+    로그인 시 비용(BCRYPT_ROUNDS)이 바뀐 해시를 새 해시로 교체
+    (OAuth 연동 계정도 비밀번호 로그인이 가능하므로 update_user_password와 달리 막지 않음)
+    """
+    db.query(User).filter(User.user_pk == user_pk).update({User.password: new_hash}, synchronize_session=False)
+    db.commit()
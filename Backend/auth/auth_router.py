@@ -6,27 +6,32 @@ from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, BackgroundTasks
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm, HTTPBearer
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
-from jose import JWTError, jwt
 from redis import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_db, get_async_db
 from models import User
 from . import auth_crud, auth_schema
 from user import user_crud
+from user.user_schema import AuthUser
 from utils.auth_utils import (
     create_access_token,
-    create_refresh_token,
     delete_auth_cookies,
     generate_verification_code,
     get_current_user,
     get_optional_user,
+    refresh_key,
+    revoke_refresh_family,
     save_verification_code,
     send_sms,
     set_auth_cookies,
+    start_refresh_family,
     verify_code,
 )
 from utils.redis_utils import get_redis
+from utils import principal_cache
+from utils.password_hasher import PasswordHasher, get_password_hasher
 
 load_dotenv()
 
@@ -57,7 +62,7 @@ router = APIRouter(
 
 
 @router.get("/me", description="현재 로그인 한 사용자 조회")
-async def get_user_info(current_user: User = Depends(get_current_user)):
+async def get_user_info(current_user: AuthUser = Depends(get_current_user)):
     return {"user_pk": current_user.user_pk, "email": current_user.email, "nickname":current_user.nickname, "is_oauth_user": current_user.is_oauth_user}
 
 
@@ -83,7 +88,12 @@ async def check_verified(phone: str, redis_client: Redis):
         raise HTTPException(status_code=500, detail="Error checking verification status")
 
 @router.post("/signup")
-async def signup(new_user: auth_schema.NewUserForm, db: Session = Depends(get_db), redis_client: Redis = Depends(get_redis)):
+async def signup(
+    new_user: auth_schema.NewUserForm,
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: Redis = Depends(get_redis),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
+):
     """
     회원가입 API (비밀번호 일치 검증 추가)
     """
@@ -91,7 +101,7 @@ async def signup(new_user: auth_schema.NewUserForm, db: Session = Depends(get_db
         # 이메일 소문자로 변환
         normalized_email = new_user.email.lower()
 
-        existing_user = user_crud.get_user_by_email(db, normalized_email)
+        existing_user = await db.run_sync(user_crud.get_user_by_email, normalized_email)
 
         if existing_user:
             if existing_user.is_oauth_user:
@@ -102,7 +112,7 @@ async def signup(new_user: auth_schema.NewUserForm, db: Session = Depends(get_db
             raise HTTPException(status_code=409, detail="이미 사용 중인 이메일입니다.")
 
         # 닉네임 중복 체크
-        if user_crud.get_user_by_nickname(db, new_user.nickname):
+        if await db.run_sync(user_crud.get_user_by_nickname, new_user.nickname):
             raise HTTPException(status_code=409, detail="이미 사용 중인 닉네임입니다.")
 
         # 전화번호 인증 여부 확인
@@ -115,7 +125,9 @@ async def signup(new_user: auth_schema.NewUserForm, db: Session = Depends(get_db
         # 사용자 생성
         user_data = new_user.dict()
         user_data["email"] = normalized_email  # 이메일을 소문자로 덮어쓰기
-        auth_crud.create_user(auth_schema.NewUserForm(**user_data), db)
+        hashed_password = await password_hasher.hash(new_user.password)
+        new_user_form = auth_schema.NewUserForm(**user_data)
+        await db.run_sync(lambda session: auth_crud.create_user(new_user_form, hashed_password, session))
 
         return {"message": "회원가입이 완료되었습니다."}
         
@@ -125,12 +137,18 @@ async def signup(new_user: auth_schema.NewUserForm, db: Session = Depends(get_db
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/login")
-async def login(response: Response, login_form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db), redis_client: Redis = Depends(get_redis)):
+async def login(
+    response: Response,
+    login_form: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: Redis = Depends(get_redis),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
+):
     """
     일반 로그인 처리 (OAuth2 연결된 사용자는 비밀번호 로그인도 가능)
     """
     # 이메일로 사용자 조회
-    user = user_crud.get_user_by_email(db, login_form.username)
+    user = await db.run_sync(user_crud.get_user_by_email, login_form.username)
     if not user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="아이디를 다시 확인해주세요.")
 
@@ -141,20 +159,20 @@ async def login(response: Response, login_form: OAuth2PasswordRequestForm = Depe
             detail="이 계정은 Google OAuth2 계정입니다. 일반 로그인이 불가능합니다. Google 로그인을 이용하세요."
         )
 
-    # 비밀번호 검증
-    if not auth_crud.verify_password(login_form.password, user.password):
+    # 비밀번호 검증 (프로세스 풀), 해시 비용이 바뀌었으면 새 해시로 교체
+    verified, new_hash = await password_hasher.verify(login_form.password, user.password)
+    if not verified:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="비밀번호를 다시 확인해주세요.")
+    if new_hash:
+        await db.run_sync(auth_crud.upgrade_password_hash, user.user_pk, new_hash)
 
     # Access Token 생성
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(data={"sub": user.email}, expires_delta=access_token_expires)
 
-    # Refresh Token 생성
+    # Refresh Token 생성 (새 token family 시작, Redis에 만료 시간과 함께 저장)
     refresh_token_expires = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    refresh_token = create_refresh_token(data={"sub": user.email}, expires_delta=refresh_token_expires)
-
-    # Redis에 Refresh Token 저장 (만료 시간 설정)
-    await redis_client.setex(f"refresh_token:{user.email}", int(refresh_token_expires.total_seconds()), refresh_token)
+    refresh_token = await start_refresh_family(redis_client, user.email, refresh_token_expires)
 
     # 쿠키 설정을 위한 함수 호출
     set_auth_cookies(
@@ -174,30 +192,15 @@ async def logout(request: Request, response: Response, db: Session = Depends(get
     refresh_token = request.cookies.get("refresh_token")
         
     if refresh_token:
-        try:
-            payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
-            email = payload.get("sub")
-            if email:
-                stored_token = await redis_client.get(f"refresh_token:{email}")
-                
-                # Redis에서 가져온 토큰이 bytes인 경우 디코딩
-                if isinstance(stored_token, bytes):
-                    stored_token = stored_token.decode('utf-8')
-                
-                if stored_token == refresh_token:
-                    # 토큰이 일치하면 삭제
-                    await redis_client.delete(f"refresh_token:{email}")
-                # 토큰이 일치하지 않아도 계속 진행
-        except JWTError:
-            # JWT 디코딩 실패해도 계속 진행
-            pass
+        # 현재 family의 refresh token이면 Redis에서 삭제 (일치하지 않거나 디코딩 실패해도 계속 진행)
+        await revoke_refresh_family(redis_client, refresh_token)
 
     delete_auth_cookies(response)
 
     return {"message": "성공적으로 로그아웃 되었습니다."}
 
 @router.post("/find-id")
-async def find_id(request: auth_schema.FindIdRequest, db: Session = Depends(get_db), redis_client: Redis = Depends(get_redis)):
+async def find_id(request: auth_schema.FindIdRequest, db: AsyncSession = Depends(get_async_db), redis_client: Redis = Depends(get_redis)):
     try:
         # Redis 값 로깅
         verified_value = await redis_client.get(f"verified:{request.phone}")
@@ -205,7 +208,7 @@ async def find_id(request: auth_schema.FindIdRequest, db: Session = Depends(get_
         await check_verified(request.phone, redis_client)
 
         # 사용자 조회
-        user = user_crud.get_user_by_name_and_phone(db, request.name, request.phone)
+        user = await db.run_sync(user_crud.get_user_by_name_and_phone, request.name, request.phone)
         if not user:
             raise HTTPException(status_code=404, detail="User not Found")
 
@@ -253,7 +256,7 @@ async def send_verification_email_endpoint(background_tasks: BackgroundTasks, em
 
 
 @router.post("/verify-email-code")
-async def verify_email_code(email_verification: auth_schema.EmailVerificationSchema, db: Session = Depends(get_db), redis_client: Redis = Depends(get_redis)):
+async def verify_email_code(email_verification: auth_schema.EmailVerificationSchema, db: AsyncSession = Depends(get_async_db), redis_client: Redis = Depends(get_redis)):
     """
     이메일 인증 코드 및 이름 검증
     """
@@ -275,7 +278,7 @@ async def verify_email_code(email_verification: auth_schema.EmailVerificationSch
         )
 
     # 사용자 존재 여부 먼저 확인
-    user = user_crud.get_user_by_email(db, email_verification.email)
+    user = await db.run_sync(user_crud.get_user_by_email, email_verification.email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
@@ -307,9 +310,10 @@ async def reset_password(
     request: Request,
     response: Response,
     reset_password: auth_schema.ResetPasswordSchema, 
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     redis_client: Redis = Depends(get_redis),
-    current_user: Optional[User] = Depends(get_optional_user)
+    current_user: Optional[AuthUser] = Depends(get_optional_user),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ):
     """
     비밀번호 재설정 - 두 가지 경우 처리
@@ -344,7 +348,7 @@ async def reset_password(
         email = email.decode("utf-8") if isinstance(email, bytes) else email
         
         # 사용자 확인
-        user = user_crud.get_user_by_email(db, email)
+        user = await db.run_sync(user_crud.get_user_by_email, email)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, 
@@ -360,14 +364,15 @@ async def reset_password(
         )
 
     # 비밀번호 변경
-    hashed_password = auth_crud.hash_password(reset_password.new_password)
-    auth_crud.update_user_password(db, email, hashed_password)
+    hashed_password = await password_hasher.hash(reset_password.new_password)
+    await db.run_sync(auth_crud.update_user_password, email, hashed_password)
+    await principal_cache.invalidate_principal(redis_client, email)
     print(f"사용자({email})의 비밀번호가 성공적으로 변경됨")
 
     # 비밀번호 변경 후 처리
     if current_user:  # 로그인된 사용자인 경우
         # Redis에서 refresh token 삭제 및 쿠키 제거
-        await redis_client.delete(f"refresh_token:{email}")
+        await redis_client.delete(refresh_key(email))
         response.delete_cookie("access_token")
         response.delete_cookie("refresh_token")
     else:  # 이메일 인증을 통한 접근인 경우
@@ -380,8 +385,9 @@ async def reset_password(
 @router.post("/verify-password", description="현재 로그인한 사용자의 비밀번호 확인")
 async def verify_user_password(
     password_form: auth_schema.PasswordVerifyForm,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ):
     """
     현재 로그인한 사용자의 비밀번호를 확인.
@@ -389,12 +395,13 @@ async def verify_user_password(
     """
     try:
         # 사용자 조회
-        user = user_crud.get_user_by_email(db, current_user.email)
+        user = await db.run_sync(user_crud.get_user_by_email, current_user.email)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         # 비밀번호 확인
-        if not auth_crud.verify_password(password_form.password, user.password):
+        verified, _ = await password_hasher.verify(password_form.password, user.password)
+        if not verified:
             raise HTTPException(status_code=400, detail="비밀번호를 다시 확인해주세요")
 
         return {"message": "비밀번호가 확인되었습니다."}
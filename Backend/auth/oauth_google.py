@@ -9,7 +9,7 @@ from user import user_crud
 import uuid
 import os
 import requests
-from utils.auth_utils import set_auth_cookies
+from utils.auth_utils import set_auth_cookies, start_refresh_family
 from utils.redis_utils import get_redis
 from redis import Redis
 
@@ -41,14 +41,6 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def create_refresh_token(data: dict, expires_delta: timedelta = None):
-    """JWT Refresh Token 생성"""
-    to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(days=7))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-
-
 import logging
 
 # 로그 설정
@@ -185,18 +177,9 @@ async def google_callback(
             expires_delta=access_token_expires
         )
 
+        # 5. Refresh Token 생성 및 Redis에 저장 (새 token family 시작)
         refresh_token_expires = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-        jwt_refresh_token = create_refresh_token(
-            data={"sub": email}, 
-            expires_delta=refresh_token_expires
-        )
-
-        # 5. Redis에 Refresh Token 저장
-        redis_client.setex(
-            f"refresh_token:{email}", 
-            int(refresh_token_expires.total_seconds()), 
-            jwt_refresh_token
-        )
+        jwt_refresh_token = await start_refresh_family(redis_client, email, refresh_token_expires)
         
         # 6. Response 생성 및 쿠키 설정
         response = Response(status_code=302)
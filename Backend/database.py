@@ -1,35 +1,49 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from dotenv import load_dotenv
+import itertools
 import os
-from typing import Generator
+import threading
+import time
+from typing import Generator, AsyncGenerator, Optional
+from fastapi import Request, Response
 
 # .env 파일 로드
 load_dotenv()
 
 # 데이터베이스 설정
-def get_db_url() -> str:
-    """데이터베이스 URL을 생성하는 함수"""
+def get_db_url(driver: str = "pymysql") -> str:
+    """데이터베이스 URL을 생성하는 함수 (async 엔진은 driver="aiomysql")"""
     user = os.getenv("DB_USER")
     passwd = os.getenv("DB_PASSWD")
     host = os.getenv("DB_HOST")
     port = os.getenv("DB_PORT")
     db = os.getenv("DB_NAME")
     
-    return f'mysql+pymysql://{user}:{passwd}@{host}:{port}/{db}?charset=utf8mb4'
+    return f'mysql+{driver}://{user}:{passwd}@{host}:{port}/{db}?charset=utf8mb4'
 
 # 데이터베이스 설정값
 DB_URL = get_db_url()
+ASYNC_DB_URL = get_db_url("aiomysql")
 POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
 MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
 POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
 POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
 
+# 읽기 전용 복제본 (쉼표로 구분한 SQLAlchemy URL, 없으면 모든 조회가 primary로)
+REPLICA_URLS = [url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()]
+REPLICA_RETRY_SECONDS = float(os.getenv("DB_REPLICA_RETRY_SECONDS", "10"))  # 연결 실패한 복제본을 제외하는 시간
+READ_STICKY_SECONDS = int(os.getenv("DB_READ_STICKY_SECONDS", "5"))  # 쓰기 후 primary에서 읽는 시간 (복제 지연 대비)
+READ_STICKY_COOKIE = "db_read_primary"
+
 # Engine 설정
-def create_engine_with_settings():
+def create_engine_with_settings(url: str = DB_URL):
     """데이터베이스 엔진을 생성하는 함수"""
     return create_engine(
-        DB_URL,
+        url,
         echo=True,
         pool_size=POOL_SIZE,
         max_overflow=MAX_OVERFLOW,
@@ -37,9 +51,78 @@ def create_engine_with_settings():
         pool_pre_ping=POOL_PRE_PING
     )
 
+def create_async_engine_with_settings():
+    """async 라우트용 엔진 (aiomysql, 이벤트 루프를 막지 않음)"""
+    return create_async_engine(
+        ASYNC_DB_URL,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_recycle=POOL_RECYCLE,
+        pool_pre_ping=POOL_PRE_PING
+    )
+
 engine = create_engine_with_settings()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+class ReplicaRouter:
+    """
+    읽기 세션을 복제본에 라운드 로빈으로 분배
+    - 세션 생성 시 커넥션을 미리 받아 확인(pool_pre_ping)하고, 실패한 복제본은 REPLICA_RETRY_SECONDS 동안 제외
+    - 쓸 수 있는 복제본이 없거나 sticky 요청이면 primary 사용
+    """
+
+    def __init__(self, primary: Engine, replicas: list[Engine], retry_seconds: float = REPLICA_RETRY_SECONDS):
+        self.primary = primary
+        self.replicas = replicas
+        self.retry_seconds = retry_seconds
+        self._next = itertools.count()
+        self._down_until: dict[int, float] = {}  # 복제본 index -> 다시 시도할 시각
+        self._lock = threading.Lock()
+        self._session_factory = sessionmaker(autocommit=False, autoflush=False)
+
+    def mark_down(self, index: int):
+        with self._lock:
+            self._down_until[index] = time.monotonic() + self.retry_seconds
+
+    def healthy_replicas(self) -> list[int]:
+        now = time.monotonic()
+        return [i for i in range(len(self.replicas)) if self._down_until.get(i, 0.0) <= now]
+
+    def read_session(self, sticky: bool = False) -> Session:
+        """읽기 전용 세션 (복제본 순회 후 모두 실패하면 primary)"""
+        if not sticky and self.replicas:
+            start = next(self._next)
+            for offset in range(len(self.replicas)):
+                index = (start + offset) % len(self.replicas)
+                if index not in self.healthy_replicas():
+                    continue
+                db = self._session_factory(bind=self.replicas[index])
+                try:
+                    db.connection()  # 체크아웃 + pre_ping으로 상태 확인
+                    return db
+                except OperationalError as e:
+                    db.close()
+                    self.mark_down(index)
+                    print(f"❌ DB 복제본 {index} 연결 실패, {self.retry_seconds:.0f}초 동안 제외: {e}")
+        return self._session_factory(bind=self.primary)
+
+
+def is_read_sticky(request: Request) -> bool:
+    """최근에 쓰기 요청을 보낸 클라이언트인지 (read-your-writes)"""
+    return READ_STICKY_COOKIE in request.cookies
+
+
+def mark_read_sticky(response: Response):
+    """쓰기 요청 응답에 쿠키를 심어 READ_STICKY_SECONDS 동안 조회도 primary에서 하도록 함"""
+    response.set_cookie(READ_STICKY_COOKIE, "1", max_age=READ_STICKY_SECONDS, httponly=True, samesite="lax", path="/")
+
+
+replica_router = ReplicaRouter(engine, [create_engine_with_settings(url) for url in REPLICA_URLS])
+
+async_engine = create_async_engine_with_settings()
+# 커밋 후에도 응답 직렬화 시 추가 쿼리(lazy load)가 나가지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 # Base = declarative_base()  # models.py로 이동됨
 
 def get_db() -> Generator:
@@ -48,4 +131,40 @@ def get_db() -> Generator:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_read_db(request: Request) -> Generator:
+    """조회 전용 라우트용 세션 (복제본이 설정되어 있으면 복제본, 최근 쓰기한 클라이언트는 primary)"""
+    db = replica_router.read_session(sticky=is_read_sticky(request))
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """async 라우트용 데이터베이스 세션을 생성하는 함수"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def run_with_session(fn, *args, **kwargs):
+    """
+    새 세션을 열어 fn(db, *args, **kwargs)를 실행하는 함수
+    스레드 풀에서 여러 조회를 동시에 실행할 때 세션을 공유하지 않기 위해 사용
+    """
+    db = SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+async def run_with_async_session(fn, *args, **kwargs):
+    """
+    새 async 세션을 열어 동기 CRUD 함수 fn(db, *args, **kwargs)를 실행하는 함수
+    AsyncSession.run_sync로 실행하므로 스레드 풀 없이 이벤트 루프에서 비동기 드라이버로 쿼리함
+    """
+    async with AsyncSessionLocal() as db:
+        return await db.run_sync(fn, *args, **kwargs)
@@ -1,11 +1,12 @@
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from typing import List
 from uuid import uuid4
 import os
 
 from models import Discussion, Novel, User, Episode, user_discussion_table
 from . import discussion_schema
+from user.user_schema import AuthUser
 
 def get_discussions(db: Session) -> List[Discussion]:
     """
@@ -125,7 +126,7 @@ def generate_session_id():
     return str(uuid4())
 
 
-def create_discussion_db(db: Session, discussion: discussion_schema.NewDiscussionForm, current_user: User) -> Discussion:
+def create_discussion_db(db: Session, discussion: discussion_schema.NewDiscussionForm, current_user: AuthUser) -> Discussion:
     """
     새로운 토론 방 생성
     """
@@ -187,6 +188,7 @@ def create_novel_txt_file(discussion_pk: int, db: Session) -> dict:
     # 소설의 모든 에피소드 조회 (생성 날짜순 정렬)
     episodes = (
         db.query(Episode)
+        .options(undefer(Episode.ep_content))
         .filter(Episode.novel_pk == novel.novel_pk)
         .order_by(Episode.created_date)
         .all()
@@ -10,11 +10,18 @@ from typing import List
 import aiofiles
 import speech_recognition as sr
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi.concurrency import run_in_threadpool
+from redis import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_db, get_read_db, get_async_db
 from models import Discussion, Novel, Note, User
 from utils.auth_utils import get_current_user
+from user.user_schema import AuthUser
+from utils.redis_utils import get_redis
+from utils import cache_utils
 from . import discussion_crud, discussion_schema
 from .discussion_func.discussion_rag import GeminiDiscussionAssistant
 
@@ -26,7 +33,7 @@ router = APIRouter(
 )
 
 @router.get("/", description="토론 방 전체 조회", response_model=List[discussion_schema.Discussion])
-def get_all_discussions(db: Session = Depends(get_db)):
+def get_all_discussions(db: Session = Depends(get_read_db)):
     """
     모든 토론 방 목록 조회.
     """
@@ -34,7 +41,7 @@ def get_all_discussions(db: Session = Depends(get_db)):
 
 
 @router.get("/{discussion_pk}", response_model=discussion_schema.Discussion)
-def get_discussion(discussion_pk: int, db: Session = Depends(get_db)):
+def get_discussion(discussion_pk: int, db: Session = Depends(get_read_db)):
     """
     특정 토론 방 조회
     """
@@ -43,7 +50,7 @@ def get_discussion(discussion_pk: int, db: Session = Depends(get_db)):
 
 @router.get("/enter-room/{discussion_pk}")
 def enter_discussion_room(
-    discussion_pk: int, user_pk: int, db: Session = Depends(get_db)
+    discussion_pk: int, user_pk: int, db: Session = Depends(get_read_db)
 ):
     """
     특정 토론 방 접속 : user가 해당 토론 방에 예약된 participant인지 확인 후, 예약된 방의 session_id 던져주는 로직
@@ -52,20 +59,24 @@ def enter_discussion_room(
 
 
 @router.post("/", response_model=discussion_schema.GetNewDiscussion, status_code=status.HTTP_201_CREATED)
-def create_discussion(
+async def create_discussion(
     discussion: discussion_schema.NewDiscussionForm,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis),
 ):
     """
     새로운 토론 방 생성 (로그인한 사용자만 가능)
     토론방 생성 후 자동으로 소설 txt 파일도 생성
     """
     # 1. 토론방 생성
-    new_discussion = discussion_crud.create_discussion_db(db, discussion, current_user)
+    new_discussion = await run_in_threadpool(discussion_crud.create_discussion_db, db, discussion, current_user)
     
     # 2. txt 파일 생성
-    discussion_crud.create_novel_txt_file(new_discussion.discussion_pk, db)
+    await run_in_threadpool(discussion_crud.create_novel_txt_file, new_discussion.discussion_pk, db)
+
+    # 3. 소설 상세 페이지 캐시 무효화
+    await cache_utils.invalidate_novel(redis_client, discussion.novel_pk)
 
     return new_discussion
 
@@ -219,15 +230,11 @@ async def create_meeting_minutes(
     duration: float = Form(...),
     participants: str = Form(...),
     messages: str = Form(...),    
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         # 1. Discussion 조회 및 비활성화 처리
-        discussion = (
-            db.query(Discussion)
-            .filter(Discussion.discussion_pk == discussion_pk)
-            .first()
-        )
+        discussion = await db.get(Discussion, discussion_pk)
         if not discussion:
             raise HTTPException(status_code=404, detail="Discussion not found")
             
@@ -235,7 +242,7 @@ async def create_meeting_minutes(
         discussion.end_time = datetime.datetime.now()  # 종료 시간 업데이트
 
         # Novel 조회
-        novel = db.query(Novel).filter(Novel.novel_pk == discussion.novel_pk).first()
+        novel = await db.get(Novel, discussion.novel_pk)
         if not novel:
 
             raise HTTPException(status_code=404, detail="Novel not found")  
@@ -268,16 +275,10 @@ async def create_meeting_minutes(
                 detail=f"토론 파일을 찾을 수 없습니다: {txt_filename}",
             )
 
-        # Gemini Assistant를 통한 요약 생성
+        # Gemini Assistant를 통한 요약 생성 (임베딩/LLM 호출은 블로킹이므로 스레드 풀에서)
         try:
-            assistant = GeminiDiscussionAssistant(txt_file_path, GEMINI_API_KEY)
             meeting_json = json.dumps(meeting_data, ensure_ascii=False)
-            summary_response = assistant.generate_meeting_notes(meeting_json)
-            summary = (
-                summary_response.content
-                if hasattr(summary_response, "content")
-                else str(summary_response)
-            )
+            summary = await run_in_threadpool(generate_meeting_summary, txt_file_path, meeting_json)
 
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"요약 생성 실패: {str(e)}")
@@ -302,8 +303,8 @@ async def create_meeting_minutes(
                 pass
         # 모든 변경사항 커밋
         try:
-            db.commit()
-            db.refresh(new_note)
+            await db.commit()
+            await db.refresh(new_note)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"데이터베이스 저장 실패: {str(e)}")
 
@@ -314,79 +315,82 @@ async def create_meeting_minutes(
         }
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def generate_meeting_summary(document_path: str, meeting_json: str) -> str:
+    """토론 txt 파일을 참고해 회의록 요약 생성"""
+    assistant = GeminiDiscussionAssistant(document_path, GEMINI_API_KEY)
+    summary_response = assistant.generate_meeting_notes(meeting_json)
+    return (
+        summary_response.content
+        if hasattr(summary_response, "content")
+        else str(summary_response)
+    )
+
+
 @router.get("/note/{note_id}", description="토론 요약본 상세 조회")
-async def get_note_summary(note_id: int, db: Session = Depends(get_db)):
+async def get_note_summary(note_id: int, db: AsyncSession = Depends(get_async_db)):
     # Join을 통해 Note, Discussion 및 Novel 정보를 한 번에 조회
-    note = (
-        db.query(Note)
-        .options(
-            joinedload(Note.discussion),  # discussion 정보 로드
+    row = (
+        await db.execute(
+            select(Note.summary, Discussion.topic, Discussion.start_time, Novel.novel_pk, Novel.title)
+            .join(Discussion, Note.discussion_pk == Discussion.discussion_pk)
+            .outerjoin(Novel, Novel.novel_pk == Discussion.novel_pk)
+            .where(Note.note_pk == note_id)
         )
-        .filter(Note.note_pk == note_id)
-        .first()
-    )
+    ).first()
 
-    if not note:
+    if not row:
         raise HTTPException(status_code=404, detail="Note not found")
 
-    # Novel 정보 별도 조회
-    novel = db.query(Novel).filter(Novel.novel_pk == note.discussion.novel_pk).first()
-
-    if not novel:
+    if row.novel_pk is None:
         raise HTTPException(status_code=404, detail="Novel not found")
 
     return {
-        "novel": {"novel_pk": novel.novel_pk, "title": novel.title},
-        "topic": note.discussion.topic,
-        "start_time": note.discussion.start_time,
-        "summary_text": note.summary,
+        "novel": {"novel_pk": row.novel_pk, "title": row.title},
+        "topic": row.topic,
+        "start_time": row.start_time,
+        "summary_text": row.summary,
     }
 
 @router.get(
     "/user/notes", description="로그인한 사용자의 소설에 대한 토론 요약본 목록 조회"
 )
 async def get_user_discussion_summaries(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: AuthUser = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)
 ):
     try:
-        # Novel과 User 관계를 기준으로 먼저 쿼리
-        notes = (
-            db.query(Note)
+        # Novel과 User 관계를 기준으로 note, discussion, novel 정보를 한 번에 조회
+        rows = await db.execute(
+            select(
+                Note.note_pk,
+                Novel.novel_pk,
+                Novel.title,
+                Discussion.topic,
+                Discussion.category,
+                Discussion.start_time,
+            )
             .join(Discussion, Note.discussion_pk == Discussion.discussion_pk)
             .join(Novel, Novel.novel_pk == Discussion.novel_pk)
-            .filter(Novel.user_pk == current_user.user_pk)
-            .all()
+            .where(Novel.user_pk == current_user.user_pk)
         )
 
-        result = []
-        for note in notes:
-            # 각 note에 대해 novel 정보를 별도로 조회
-            novel = (
-                db.query(Novel)
-                .filter(Novel.novel_pk == note.discussion.novel_pk)
-                .first()
-            )
-
-            if novel:
-                result.append(
-                    {
-                        "noteId": note.note_pk,
-                        "novel": {"novel_pk": novel.novel_pk, "title": novel.title},
-                        "topic": note.discussion.topic,
-                        "category": (
-                            "WHOLE_NOVEL"
-                            if not note.discussion.category
-                            else "SPECIFIC_EPISODE"
-                        ),
-                        "start_time": note.discussion.start_time,
-                    }
-                )
-
-        return result
+        return [
+            {
+                "noteId": row.note_pk,
+                "novel": {"novel_pk": row.novel_pk, "title": row.title},
+                "topic": row.topic,
+                "category": (
+                    "WHOLE_NOVEL"
+                    if not row.category
+                    else "SPECIFIC_EPISODE"
+                ),
+                "start_time": row.start_time,
+            }
+            for row in rows
+        ]
 
     except Exception as e:
         print(f"Error: {str(e)}")  # 서버 로그에 에러 출력
@@ -1,19 +1,35 @@
 from fastapi import FastAPI, Request
 import os
+import asyncio
 from contextlib import asynccontextmanager
 from redis.asyncio import Redis
 from concurrent.futures import ThreadPoolExecutor
 from utils.redis_utils import create_redis_client
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+try:  # brotli 미설치 환경에서는 gzip만 사용
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
 
 from user import user_router
 from auth import auth_router
 from novel import novel_router
 from discussion import discussion_router
 from auth.oauth_google import router as google_oauth_router
-
-from database import engine
+from novel.novel_recommend import run_recommend_worker, RECOMMEND_REFRESH_SECONDS
+from novel.genre_registry import load_genres
+from utils.view_counter import run_view_flusher, flush_views
+from utils.recent_history import run_recent_flusher, flush_recent_views
+from utils.deferred_cleanup import run_cleanup_worker
+from utils.principal_cache import run_principal_invalidation_listener
+from utils.password_hasher import PasswordHasher
+
+from database import engine, async_engine, run_with_session, REPLICA_URLS, mark_read_sticky
+from fastapi.concurrency import run_in_threadpool
 from models import Base
 from fastapi.staticfiles import StaticFiles
 
@@ -26,6 +42,29 @@ class CustomHeaderMiddleware(BaseHTTPMiddleware):
         return response
 
 
+# 인증 의존성이 refresh token을 회전했으면 재발급한 쿠키를 최종 응답에 붙임
+# (라우트가 Response를 직접 반환하거나 HTTPException으로 끝나도 새 refresh token을 잃지 않도록)
+class AuthCookieMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        holder = getattr(request.state, "auth_cookies", None)
+        if holder is not None:
+            for cookie in holder.headers.getlist("set-cookie"):
+                response.headers.append("set-cookie", cookie)
+        return response
+
+
+# 쓰기 요청 직후에는 복제 지연 동안 조회도 primary에서 하도록 표시 (read-your-writes)
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method in self.WRITE_METHODS and response.status_code < 400:
+            mark_read_sticky(response)
+        return response
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     try:
@@ -39,6 +78,29 @@ async def lifespan(app: FastAPI):
         app.state.thread_pool = ThreadPoolExecutor(max_workers=4)
         print("✅ ThreadPoolExecutor 초기화 완료!")
 
+        # 비밀번호 해싱/검증용 프로세스 풀
+        app.state.password_hasher = PasswordHasher()
+        await app.state.password_hasher.warm_up()
+        print("✅ 비밀번호 해싱 프로세스 풀 초기화 완료!")
+
+        # 장르 레지스트리 로드 (실패하면 첫 요청 시 다시 로드)
+        try:
+            count = await run_in_threadpool(run_with_session, load_genres)
+            print(f"✅ 장르 {count}개 로드 완료!")
+        except Exception as e:
+            print(f"❌ 장르 로드 실패: {e}")
+
+        # 주기적 백그라운드 작업
+        app.state.background_tasks = [
+            asyncio.create_task(run_view_flusher(app.state.redis)),
+            asyncio.create_task(run_recent_flusher(app.state.redis)),
+            asyncio.create_task(run_cleanup_worker(app.state.redis)),
+            asyncio.create_task(run_principal_invalidation_listener(app.state.redis)),
+        ]
+        if RECOMMEND_REFRESH_SECONDS > 0:
+            app.state.background_tasks.append(asyncio.create_task(run_recommend_worker(app.state.redis)))
+        print("✅ 백그라운드 작업 시작!")
+
         # 라우터 등록
         app.include_router(auth_router.router, tags=["auth"])
         app.include_router(user_router.router, tags=["user"])
@@ -49,19 +111,46 @@ async def lifespan(app: FastAPI):
         yield
 
     finally:
+        # 백그라운드 작업 종료
+        for task in getattr(app.state, "background_tasks", []):
+            task.cancel()
+        await asyncio.gather(*getattr(app.state, "background_tasks", []), return_exceptions=True)
+
+        # 남아있는 조회수 버퍼 반영
+        if hasattr(app.state, "redis"):
+            try:
+                await flush_views(app.state.redis)
+            except Exception as e:
+                print(f"❌ 조회수 반영 실패: {e}")
+
+            try:
+                await flush_recent_views(app.state.redis)
+            except Exception as e:
+                print(f"❌ 최근 본 소설 반영 실패: {e}")
+
         # Redis 연결 종료
         if hasattr(app.state, "redis"):
             await app.state.redis.close()
 
+        # async DB 커넥션 풀 종료
+        await async_engine.dispose()
+
         # ThreadPoolExecutor 종료
         if hasattr(app.state, "thread_pool"):
             app.state.thread_pool.shutdown(wait=True)
             print("✅ ThreadPoolExecutor 정상 종료!")
 
+        if hasattr(app.state, "password_hasher"):
+            app.state.password_hasher.shutdown()
+
         print("🛑 FastAPI 서버 종료!")
 
 
-app = FastAPI(lifespan=lifespan)
+# 응답 압축 기준 크기 (bytes), 작은 응답은 압축 비용이 더 큼
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+
+# 기본 응답 직렬화를 orjson으로 (에피소드 본문 등 긴 한국어 텍스트)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # CORS origins 설정
@@ -78,7 +167,17 @@ origins = [
 ]
 
 # 미들웨어 추가 (순서 중요)
+# Accept-Encoding 협상: br 우선, 지원하지 않는 클라이언트는 gzip
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, minimum_size=COMPRESS_MIN_SIZE, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESS_MIN_SIZE)
+
 app.add_middleware(CustomHeaderMiddleware)  # 먼저 CustomHeaderMiddleware 추가
+app.add_middleware(AuthCookieMiddleware)
+
+if REPLICA_URLS:  # 복제본이 없으면 모든 조회가 primary이므로 불필요
+    app.add_middleware(ReadYourWritesMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
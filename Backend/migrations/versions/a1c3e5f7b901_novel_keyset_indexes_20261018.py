@@ -0,0 +1,29 @@
+"""novel_keyset_indexes_20261018
+
+Revision ID: a1c3e5f7b901
+Revises: f0972280f48c
+Create Date: 2026-10-18 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5f7b901'
+down_revision: Union[str, None] = 'f0972280f48c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 소설 목록 키셋 페이지네이션 (updated_date, novel_pk) / (likes, novel_pk)
+    op.create_index('ix_novel_updated_date_novel_pk', 'novel', ['updated_date', 'novel_pk'], unique=False)
+    op.create_index('ix_novel_likes_novel_pk', 'novel', ['likes', 'novel_pk'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_novel_likes_novel_pk', table_name='novel')
+    op.drop_index('ix_novel_updated_date_novel_pk', table_name='novel')
@@ -0,0 +1,29 @@
+"""fulltext_ngram_search_20261018
+
+Revision ID: b2d4f6a8c013
+Revises: a1c3e5f7b901
+Create Date: 2026-10-18 11:03:47.918204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d4f6a8c013'
+down_revision: Union[str, None] = 'a1c3e5f7b901'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 한국어 검색: ngram parser FULLTEXT 인덱스 (ngram_token_size 기본값 2 = 음절 bigram)
+    op.create_index('ft_novel_text', 'novel', ['title', 'summary', 'synopsis'], unique=False, mysql_prefix='FULLTEXT', mysql_with_parser='ngram')
+    op.create_index('ft_episode_text', 'episode', ['ep_title', 'ep_content'], unique=False, mysql_prefix='FULLTEXT', mysql_with_parser='ngram')
+
+
+def downgrade() -> None:
+    op.drop_index('ft_episode_text', table_name='episode')
+    op.drop_index('ft_novel_text', table_name='novel')
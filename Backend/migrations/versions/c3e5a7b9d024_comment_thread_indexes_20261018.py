@@ -0,0 +1,32 @@
+"""comment_thread_indexes_20261018
+
+Revision ID: c3e5a7b9d024
+Revises: b2d4f6a8c013
+Create Date: 2026-10-18 14:05:47.219306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a7b9d024'
+down_revision: Union[str, None] = 'b2d4f6a8c013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 댓글 스레드 키셋 페이지네이션 (최신순 / 좋아요순)
+    op.create_index('ix_comment_ep_created_comment_pk', 'comment', ['ep_pk', 'created_date', 'comment_pk'], unique=False)
+    op.create_index('ix_comment_ep_likes_comment_pk', 'comment', ['ep_pk', 'likes', 'comment_pk'], unique=False)
+    # 댓글별 앞쪽 대댓글 (ROW_NUMBER 파티션 정렬)
+    op.create_index('ix_cocomment_comment_created_cocomment_pk', 'cocomment', ['comment_pk', 'created_date', 'cocomment_pk'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cocomment_comment_created_cocomment_pk', table_name='cocomment')
+    op.drop_index('ix_comment_ep_likes_comment_pk', table_name='comment')
+    op.drop_index('ix_comment_ep_created_comment_pk', table_name='comment')
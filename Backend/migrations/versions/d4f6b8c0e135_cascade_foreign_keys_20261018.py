@@ -0,0 +1,49 @@
+"""cascade_foreign_keys_20261018
+
+Revision ID: d4f6b8c0e135
+Revises: c3e5a7b9d024
+Create Date: 2026-10-18 16:22:09.581734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f6b8c0e135'
+down_revision: Union[str, None] = 'c3e5a7b9d024'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 소설/사용자 삭제를 DELETE 한 번으로 처리하기 위해 ON DELETE CASCADE가 없던 FK 교체
+# (table, column, referred_table, referred_column)
+CASCADE_FOREIGN_KEYS = [
+    ('comment', 'novel_pk', 'novel', 'novel_pk'),
+    ('comment', 'ep_pk', 'episode', 'ep_pk'),
+    ('comment', 'user_pk', 'users', 'user_pk'),
+    ('discussion', 'ep_pk', 'episode', 'ep_pk'),
+    ('user_discussion', 'user_pk', 'users', 'user_pk'),
+    ('user_discussion', 'discussion_pk', 'discussion', 'discussion_pk'),
+]
+
+
+def _replace_foreign_keys(ondelete: Union[str, None]) -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, column, referred_table, referred_column in CASCADE_FOREIGN_KEYS:
+        # 자동 생성된 FK 이름(comment_ibfk_1 등)은 환경마다 다를 수 있으므로 컬럼으로 찾음
+        for fk in inspector.get_foreign_keys(table):
+            if fk['constrained_columns'] == [column]:
+                op.drop_constraint(fk['name'], table, type_='foreignkey')
+        op.create_foreign_key(
+            f'fk_{table}_{column}', table, referred_table, [column], [referred_column], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    _replace_foreign_keys('CASCADE')
+
+
+def downgrade() -> None:
+    _replace_foreign_keys(None)
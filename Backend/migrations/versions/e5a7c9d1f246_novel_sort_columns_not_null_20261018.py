@@ -0,0 +1,37 @@
+"""novel_sort_columns_not_null_20261018
+
+Revision ID: e5a7c9d1f246
+Revises: d4f6b8c0e135
+Create Date: 2026-10-18 14:32:07.518392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c9d1f246'
+down_revision: Union[str, None] = 'd4f6b8c0e135'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 키셋 cursor의 정렬 값이 NULL이면 다음 페이지 조건(< NULL, = NULL)이 아무 행도 맞지 않으므로
+    # 기존 NULL을 채운 뒤 NOT NULL로 변경 (coalesce 대신 인덱스를 그대로 쓰기 위함)
+    op.execute("UPDATE novel SET updated_date = COALESCE(created_date, NOW()) WHERE updated_date IS NULL")
+    op.execute("UPDATE novel SET likes = 0 WHERE likes IS NULL")
+    op.execute("UPDATE novel SET views = 0 WHERE views IS NULL")
+
+    op.alter_column('novel', 'updated_date', existing_type=sa.DateTime(), nullable=False,
+                    server_default=sa.text('CURRENT_TIMESTAMP'))
+    op.alter_column('novel', 'likes', existing_type=sa.Integer(), nullable=False, server_default='0')
+    op.alter_column('novel', 'views', existing_type=sa.Integer(), nullable=False, server_default='0')
+
+
+def downgrade() -> None:
+    op.alter_column('novel', 'views', existing_type=sa.Integer(), nullable=True, server_default=None)
+    op.alter_column('novel', 'likes', existing_type=sa.Integer(), nullable=True, server_default=None)
+    op.alter_column('novel', 'updated_date', existing_type=sa.DateTime(), nullable=True, server_default=None)
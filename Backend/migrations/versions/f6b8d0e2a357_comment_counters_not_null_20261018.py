@@ -0,0 +1,44 @@
+"""comment_counters_not_null_20261018
+
+Revision ID: f6b8d0e2a357
+Revises: e5a7c9d1f246
+Create Date: 2026-10-18 17:05:41.203816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b8d0e2a357'
+down_revision: Union[str, None] = 'e5a7c9d1f246'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 댓글 스레드 키셋 정렬 값(likes, created_date)이 NULL이면 cursor 이후 행이 모두 빠지고,
+    # NULL 카운터는 likes + 1 해도 NULL이므로 기존 NULL을 채운 뒤 NOT NULL로 변경
+    op.execute("UPDATE comment SET created_date = NOW() WHERE created_date IS NULL")
+    op.execute("UPDATE comment SET likes = 0 WHERE likes IS NULL")
+    op.execute("UPDATE comment SET cocomment_cnt = 0 WHERE cocomment_cnt IS NULL")
+    op.execute("UPDATE cocomment SET created_date = NOW() WHERE created_date IS NULL")
+    op.execute("UPDATE cocomment SET likes = 0 WHERE likes IS NULL")
+
+    op.alter_column('comment', 'created_date', existing_type=sa.DateTime(), nullable=False,
+                    server_default=sa.text('CURRENT_TIMESTAMP'))
+    op.alter_column('comment', 'likes', existing_type=sa.Integer(), nullable=False, server_default='0')
+    op.alter_column('comment', 'cocomment_cnt', existing_type=sa.Integer(), nullable=False, server_default='0')
+    op.alter_column('cocomment', 'created_date', existing_type=sa.DateTime(), nullable=False,
+                    server_default=sa.text('CURRENT_TIMESTAMP'))
+    op.alter_column('cocomment', 'likes', existing_type=sa.Integer(), nullable=False, server_default='0')
+
+
+def downgrade() -> None:
+    op.alter_column('cocomment', 'likes', existing_type=sa.Integer(), nullable=True, server_default=None)
+    op.alter_column('cocomment', 'created_date', existing_type=sa.DateTime(), nullable=True, server_default=None)
+    op.alter_column('comment', 'cocomment_cnt', existing_type=sa.Integer(), nullable=True, server_default=None)
+    op.alter_column('comment', 'likes', existing_type=sa.Integer(), nullable=True, server_default=None)
+    op.alter_column('comment', 'created_date', existing_type=sa.DateTime(), nullable=True, server_default=None)
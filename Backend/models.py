@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, DateTime, Table
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, DateTime, Table, Index
+from sqlalchemy.orm import relationship, Mapped, deferred
 from sqlalchemy.sql import func
 from sqlalchemy.ext.declarative import declarative_base
 from fastapi_users.db import SQLAlchemyBaseOAuthAccountTable
@@ -21,8 +21,8 @@ user_recent_novel_table = Table(
 user_discussion_table = Table(
     "user_discussion",
     Base.metadata,
-    Column("user_pk", Integer, ForeignKey("users.user_pk"), primary_key=True),
-    Column("discussion_pk", Integer, ForeignKey("discussion.discussion_pk"), primary_key=True),
+    Column("user_pk", Integer, ForeignKey("users.user_pk", ondelete="CASCADE"), primary_key=True),
+    Column("discussion_pk", Integer, ForeignKey("discussion.discussion_pk", ondelete="CASCADE"), primary_key=True),
 )
 
 # User와 Novel의 M:N 관계를 위한 연결 테이블
@@ -84,13 +84,13 @@ class User(Base):
     # OAuth2 계정과 연결
     oauth_accounts: Mapped[list[OAuthAccount]] = relationship("OAuthAccount", lazy="select", cascade="all, delete, delete-orphan", passive_deletes=True)
 
-    recent_novels = relationship("Novel", secondary=user_recent_novel_table, back_populates="recent_viewers", passive_deletes=True, lazy="subquery") # 최근에 본 소설 (1:N 관계)
+    recent_novels = relationship("Novel", secondary=user_recent_novel_table, back_populates="recent_viewers", passive_deletes=True, lazy="select") # 최근에 본 소설 (1:N 관계, 필요할 때만 로드)
     liked_novels = relationship("Novel", secondary=user_like_table, back_populates="liked_users", passive_deletes=True)# M:N 관계 설정 (소설 좋아요) 
     liked_comments = relationship("Comment", secondary=user_comment_like_table, back_populates="liked_users", passive_deletes=True) # M:N 관계 설정 (댓글 좋아요)    
     liked_cocomments = relationship("CoComment", secondary=user_cocomment_like_table, back_populates="liked_users", passive_deletes=True) # M:N 관계 설정 (대댓글 좋아요)
     comments = relationship("Comment", back_populates="user", cascade="all, delete-orphan", passive_deletes=True) # 1:N 관계 설정 (작성한 댓글)
     cocomments = relationship("CoComment", back_populates="user", cascade="all, delete-orphan", passive_deletes=True) # 1:N 관계 설정 (작성한 대댓글)
-    discussions = relationship("Discussion", secondary=user_discussion_table, back_populates="participants") # Discussion과의 M:N 관계 설정
+    discussions = relationship("Discussion", secondary=user_discussion_table, back_populates="participants", passive_deletes=True) # Discussion과의 M:N 관계 설정
 
 # Novel Model (Synopsis와 병합됨)
 class Novel(Base):
@@ -104,17 +104,26 @@ class Novel(Base):
     summary = Column(Text, nullable=True)
     novel_img = Column(Text, default="static_url")
     created_date = Column(DateTime, default=func.now())
-    updated_date = Column(DateTime, default=func.now(), onupdate=func.now())
+    # 목록 키셋 정렬 컬럼 (NULL이면 cursor 비교가 실패하므로 NOT NULL)
+    updated_date = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now(), server_default=func.now())
     num_episode = Column(Integer, default=0)
-    likes = Column(Integer, default=0)
-    views = Column(Integer, default=0)
+    likes = Column(Integer, nullable=False, default=0, server_default="0")
+    views = Column(Integer, nullable=False, default=0, server_default="0")
     
     is_completed = Column(Boolean, default=False)
 
+    # 목록 키셋 페이지네이션용 인덱스 (정렬 컬럼, novel_pk)
+    __table_args__ = (
+        Index("ix_novel_updated_date_novel_pk", "updated_date", "novel_pk"),
+        Index("ix_novel_likes_novel_pk", "likes", "novel_pk"),
+        # 한국어 검색용 ngram FULLTEXT 인덱스
+        Index("ft_novel_text", "title", "summary", "synopsis", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+    )
+
     # M:N 관계 설정
-    liked_users = relationship("User", secondary=user_like_table, back_populates="liked_novels")    # 장르 M:N 관계
+    liked_users = relationship("User", secondary=user_like_table, back_populates="liked_novels", passive_deletes=True)    # 장르 M:N 관계
     genres = relationship("Genre", secondary=novel_genre_table, back_populates="novels", cascade="all, delete", passive_deletes=True)
-    recent_viewers = relationship("User", secondary=user_recent_novel_table, back_populates="recent_novels")
+    recent_viewers = relationship("User", secondary=user_recent_novel_table, back_populates="recent_novels", passive_deletes=True)
 
     @property
     def genre_names(self):
@@ -151,20 +160,31 @@ class Episode(Base):
     updated_date = Column(DateTime, default=func.now(), onupdate=func.now())
     views = Column(Integer, default=0)
     comment_cnt = Column(Integer, default=0)
-    ep_content = Column(Text, nullable=False)
+    ep_content = deferred(Column(Text, nullable=False))  # 목록 조회 시 본문 제외, 필요할 때만 undefer
+
+    # 한국어 검색용 ngram FULLTEXT 인덱스
+    __table_args__ = (
+        Index("ft_episode_text", "ep_title", "ep_content", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+    )
 
 # Comment Model
 class Comment(Base):
     __tablename__ = "comment"
 
     comment_pk = Column(Integer, primary_key=True, autoincrement=True)
-    novel_pk = Column(Integer, ForeignKey("novel.novel_pk"), nullable=False)
-    ep_pk = Column(Integer, ForeignKey("episode.ep_pk"), nullable=False)
-    user_pk = Column(Integer, ForeignKey("users.user_pk"), nullable=False)
-    created_date = Column(DateTime, default=func.now())
+    novel_pk = Column(Integer, ForeignKey("novel.novel_pk", ondelete="CASCADE"), nullable=False)
+    ep_pk = Column(Integer, ForeignKey("episode.ep_pk", ondelete="CASCADE"), nullable=False)
+    user_pk = Column(Integer, ForeignKey("users.user_pk", ondelete="CASCADE"), nullable=False)
+    created_date = Column(DateTime, nullable=False, default=func.now(), server_default=func.now())
     content = Column(Text, nullable=False)
-    cocomment_cnt = Column(Integer, default=0)
-    likes = Column(Integer, default=0)
+    cocomment_cnt = Column(Integer, nullable=False, default=0, server_default="0")
+    likes = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # 댓글 스레드 키셋 페이지네이션 (ep_pk, 정렬 컬럼, comment_pk)
+    __table_args__ = (
+        Index("ix_comment_ep_created_comment_pk", "ep_pk", "created_date", "comment_pk"),
+        Index("ix_comment_ep_likes_comment_pk", "ep_pk", "likes", "comment_pk"),
+    )
 
     # M:N 관계 설정 (댓글 좋아요)
     liked_users = relationship("User", secondary=user_comment_like_table, back_populates="liked_comments", passive_deletes=True)
@@ -182,9 +202,14 @@ class CoComment(Base):
     cocomment_pk = Column(Integer, primary_key=True, autoincrement=True)
     user_pk = Column(Integer, ForeignKey("users.user_pk", ondelete="CASCADE"), nullable=False)
     comment_pk = Column(Integer, ForeignKey("comment.comment_pk", ondelete="CASCADE"), nullable=False)
-    created_date = Column(DateTime, default=func.now())
+    created_date = Column(DateTime, nullable=False, default=func.now(), server_default=func.now())
     content = Column(Text, nullable=False)
-    likes = Column(Integer, default=0)
+    likes = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # 댓글별 앞쪽 대댓글 조회 (comment_pk, created_date, cocomment_pk)
+    __table_args__ = (
+        Index("ix_cocomment_comment_created_cocomment_pk", "comment_pk", "created_date", "cocomment_pk"),
+    )
 
     # M:N 관계 설정 (대댓글 좋아요)
     liked_users = relationship("User", secondary=user_cocomment_like_table, back_populates="liked_cocomments",  passive_deletes=True)
@@ -201,7 +226,7 @@ class Discussion(Base):
 
     discussion_pk = Column(Integer, primary_key=True, autoincrement=True)
     novel_pk = Column(Integer, ForeignKey("novel.novel_pk", ondelete="CASCADE"), nullable=False)
-    ep_pk = Column(Integer, ForeignKey("episode.ep_pk"), nullable=True)
+    ep_pk = Column(Integer, ForeignKey("episode.ep_pk", ondelete="CASCADE"), nullable=True)
     session_id = Column(Text, nullable=False)
     topic = Column(Text, nullable=False)
     category = Column(Boolean, nullable=False) # category 0이면 전체에 대한 토론, 1이면 회차별 토론
@@ -210,7 +235,7 @@ class Discussion(Base):
     max_participants = Column(Integer, nullable=False)
     is_active = Column(Boolean, nullable=False, default=1) # 0: inactvie, 1 : active
 
-    participants = relationship("User", secondary=user_discussion_table, back_populates="discussions") # M:N 관계 (토론 참여자)
+    participants = relationship("User", secondary=user_discussion_table, back_populates="discussions", passive_deletes=True) # M:N 관계 (토론 참여자)
     note = relationship("Note", uselist=False, back_populates="discussion") # 1:1 관계
 
 # Note Model
@@ -0,0 +1,69 @@
+import threading
+import time
+from typing import Iterable, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import Genre
+from . import novel_schema
+
+# 장르는 거의 바뀌지 않으므로 프로세스 메모리에 (이름 -> pk, pk -> 이름)으로 보관
+# lifespan에서 load_genres로 채우고, 모르는 이름/pk가 들어오면 DB에서 다시 읽음
+GENRE_RELOAD_MIN_SECONDS = 5  # 없는 장르 요청이 반복될 때 DB 재조회 간격
+
+_genres: tuple[dict[str, int], dict[int, str]] = ({}, {})  # 통째로 교체해 읽는 쪽은 락 없이 사용
+_loaded_at = 0.0
+_lock = threading.Lock()
+
+
+def load_genres(db: Session) -> int:
+    """genre 테이블 전체를 읽어 레지스트리 교체
+    :return: 장르 수
+    """
+    global _genres, _loaded_at
+    rows = db.execute(select(Genre.genre_pk, Genre.genre).order_by(Genre.genre_pk)).all()
+    _genres = ({row.genre: row.genre_pk for row in rows}, {row.genre_pk: row.genre for row in rows})
+    _loaded_at = time.monotonic()
+    return len(rows)
+
+
+def _reload_if_stale(db: Session):
+    """마지막 로드 후 GENRE_RELOAD_MIN_SECONDS가 지났으면 다시 로드 (동시에 한 스레드만)"""
+    with _lock:
+        if not _genres[0] or time.monotonic() - _loaded_at >= GENRE_RELOAD_MIN_SECONDS:
+            load_genres(db)
+
+
+def list_genres() -> list[novel_schema.GenreGetBase]:
+    return [novel_schema.GenreGetBase(genre_pk=pk, genre=name) for pk, name in _genres[1].items()]
+
+
+def genre_pk(db: Session, name: str) -> Optional[int]:
+    """장르 이름 -> pk (없으면 None)"""
+    if name not in _genres[0]:
+        _reload_if_stale(db)
+    return _genres[0].get(name)
+
+
+def genre_names(db: Session, genre_pks: Iterable[int]) -> dict[int, str]:
+    """pk -> 장르 이름 (DB에서 직접 추가된 장르도 한 번 다시 읽어 반영)"""
+    genre_pks = set(genre_pks)
+    if not genre_pks <= _genres[1].keys():
+        _reload_if_stale(db)
+    return {pk: _genres[1][pk] for pk in genre_pks if pk in _genres[1]}
+
+
+def resolve_genres(db: Session, names: Iterable[str]) -> list[novel_schema.GenreGetBase]:
+    """
+    장르 이름 목록을 (중복 제거, 순서 유지) GenreGetBase 목록으로 변환
+    없는 장르가 있으면 404
+    """
+    genres = []
+    for name in dict.fromkeys(names):
+        pk = genre_pk(db, name)
+        if pk is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{name} 장르를 찾을 수 없습니다.")
+        genres.append(novel_schema.GenreGetBase(genre_pk=pk, genre=name))
+    return genres
@@ -1,16 +1,27 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, undefer
 from fastapi import HTTPException, status, Request, Response
 
-from sqlalchemy import select, func
-from . import novel_schema
-from models import Novel, Episode, Comment, CoComment, Character, Genre, novel_genre_table, user_like_table, User, user_recent_novel_table
-from user.user_schema import RecentNovel
+from sqlalchemy import select, insert, update, delete, func, or_, and_, union_all
+from sqlalchemy.dialects.mysql import match as mysql_match
+from . import novel_schema, novel_recommend, genre_registry
+from models import Novel, Episode, Comment, CoComment, Character, Genre, Discussion, novel_genre_table, user_like_table, user_comment_like_table, user_cocomment_like_table, User, user_recent_novel_table
+from user.user_schema import RecentNovel, AuthUser
+from discussion.discussion_crud import DOCUMENT_PATH
 from typing import Optional, Dict, Any
+from redis import Redis
+from utils import trending_utils, cache_utils, http_cache, recent_history
+from database import run_with_async_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.concurrency import run_in_threadpool
+import asyncio
 
 # from sqlalchemy import select
 from datetime import datetime, timedelta
 from collections import Counter
 import os
+import json
+import base64
+import binascii
 from dotenv import load_dotenv
 from fastapi import File, UploadFile 
 import httpx
@@ -37,21 +48,35 @@ def get_novel(novel_pk: int, db: Session):
     return novel
 
 # main page
-def get_recent_novels(db: Session, user_pk: int) -> list[RecentNovel]:
+def get_recent_novels(
+    db: Session, user_pk: int, novel_pks: Optional[list[int]] = None, limit: int = recent_history.RECENT_HISTORY_LIMIT
+) -> list[RecentNovel]:
     """
     주어진 user_pk에 대한 최근 본 소설 목록을 반환
+    - novel_pks: Redis에서 읽은 최근 본 순서의 novel_pk (주어지면 그 순서대로 소설 정보만 조회)
     """
-    recent_novels = (
-        db.execute(
-            select(
-                Novel.novel_pk, Novel.title, Novel.novel_img, Novel.is_completed, user_recent_novel_table.c.viewed_date
+    if novel_pks is not None:
+        rows_by_pk = {
+            row.novel_pk: row
+            for row in db.execute(
+                select(Novel.novel_pk, Novel.title, Novel.novel_img, Novel.is_completed)
+                .where(Novel.novel_pk.in_(novel_pks))
+            )
+        }
+        recent_novels = [rows_by_pk[novel_pk] for novel_pk in novel_pks if novel_pk in rows_by_pk]
+    else:
+        recent_novels = (
+            db.execute(
+                select(
+                    Novel.novel_pk, Novel.title, Novel.novel_img, Novel.is_completed, user_recent_novel_table.c.viewed_date
+                )
+                .join(user_recent_novel_table, Novel.novel_pk == user_recent_novel_table.c.novel_pk)
+                .filter(user_recent_novel_table.c.user_pk == user_pk)
+                .order_by(user_recent_novel_table.c.viewed_date.desc())
+                .limit(limit)
             )
-            .join(user_recent_novel_table, Novel.novel_pk == user_recent_novel_table.c.novel_pk)
-            .filter(user_recent_novel_table.c.user_pk == user_pk)
-            .order_by(user_recent_novel_table.c.viewed_date.desc())
+            .fetchall()
         )
-        .fetchall()
-    )
 
     return [
         RecentNovel(
@@ -64,29 +89,282 @@ def get_recent_novels(db: Session, user_pk: int) -> list[RecentNovel]:
     ]
 
 
-def get_all_novel(db: Session):
-    novels = db.query(Novel).options(joinedload(Novel.genres)).all()
-    
-    # SQLAlchemy 객체를 Pydantic 모델로 변환
-    return [
+# 목록 카드에 필요한 컬럼만 조회 (worldview, synopsis 같은 큰 Text 컬럼 제외)
+NOVEL_CARD_COLUMNS = (
+    Novel.novel_pk,
+    Novel.title,
+    Novel.summary,
+    Novel.created_date,
+    Novel.updated_date,
+    Novel.novel_img,
+    Novel.views,
+    Novel.likes,
+    Novel.is_completed,
+)
+
+# 정렬 옵션별 키셋 컬럼 (정렬 컬럼, novel_pk) 내림차순
+NOVEL_SORT_COLUMNS = {
+    "updated": Novel.updated_date,
+    "likes": Novel.likes,
+}
+
+NOVEL_PAGE_MAX_LIMIT = 100
+
+
+def encode_cursor(sort: str, value, pk: int) -> str:
+    """마지막 행의 (정렬 값, pk)를 불투명한 cursor 문자열로 인코딩"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, pk]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(sort: str, cursor: str):
+    """cursor 문자열을 (정렬 값, pk)로 복원 (문자열 정렬 값은 datetime)"""
+    try:
+        cursor_sort, value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if cursor_sort != sort:
+            raise ValueError("sort mismatch")
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        return value, int(pk)
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 cursor 값입니다.")
+
+
+def get_genres_by_novel(db: Session, novel_pks: list[int]) -> Dict[int, list[novel_schema.GenreGetBase]]:
+    """
+    여러 소설의 장르를 한 번의 쿼리로 조회 (novel_pk -> 장르 리스트)
+    연결 테이블만 읽고 장르 이름은 genre_registry에서 채움
+    """
+    genres_by_novel = {novel_pk: [] for novel_pk in novel_pks}
+    if not novel_pks:
+        return genres_by_novel
+
+    rows = db.execute(
+        select(novel_genre_table.c.novel_pk, novel_genre_table.c.genre_pk)
+        .where(novel_genre_table.c.novel_pk.in_(novel_pks))
+    ).all()
+    names = genre_registry.genre_names(db, {row.genre_pk for row in rows})
+
+    for row in rows:
+        if row.genre_pk in names:
+            genres_by_novel[row.novel_pk].append(
+                novel_schema.GenreGetBase(genre_pk=row.genre_pk, genre=names[row.genre_pk])
+            )
+    return genres_by_novel
+
+
+def get_all_novel(
+    db: Session,
+    sort: str = "updated",
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    genre: Optional[str] = None,
+    is_completed: Optional[bool] = None,
+) -> novel_schema.NovelListResponse:
+    """
+    소설 목록을 키셋(cursor) 방식으로 페이지 단위 조회
+    - sort: "updated"(최근 수정순) 또는 "likes"(선호작순), novel_pk로 동률 정렬
+    - genre: 장르 이름 필터, is_completed: 완결 여부 필터
+    """
+    if sort not in NOVEL_SORT_COLUMNS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="지원하지 않는 정렬 방식입니다.")
+    limit = max(1, min(limit, NOVEL_PAGE_MAX_LIMIT))
+    sort_column = NOVEL_SORT_COLUMNS[sort]
+
+    query = select(*NOVEL_CARD_COLUMNS)
+
+    if genre is not None:
+        genre_pk = genre_registry.genre_pk(db, genre)
+        if genre_pk is None:
+            return novel_schema.NovelListResponse(novels=[], next_cursor=None)
+        # 장르 join 대신 EXISTS로 필터링해 행이 늘어나지 않도록 함
+        query = query.where(
+            select(novel_genre_table.c.novel_pk)
+            .where(novel_genre_table.c.novel_pk == Novel.novel_pk, novel_genre_table.c.genre_pk == genre_pk)
+            .exists()
+        )
+    if is_completed is not None:
+        query = query.where(Novel.is_completed == is_completed)
+
+    if cursor:
+        last_value, last_pk = decode_cursor(sort, cursor)
+        query = query.where(
+            or_(
+                sort_column < last_value,
+                and_(sort_column == last_value, Novel.novel_pk < last_pk),
+            )
+        )
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    rows = db.execute(
+        query.order_by(sort_column.desc(), Novel.novel_pk.desc()).limit(limit + 1)
+    ).all()
+
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    genres_by_novel = get_genres_by_novel(db, [row.novel_pk for row in rows])
+
+    novels = [
         novel_schema.NovelShowBase(
-            novel_pk=novel.novel_pk,
-            title=novel.title,
-            summary = novel.summary, 
-            created_date=novel.created_date,
-            updated_date=novel.updated_date,
-            novel_img=novel.novel_img,
-            views=novel.views,
-            likes=novel.likes,
-            is_completed=novel.is_completed,
-            genre=[novel_schema.GenreGetBase(
-                genre_pk=genre.genre_pk,
-                genre=genre.genre
-                ) for genre  in novel.genres]
+            novel_pk=row.novel_pk,
+            title=row.title,
+            summary=row.summary,
+            created_date=row.created_date,
+            updated_date=row.updated_date,
+            novel_img=row.novel_img,
+            views=row.views,
+            likes=row.likes,
+            is_completed=row.is_completed,
+            genre=genres_by_novel[row.novel_pk],
         )
-        for novel in novels
+        for row in rows
     ]
 
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, getattr(last, sort_column.key), last.novel_pk)
+
+    return novel_schema.NovelListResponse(novels=novels, next_cursor=next_cursor)
+
+
+# 전문 검색 (MySQL ngram FULLTEXT)
+SEARCH_EPISODE_WEIGHT = 0.5  # 본문 일치는 제목/소개 일치보다 낮게 반영
+SEARCH_SNIPPET_BEFORE = 40
+SEARCH_SNIPPET_LENGTH = 120
+SEARCH_MAX_SIZE = 50
+
+
+def make_snippet(text: Optional[str], terms: list[str]) -> Optional[novel_schema.SearchSnippet]:
+    """텍스트에서 검색어가 처음 나타나는 부분을 잘라 하이라이트 위치와 함께 반환"""
+    if not text:
+        return None
+
+    positions = [text.find(term) for term in terms if term in text]
+    start = max(min(positions) - SEARCH_SNIPPET_BEFORE, 0) if positions else 0
+    snippet = text[start:start + SEARCH_SNIPPET_LENGTH]
+
+    highlights = []
+    for term in terms:
+        index = snippet.find(term)
+        while index != -1:
+            highlights.append([index, index + len(term)])
+            index = snippet.find(term, index + len(term))
+    return novel_schema.SearchSnippet(text=snippet, highlights=sorted(highlights))
+
+
+def _sql_snippet(column, term: str):
+    """본문 전체를 가져오지 않도록 DB에서 검색어 주변만 잘라냄"""
+    return func.substring(
+        column,
+        func.greatest(func.locate(term, column) - SEARCH_SNIPPET_BEFORE, 1),
+        SEARCH_SNIPPET_LENGTH,
+    )
+
+
+def _novel_snippet(novel, terms: list[str]) -> Optional[novel_schema.SearchSnippet]:
+    """제목 > 소개 > 시놉시스 순으로 검색어가 포함된 필드의 snippet"""
+    for text in (novel.title, novel.summary):
+        if text and any(term in text for term in terms):
+            return make_snippet(text, terms)
+    return make_snippet(novel.synopsis_snippet, terms)
+
+
+def search_novels(db: Session, q: str, page: int = 1, size: int = 20) -> novel_schema.NovelSearchResponse:
+    """
+    제목, 소개, 시놉시스, 에피소드 본문에서 검색어로 소설 검색
+    소설 단위로 관련도 점수를 합산해 정렬하고, 가장 관련도 높은 에피소드 일부를 함께 반환
+    """
+    terms = q.split()
+    if not terms or max(len(term) for term in terms) < 2:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="검색어는 2글자 이상 입력해주세요.")
+    size = max(1, min(size, SEARCH_MAX_SIZE))
+    page = max(page, 1)
+    snippet_term = max(terms, key=len)
+
+    novel_score = mysql_match(Novel.title, Novel.summary, Novel.synopsis, against=q)
+    episode_score = mysql_match(Episode.ep_title, Episode.ep_content, against=q)
+
+    hits = union_all(
+        select(Novel.novel_pk.label("novel_pk"), novel_score.label("score")).where(novel_score > 0),
+        select(Episode.novel_pk.label("novel_pk"), (episode_score * SEARCH_EPISODE_WEIGHT).label("score")).where(episode_score > 0),
+    ).subquery()
+    ranked = (
+        select(hits.c.novel_pk, func.sum(hits.c.score).label("score"))
+        .group_by(hits.c.novel_pk)
+        .subquery()
+    )
+
+    total = db.execute(select(func.count()).select_from(ranked)).scalar_one()
+    page_rows = db.execute(
+        select(ranked.c.novel_pk, ranked.c.score)
+        .order_by(ranked.c.score.desc(), ranked.c.novel_pk.desc())
+        .limit(size)
+        .offset((page - 1) * size)
+    ).all()
+    novel_pks = [row.novel_pk for row in page_rows]
+    if not novel_pks:
+        return novel_schema.NovelSearchResponse(query=q, total=total, page=page, size=size, results=[])
+
+    # 소설 카드 정보 + 시놉시스 일치 부분
+    novels = {
+        row.novel_pk: row
+        for row in db.execute(
+            select(*NOVEL_CARD_COLUMNS, _sql_snippet(Novel.synopsis, snippet_term).label("synopsis_snippet"))
+            .where(Novel.novel_pk.in_(novel_pks))
+        ).all()
+    }
+    genres_by_novel = get_genres_by_novel(db, novel_pks)
+
+    # 소설별로 가장 관련도 높은 에피소드 1개
+    best_episode = (
+        select(
+            Episode.novel_pk,
+            Episode.ep_pk,
+            Episode.ep_title,
+            _sql_snippet(Episode.ep_content, snippet_term).label("content_snippet"),
+            func.row_number().over(partition_by=Episode.novel_pk, order_by=episode_score.desc()).label("rank"),
+        )
+        .where(Episode.novel_pk.in_(novel_pks), episode_score > 0)
+        .subquery()
+    )
+    episodes = {
+        row.novel_pk: row
+        for row in db.execute(select(best_episode).where(best_episode.c.rank == 1)).all()
+    }
+
+    results = []
+    for row in page_rows:
+        novel = novels.get(row.novel_pk)
+        if novel is None:
+            continue
+        episode = episodes.get(row.novel_pk)
+        results.append(novel_schema.NovelSearchHit(
+            novel=novel_schema.NovelShowBase(
+                novel_pk=novel.novel_pk,
+                title=novel.title,
+                summary=novel.summary,
+                created_date=novel.created_date,
+                updated_date=novel.updated_date,
+                novel_img=novel.novel_img,
+                views=novel.views,
+                likes=novel.likes,
+                is_completed=novel.is_completed,
+                genre=genres_by_novel[novel.novel_pk],
+            ),
+            score=float(row.score),
+            snippet=_novel_snippet(novel, terms),
+            episode=novel_schema.SearchEpisodeHit(
+                ep_pk=episode.ep_pk,
+                ep_title=episode.ep_title,
+                snippet=make_snippet(episode.content_snippet, terms),
+            ) if episode else None,
+        ))
+
+    return novel_schema.NovelSearchResponse(query=q, total=total, page=page, size=size, results=results)
+
 
 # 소설 검색 (pk 기반, 테스트 용도라 추후 삭제)
 def search_novel(novel_pk: int, db: Session):
@@ -99,6 +377,80 @@ def search_novel(novel_pk: int, db: Session):
     )
 
 
+# 조건부 요청(ETag/Last-Modified) 검증값: 본문 없이 updated_date와 카운트만 조회
+# :return: (etag, last_modified), 대상이 없으면 None
+
+def get_novel_info_validator(novel_pk: int, db: Session) -> Optional[tuple[str, datetime]]:
+    row = db.execute(
+        select(Novel.updated_date, Novel.likes, Novel.views).where(Novel.novel_pk == novel_pk)
+    ).first()
+    if row is None:
+        return None
+    return http_cache.make_etag("novel", novel_pk, row.updated_date, row.likes, row.views), row.updated_date
+
+
+def get_episode_list_validator(novel_pk: int, db: Session) -> Optional[tuple[str, datetime]]:
+    row = db.execute(
+        select(
+            func.count(Episode.ep_pk).label("count"),
+            func.max(Episode.updated_date).label("updated_date"),
+            func.coalesce(func.sum(Episode.views), 0).label("views"),
+            func.coalesce(func.sum(Episode.comment_cnt), 0).label("comment_cnt"),
+        ).where(Episode.novel_pk == novel_pk)
+    ).one()
+    if not row.count and not db.execute(select(Novel.novel_pk).where(Novel.novel_pk == novel_pk)).first():
+        return None
+    etag = http_cache.make_etag("episodes", novel_pk, row.count, row.updated_date, row.views, row.comment_cnt)
+    return etag, row.updated_date
+
+
+def get_episode_validator(novel_pk: int, ep_pk: int, db: Session) -> Optional[tuple[str, datetime]]:
+    # 응답에 소설 제목이 포함되므로 소설 수정 시각도 함께 반영
+    row = db.execute(
+        select(Episode.updated_date, Novel.updated_date.label("novel_updated_date"))
+        .join(Novel, Novel.novel_pk == Episode.novel_pk)
+        .where(Episode.novel_pk == novel_pk, Episode.ep_pk == ep_pk)
+    ).first()
+    if row is None:
+        return None
+    last_modified = max(value for value in (row.updated_date, row.novel_updated_date) if value is not None)
+    return http_cache.make_etag("episode", ep_pk, row.updated_date, row.novel_updated_date), last_modified
+
+
+def bump_counter(db: Session, column, pk: int, delta: int, keep_updated_date: bool = True):
+    """
+    비정규화 카운터를 column = column + delta 로 원자적으로 갱신 (커밋은 호출한 쪽에서, 쓰기와 같은 트랜잭션)
+    :param column: Novel.num_episode, Episode.comment_cnt, Comment.cocomment_cnt 등
+    :param keep_updated_date: updated_date 컬럼이 있으면 그대로 유지
+    """
+    table = column.class_.__table__
+    pk_column = table.primary_key.columns.values()[0]
+    values = {column.key: table.c[column.key] + delta}
+    if keep_updated_date and "updated_date" in table.c:
+        values["updated_date"] = table.c.updated_date
+    db.execute(update(table).where(pk_column == pk).values(values))
+
+
+def touch_novel(novel_pk: int, db: Session):
+    """소설 하위 데이터(등장인물 등) 변경 시 Novel.updated_date 갱신 (커밋은 호출한 쪽에서)"""
+    db.execute(update(Novel).where(Novel.novel_pk == novel_pk).values(updated_date=func.now()))
+
+
+# 디테일 페이지 정보 (에피소드, 소설 정보, 토론, 댓글, 작가)
+def get_novel_detail(novel_pk: int, db: Session) -> Dict[str, Any]:
+    novel_info = search_novel(novel_pk, db)
+    if not novel_info:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="소설을 찾을 수 없습니다.")
+
+    novel = novel_info[0]
+    episode = novel_episode(novel_pk, db)
+    discussion = db.query(Discussion).filter(Discussion.novel_pk == novel_pk).all()
+    comment = get_novel_comment(novel_pk, db)
+    author = db.query(User.nickname).filter(User.user_pk == novel.user_pk).scalar()
+
+    return {"episode" : episode, "novel_info" : novel_info, "discussion": discussion, "comment" : comment, "author" : author}
+
+
 def create_novel(novel_info: novel_schema.NovelCreateBase, user_pk: int, db: Session):
     novel = Novel(
         title=novel_info.title,
@@ -108,30 +460,14 @@ def create_novel(novel_info: novel_schema.NovelCreateBase, user_pk: int, db: Ses
         summary = novel_info.summary
     )
     
+    genre_names = genre_registry.resolve_genres(db, novel_info.genres)
+
     db.add(novel)
     db.flush()  # 이 시점에서 novel_pk가 생성됩니다.
-    
-    for genre_name in novel_info.genres:
-        print("genre_name_is",genre_name)
-        genre_data = db.query(Genre).filter(Genre.genre == genre_name).first()
-        if genre_data:
-            db.execute(novel_genre_table.insert().values(
-                novel_pk=novel.novel_pk,
-                genre_pk=genre_data.genre_pk
-            ))
-        else:
-            print(f"Genre not found: {genre_name}")
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않는 장르입니다.")
+    set_novel_genres(db, novel.novel_pk, genre_names)
     db.commit()
     db.refresh(novel)
 
-    # novel.genres를 문자열 리스트로 변환
-    # genre_names = [genre.genre for genre in novel.genres]
-    genre_names = [
-        novel_schema.GenreGetBase(genre_pk=genre.genre_pk, genre=genre.genre)
-        for genre in novel.genres
-    ]
-
     # 스키마 객체 생성
     novel_base = novel_schema.NovelShowBaseCreate( # NovelShowBase 스키마 사용
         novel_pk=novel.novel_pk,
@@ -148,6 +484,17 @@ def create_novel(novel_info: novel_schema.NovelCreateBase, user_pk: int, db: Ses
     
     return novel_base
 
+def set_novel_genres(db: Session, novel_pk: int, genres: list[novel_schema.GenreGetBase]):
+    """소설의 장르 연결을 교체 (기존 행 DELETE 후 multi-row INSERT 한 번, 커밋은 호출한 쪽에서)"""
+    db.execute(delete(novel_genre_table).where(novel_genre_table.c.novel_pk == novel_pk))
+    if genres:
+        db.execute(
+            insert(novel_genre_table).values(
+                [{"novel_pk": novel_pk, "genre_pk": genre.genre_pk} for genre in genres]
+            )
+        )
+
+
 # 소설 부분 업데이트. 이건 전체 저장 용도로 쓰면 될듯.
 def update_novel(novel_pk: int, update_data: novel_schema.NovelUpdateBase, db: Session):
     novel = db.query(Novel).filter(Novel.novel_pk == novel_pk).first()
@@ -164,17 +511,10 @@ def update_novel(novel_pk: int, update_data: novel_schema.NovelUpdateBase, db: S
 
         # 2. 장르 업데이트
         else :
-            new_genres = update_data_dict["genre"]
-
-            # *** Correct way to update genres ***
-            novel.genres = []  # Clear existing genres
-            for genre_name in new_genres:
-                genre = db.query(Genre).filter(Genre.genre == genre_name).first()
-                if genre:
-                    novel.genres.append(genre)
-                else:
-                    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{genre_name} 장르를 찾을 수 없습니다.")
+            set_novel_genres(db, novel_pk, genre_registry.resolve_genres(db, value or []))
 
+    # 장르만 바뀐 경우에도 수정 시각 갱신 (조건부 요청 검증값)
+    novel.updated_date = func.now()
 
     db.commit()
     db.refresh(novel)  # Refresh after commit
@@ -182,123 +522,322 @@ def update_novel(novel_pk: int, update_data: novel_schema.NovelUpdateBase, db: S
     return novel  # Return the updated novel
 
 #소설 삭제(장르 중계 테이블도 삭제해줘야 함.)
-def delete_novel(novel_pk: int, user: User, db: Session):
-    novel = db.query(Novel).filter(Novel.novel_pk == novel_pk).first()
-    
-    if not novel:
+def local_image_path(img: Optional[str]) -> Optional[str]:
+    """static 디렉토리에 저장된 이미지면 파일 경로 (외부 URL, 기본값이면 None)"""
+    if not img or img == "static_url" or "://" in img:
+        return None
+    return os.path.join(os.getcwd(), "static", os.path.basename(img))
+
+
+def collect_novel_cleanup(db: Session, *criteria) -> dict:
+    """
+    삭제할 소설들의 pk와 DB 삭제 후 지울 파일 목록 (토론용 txt, 로컬 표지 이미지)
+    :param criteria: Novel 조회 조건 (예: Novel.novel_pk == 1, Novel.user_pk == 2)
+    """
+    novels = db.execute(select(Novel.novel_pk, Novel.title, Novel.novel_img).where(*criteria)).all()
+    titles = {row.novel_pk: row.title for row in novels}
+    files = [path for path in (local_image_path(row.novel_img) for row in novels) if path]
+    if titles:
+        sessions = db.execute(
+            select(Discussion.novel_pk, Discussion.session_id).where(Discussion.novel_pk.in_(titles))
+        )
+        files += [os.path.join(DOCUMENT_PATH, f"{titles[row.novel_pk]}_{row.session_id}.txt") for row in sessions]
+    return {"novel_pks": list(titles), "files": files}
+
+
+def delete_novel(novel_pk: int, user_pk: int, db: Session) -> dict:
+    """
+    소설 삭제 - 하위 데이터(에피소드, 댓글, 좋아요, 토론 등)는 DB의 ON DELETE CASCADE로 함께 삭제
+    관계 컬렉션을 로드하지 않고 DELETE 한 번으로 처리
+    :return: deferred_cleanup.enqueue_cleanup에 넘길 정리 작업
+    """
+    owner_pk = db.execute(select(Novel.user_pk).where(Novel.novel_pk == novel_pk)).scalar_one_or_none()
+    if owner_pk is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Novel not found"
         )
-    
-    if novel.user_pk != user.user_pk:
+
+    if owner_pk != user_pk:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this novel"
         )
-    
-    db.delete(novel)
+
+    cleanup = collect_novel_cleanup(db, Novel.novel_pk == novel_pk)
+    db.execute(delete(Novel).where(Novel.novel_pk == novel_pk).execution_options(synchronize_session=False))
     db.commit()
-    
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return cleanup
 
 
+def _exists(db: Session, pk_column, pk: int) -> bool:
+    """pk 존재 여부만 확인 (행 전체를 로드하지 않음)"""
+    return db.execute(select(pk_column).where(pk_column == pk)).first() is not None
 
-async def like_novel(novel_pk: int, user_pk: int, db: Session):
-    novel = db.query(Novel).filter(Novel.novel_pk == novel_pk).first()
-    if not novel:
+
+def toggle_like(db: Session, link_table, target, target_pk: int, user_pk: int) -> tuple[bool, int, int]:
+    """
+    좋아요 토글 (연결 테이블 행 DELETE, 지운 행이 없으면 INSERT IGNORE)
+    카운터는 likes = likes ± 1 로 같은 트랜잭션에서 원자적으로 갱신 (liked_users 컬렉션을 로드하지 않음)
+
+    :param link_table: userlike / user_comment_like / user_cocomment_like
+    :param target: Novel / Comment / CoComment
+    :return: (토글 후 좋아요 여부, 카운터 증감(-1/0/+1), 토글 후 좋아요 수)
+    """
+    target_table = target.__table__
+    pk_name = target_table.primary_key.columns.values()[0].name
+    target_col = link_table.c[pk_name]
+
+    try:
+        removed = db.execute(
+            delete(link_table).where(link_table.c.user_pk == user_pk, target_col == target_pk)
+        ).rowcount
+        if removed:
+            liked, delta = False, -removed
+        else:
+            # 같은 사용자의 동시 요청이 먼저 넣었으면 rowcount 0 → 카운터 변화 없음
+            liked = True
+            delta = db.execute(
+                insert(link_table).prefix_with("IGNORE").values({"user_pk": user_pk, pk_name: target_pk})
+            ).rowcount
+
+        values = {"likes": target_table.c.likes + delta}
+        if "updated_date" in target_table.c:
+            values["updated_date"] = target_table.c.updated_date  # 좋아요는 수정 시각을 바꾸지 않음
+        if delta:
+            db.execute(update(target_table).where(target_table.c[pk_name] == target_pk).values(values))
+        likes = db.execute(select(target_table.c.likes).where(target_table.c[pk_name] == target_pk)).scalar_one()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return liked, delta, likes
+
+
+async def like_novel(novel_pk: int, user_pk: int, db: AsyncSession, redis_client: Redis):
+    if not await db.run_sync(_exists, Novel.novel_pk, novel_pk):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="소설을 찾을 수 없습니다."
         )
-    
-    user = db.query(User).filter(User.user_pk == user_pk).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다."
-        )
 
     try:
-        if user in novel.liked_users:
-            novel.liked_users.remove(user)
-            novel.likes -= 1
-        else:
-            novel.liked_users.append(user)
-            novel.likes += 1
-        
-        db.commit()
-        db.refresh(novel)
-        
-        return {
-            "status": "success",
-            "liked": user in novel.liked_users,
-            "total_likes": novel.likes
-        }
-        
+        liked, delta, likes = await db.run_sync(toggle_like, user_like_table, Novel, novel_pk, user_pk)
     except Exception as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="좋아요 처리 중 오류가 발생했습니다."
         )
 
+    await update_liked_cache(redis_client, "novel", user_pk, novel_pk, liked)
+
+    # 실시간 인기 집계용 일별 버킷 반영, 캐시된 상세 payload의 좋아요 수 무효화 (동시 중복 요청으로 변화가 없으면 생략)
+    if delta:
+        await trending_utils.record_like(redis_client, novel_pk, liked)
+        await cache_utils.invalidate_novel(redis_client, novel_pk)
+
+    return {
+        "status": "success",
+        "liked": liked,
+        "total_likes": likes
+    }
+
+# 내가 좋아요한 항목 일괄 조회 (댓글 목록 등 한 페이지 분량을 한 번에)
+LIKE_TABLES = {
+    "novel": user_like_table,
+    "comment": user_comment_like_table,
+    "cocomment": user_cocomment_like_table,
+}
+LIKED_LOOKUP_MAX_IDS = 100
+LIKED_CACHE_TTL = int(os.getenv("LIKED_CACHE_TTL", "600"))  # 0이면 Redis 캐시 사용 안 함
+
+
+def liked_cache_key(target: str, user_pk: int) -> str:
+    """사용자별 좋아요 여부 (Redis hash: field=id, value=1/0) 키"""
+    return f"liked:{target}:{user_pk}"
+
+
+def get_liked_ids(db: Session, target: str, user_pk: int, ids: Optional[list[int]] = None) -> list[int]:
+    """
+    연결 테이블에서 사용자가 좋아요한 id 조회 (ids가 없으면 전체)
+    """
+    table = LIKE_TABLES[target]
+    target_col = table.c[f"{target}_pk"]
+    query = select(target_col).where(table.c.user_pk == user_pk)
+    if ids is not None:
+        query = query.where(target_col.in_(ids))
+    return db.execute(query).scalars().all()
+
+
+async def liked_by_me(db: AsyncSession, redis_client: Redis, target: str, user_pk: int, ids: list[int]) -> Dict[int, bool]:
+    """
+    요청한 id 목록의 좋아요 여부
+    캐시에 있는 id는 HMGET 한 번으로 읽고, 없는 id만 DB에서 조회해 채움 (사용자의 좋아요 전체를 읽지 않음)
+    """
+    ids = list(dict.fromkeys(ids))
+    if LIKED_CACHE_TTL <= 0:
+        liked = set(await db.run_sync(get_liked_ids, target, user_pk, ids))
+        return {pk: pk in liked for pk in ids}
+
+    key = liked_cache_key(target, user_pk)
+    flags = dict(zip(ids, await redis_client.hmget(key, ids)))
+    missing = [pk for pk in ids if flags[pk] is None]
+    if missing:
+        liked = set(await db.run_sync(get_liked_ids, target, user_pk, missing))
+        # 그 사이 토글이 기록한 값은 덮어쓰지 않음 (HSETNX)
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for pk in missing:
+                pipe.hsetnx(key, pk, int(pk in liked))
+            pipe.expire(key, LIKED_CACHE_TTL)
+            await pipe.execute()
+        flags.update({pk: str(int(pk in liked)) for pk in missing})
+    return {pk: flags[pk] == "1" for pk in ids}
+
+
+async def update_liked_cache(redis_client: Redis, target: str, user_pk: int, target_pk: int, liked: bool):
+    """좋아요 토글 결과를 캐시의 해당 id에만 반영 (캐시 전체를 지우고 다시 채우지 않음)"""
+    if LIKED_CACHE_TTL <= 0:
+        return
+    key = liked_cache_key(target, user_pk)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, target_pk, int(liked))
+        pipe.expire(key, LIKED_CACHE_TTL)
+        await pipe.execute()
+
 # 메인 화면 추천 서비스 
 
+# 메인 페이지 섹션 캐시 (전체 공통 인기 순위 / 사용자별 최근 본 소설)
+MAIN_BEST_CACHE_KEY = "main:best"
+MAIN_BEST_CACHE_TTL = int(os.getenv("MAIN_BEST_CACHE_TTL", "60"))
+
+
+async def get_main_best(redis_client: Redis) -> Dict[str, list[novel_schema.NovelInfo]]:
+    """
+    메인 페이지 인기 순위 (2일, 30일) - 모든 사용자가 공유하는 캐시
+    """
+    payload = await cache_utils.get_cached(redis_client, "main_best", MAIN_BEST_CACHE_KEY)
+    if payload is not None:
+        cached = json.loads(payload)
+        return {name: [novel_schema.NovelInfo(**item) for item in items] for name, items in cached.items()}
+
+    recent_top, month_top = await asyncio.gather(recent_hit(2, redis_client), recent_hit(30, redis_client))
+    sections = {"recent_top": recent_top, "month_top": month_top}
+    payload = json.dumps({name: [item.model_dump() for item in items] for name, items in sections.items()}, ensure_ascii=False)
+    await cache_utils.set_cached(redis_client, MAIN_BEST_CACHE_KEY, payload, ttl=MAIN_BEST_CACHE_TTL)
+    return sections
+
+
+async def load_recent_novels(
+    redis_client: Redis, user_pk: int, limit: int = recent_history.RECENT_HISTORY_LIMIT
+) -> list[RecentNovel]:
+    """
+    최근 본 소설 - Redis에 있는 최근 기록 순서로 소설 정보만 DB에서 조회
+    Redis 기록이 없으면(만료 등) DB의 기록으로 조회 후 Redis를 다시 채움
+    """
+    novel_pks = await recent_history.get_recent_novel_pks(redis_client, user_pk, limit)
+    if novel_pks is not None:
+        return await run_with_async_session(get_recent_novels, user_pk, novel_pks)
+
+    rows = await run_with_async_session(recent_history.get_recent_history, user_pk)
+    await recent_history.warm_recent(redis_client, user_pk, rows)
+    return await run_with_async_session(get_recent_novels, user_pk, [novel_pk for novel_pk, _ in rows][:limit])
+
+
 # 실시간 인기
 
-def recent_hit(days: int, db: Session) -> Optional[Dict[str, Any]]:
+def get_novel_titles(db: Session, novel_pks: list[int]) -> Dict[int, str]:
+    """novel_pk -> 제목"""
+    if not novel_pks:
+        return {}
+    return dict(db.execute(select(Novel.novel_pk, Novel.title).where(Novel.novel_pk.in_(novel_pks))).all())
+
+
+async def recent_hit(days: int, redis_client: Redis, limit: int = 10) -> list[novel_schema.NovelInfo]:
     """
-    최근 N일 동안 가장 많이 좋아요를 받은 소설 정보 반환
+    최근 N일 동안 가장 많이 좋아요를 받은 소설 목록 반환 (일별 Redis 버킷 합산)
     """
-    today = datetime.now()
-    day_n_back = today - timedelta(days=days)
+    ranking = await trending_utils.top_novels(redis_client, days, limit)
+    if not ranking:
+        return []
 
-    hit_novel = (
-        db.query(Novel)
-        .join(user_like_table)
-        .filter(user_like_table.c.liked_date >= day_n_back)
-        .group_by(Novel.novel_pk)
-        .order_by(func.count(user_like_table.c.user_pk).desc())
-        .first()
-    )
+    titles = await run_with_async_session(get_novel_titles, [novel_pk for novel_pk, _ in ranking])
 
-    if hit_novel:
-        return {
-            "title": hit_novel.title,
-            "pk": hit_novel.novel_pk
-        }
-    return None
-    
+    # 삭제된 소설은 제외
+    return [
+        novel_schema.NovelInfo(title=titles[novel_pk], pk=novel_pk, likes=likes)
+        for novel_pk, likes in ranking
+        if novel_pk in titles
+    ]
 
-#추천 작품
-def momoso_recommend(db : Session) :
-    #일단 유저가 가장 많이 읽은 장르를 sorting함.  #novel_genre 테이블에서가장 많이 한 것 sorting
-    #조회수 높은 기준으로 sorting함. 
-    #조회수 대비 선호작이 가장 놓은 작품 sorting함.
-    #이거 3개를 매번 sorting하면 됨.
-    # liked, views
-    
-    genres = db.query(Genre).all()
+
+def get_daily_like_counts(db: Session, days: int) -> list[tuple]:
+    """
+    최근 N일 동안의 일별, 소설별 선호작 수 (트렌딩 버킷 재생성용)
+    :return: [(liked_day, novel_pk, count), ...]
+    """
+    day_n_back = datetime.now().date() - timedelta(days=days)
+    liked_day = func.date(user_like_table.c.liked_date)
+
+    rows = db.execute(
+        select(liked_day, user_like_table.c.novel_pk, func.count())
+        .where(user_like_table.c.liked_date >= day_n_back)
+        .group_by(liked_day, user_like_table.c.novel_pk)
+    ).all()
+    return [tuple(row) for row in rows]
     
-    genres_count = []
-    for genre in genres : 
-        count = db.query(Novel).join(Novel.genres).filter(Genre.gerne_pk == genre.genre_pk)
-        genres_count.append([count, genre.genre])
-        
-    genre = genres_count.sort()[0][1]
 
-    #속도가 느릴 것 같아서 조금 더 고민해보자. 딱 한번만 더 모델을 바꾸면 진짜 최고인데....ㅠㅠㅠㅠ 하 진짜 
-    # 아니면 선호작만 할까?
-    # 선호작 대비해서 조회수를 계산하면 좋긴한데 좀 느림.
+#추천 작품 (novel_recommend에서 주기적으로 계산한 결과를 Redis에서 조회)
+async def momoso_recommend(user_pk: int, db: AsyncSession, redis_client: Redis, limit: int = 20) -> list[novel_schema.NovelShowBase]:
+    payload = await redis_client.get(novel_recommend.recommend_key(user_pk))
+    if payload is None:
+        payload = await redis_client.get(novel_recommend.RECOMMEND_DEFAULT_KEY)
+    if payload is None:
+        return []
+
+    novel_pks = json.loads(payload)[:limit]
+    if not novel_pks:
+        return []
+    return await db.run_sync(get_novel_cards, novel_pks)
+
+
+def get_novel_cards(db: Session, novel_pks: list[int]) -> list[novel_schema.NovelShowBase]:
+    """주어진 순서대로 소설 카드 목록 (삭제된 소설 제외)"""
+    rows = db.execute(select(*NOVEL_CARD_COLUMNS).where(Novel.novel_pk.in_(novel_pks))).all()
+    rows_by_pk = {row.novel_pk: row for row in rows}
+    genres_by_novel = get_genres_by_novel(db, list(rows_by_pk))
+
+    return [
+        novel_schema.NovelShowBase(
+            novel_pk=row.novel_pk,
+            title=row.title,
+            summary=row.summary,
+            created_date=row.created_date,
+            updated_date=row.updated_date,
+            novel_img=row.novel_img,
+            views=row.views,
+            likes=row.likes,
+            is_completed=row.is_completed,
+            genre=genres_by_novel[row.novel_pk],
+        )
+        for row in (rows_by_pk.get(novel_pk) for novel_pk in novel_pks)
+        if row is not None
+    ]
 
 #에피소드
 
 # 특정 소설의 에피소드 조회
 
 # 이건 detail 의 에피소드 정보 보내자.
-def novel_episode(novel_pk: int, db: Session):
-    return db.query(Episode).filter(Episode.novel_pk == novel_pk).all()
+def novel_episode(novel_pk: int, db: Session) -> list[novel_schema.EpisodeTocItem]:
+    """
+    에피소드 목차 조회 (본문 ep_content는 조회하지 않음, 본문은 get_episode_detail로 조회)
+    """
+    rows = db.execute(
+        select(Episode.ep_pk, Episode.novel_pk, Episode.ep_title, Episode.created_date, Episode.views, Episode.comment_cnt)
+        .where(Episode.novel_pk == novel_pk)
+        .order_by(Episode.ep_pk)
+    ).all()
+    return [novel_schema.EpisodeTocItem.model_validate(row) for row in rows]
 
 
 # 에피소드 저장
@@ -312,6 +851,8 @@ def save_episode(novel_pk: int, episode_data: novel_schema.EpisodeCreateBase, db
         ep_content=episode_data.ep_content
     )
     db.add(episode)
+    # 새 에피소드는 소설 수정으로 보고 updated_date도 갱신
+    bump_counter(db, Novel.num_episode, novel_pk, 1, keep_updated_date=False)
     db.commit()
     db.refresh(episode)
     return episode
@@ -319,7 +860,7 @@ def save_episode(novel_pk: int, episode_data: novel_schema.EpisodeCreateBase, db
 # 에피소드 수정
 def change_episode(novel_pk: int, update_data: novel_schema.EpisodeUpdateBase, episode_pk : int, db: Session) :
     
-    episode  = db.query(Episode).filter(Episode.ep_pk == episode_pk).first()
+    episode  = db.query(Episode).options(undefer(Episode.ep_content)).filter(Episode.ep_pk == episode_pk).first()
     if not episode :
         return HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     update_data_dict = update_data.model_dump(exclude_unset=True)  # 변경된 데이터만 가져오기
@@ -332,7 +873,7 @@ def change_episode(novel_pk: int, update_data: novel_schema.EpisodeUpdateBase, e
 
 
 # 에피소드 삭제
-def delete_episode(novel_pk: int, episode_pk: int, current_user: User, db: Session):
+def delete_episode(novel_pk: int, episode_pk: int, current_user: AuthUser, db: Session):
     # 에피소드 존재 여부 확인
     episode = db.query(Episode).filter(Episode.ep_pk == episode_pk).first()
     if not episode:
@@ -358,6 +899,7 @@ def delete_episode(novel_pk: int, episode_pk: int, current_user: User, db: Sessi
     
     # 에피소드 삭제
     db.delete(episode)
+    bump_counter(db, Novel.num_episode, episode.novel_pk, -1, keep_updated_date=False)
     db.commit()
     
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -367,6 +909,162 @@ def delete_episode(novel_pk: int, episode_pk: int, current_user: User, db: Sessi
 def get_all_ep_comment(novel_pk: int, ep_pk: int, db: Session):
     return db.query(Comment).filter(Comment.ep_pk == ep_pk).options(joinedload(Comment.user)).all()
 
+# 댓글 스레드 (키셋 페이지네이션 + 댓글별 앞쪽 대댓글 N개, 대댓글 수는 cocomment_cnt)
+COMMENT_SORT_COLUMNS = {
+    "newest": Comment.created_date,
+    "likes": Comment.likes,
+}
+COMMENT_PAGE_MAX_LIMIT = 50
+THREAD_MAX_REPLIES = 10
+
+
+def _comment_author(row) -> novel_schema.CommentAuthor:
+    return novel_schema.CommentAuthor(user_pk=row.user_pk, nickname=row.nickname, user_img=row.user_img)
+
+
+def get_comment_thread(
+    db: Session,
+    ep_pk: int,
+    sort: str = "newest",
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    replies: int = 3,
+) -> novel_schema.CommentThreadResponse:
+    """
+    에피소드 댓글 스레드 조회 (페이지 크기와 관계없이 쿼리 2번)
+    1. 댓글 페이지 (작성자 join, (정렬 컬럼, comment_pk) 내림차순 키셋)
+    2. 페이지 댓글들의 대댓글 중 댓글별 앞쪽 replies개 (ROW_NUMBER)
+    """
+    if sort not in COMMENT_SORT_COLUMNS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="지원하지 않는 정렬 방식입니다.")
+    limit = max(1, min(limit, COMMENT_PAGE_MAX_LIMIT))
+    replies = max(0, min(replies, THREAD_MAX_REPLIES))
+    sort_column = COMMENT_SORT_COLUMNS[sort]
+
+    query = (
+        select(
+            Comment.comment_pk, Comment.novel_pk, Comment.ep_pk, Comment.user_pk, Comment.content,
+            Comment.created_date, Comment.likes, Comment.cocomment_cnt, User.nickname, User.user_img,
+        )
+        .outerjoin(User, User.user_pk == Comment.user_pk)
+        .where(Comment.ep_pk == ep_pk)
+    )
+    if cursor:
+        last_value, last_pk = decode_cursor(sort, cursor)
+        query = query.where(
+            or_(
+                sort_column < last_value,
+                and_(sort_column == last_value, Comment.comment_pk < last_pk),
+            )
+        )
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    rows = db.execute(
+        query.order_by(sort_column.desc(), Comment.comment_pk.desc()).limit(limit + 1)
+    ).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    comment_pks = [row.comment_pk for row in rows]
+
+    replies_by_comment = {comment_pk: [] for comment_pk in comment_pks}
+    if comment_pks and replies:
+        rank = func.row_number().over(
+            partition_by=CoComment.comment_pk,
+            order_by=(CoComment.created_date, CoComment.cocomment_pk),
+        ).label("rank")
+        ranked = (
+            select(
+                CoComment.cocomment_pk, CoComment.comment_pk, CoComment.user_pk, CoComment.content,
+                CoComment.created_date, CoComment.likes, rank,
+            )
+            .where(CoComment.comment_pk.in_(comment_pks))
+            .subquery()
+        )
+        reply_rows = db.execute(
+            select(ranked, User.nickname, User.user_img)
+            .outerjoin(User, User.user_pk == ranked.c.user_pk)
+            .where(ranked.c.rank <= replies)
+            .order_by(ranked.c.comment_pk, ranked.c.rank)
+        ).all()
+        for row in reply_rows:
+            replies_by_comment[row.comment_pk].append(
+                novel_schema.ThreadReply(
+                    cocomment_pk=row.cocomment_pk,
+                    comment_pk=row.comment_pk,
+                    user_pk=row.user_pk,
+                    content=row.content,
+                    created_date=row.created_date,
+                    likes=row.likes or 0,
+                    user=_comment_author(row),
+                )
+            )
+
+    comments = [
+        novel_schema.ThreadComment(
+            comment_pk=row.comment_pk,
+            novel_pk=row.novel_pk,
+            ep_pk=row.ep_pk,
+            user_pk=row.user_pk,
+            content=row.content,
+            created_date=row.created_date,
+            likes=row.likes or 0,
+            cocomment_cnt=row.cocomment_cnt or 0,
+            user=_comment_author(row),
+            replies=replies_by_comment[row.comment_pk],
+        )
+        for row in rows
+    ]
+
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, getattr(last, sort_column.key), last.comment_pk)
+
+    return novel_schema.CommentThreadResponse(comments=comments, next_cursor=next_cursor)
+
+# 비정규화 카운터 재계산 (카운터, 실제 행 수 집계 테이블, 연결 컬럼)
+COUNTER_SOURCES = [
+    (Novel.num_episode, Episode.__table__, "novel_pk"),
+    (Episode.comment_cnt, Comment.__table__, "ep_pk"),
+    (Comment.cocomment_cnt, CoComment.__table__, "comment_pk"),
+    (Novel.likes, user_like_table, "novel_pk"),
+    (Comment.likes, user_comment_like_table, "comment_pk"),
+    (CoComment.likes, user_cocomment_like_table, "cocomment_pk"),
+]
+
+
+def reconcile_counters(db: Session) -> Dict[str, int]:
+    """
+    카운터를 실제 행 수로 다시 계산 (set-based UPDATE, 값이 다른 행만 갱신, updated_date 유지)
+    :return: {"novel.num_episode": 갱신된 행 수, ...}
+    """
+    fixed = {}
+    try:
+        for column, source, fk_name in COUNTER_SOURCES:
+            table = column.class_.__table__
+            pk_column = table.primary_key.columns.values()[0]
+            counter = table.c[column.key]
+            actual = (
+                select(func.count())
+                .select_from(source)
+                .where(source.c[fk_name] == pk_column)
+                .scalar_subquery()
+            )
+            values = {column.key: actual}
+            if "updated_date" in table.c:
+                values["updated_date"] = table.c.updated_date
+            result = db.execute(
+                update(table)
+                .where(or_(counter.is_(None), counter != actual))
+                .values(values)
+            )
+            fixed[f"{table.name}.{column.key}"] = result.rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return fixed
+
 # 특정 소설의 모든 댓글 조회
 def get_novel_comment(novel_pk: int, db: Session):
     return db.query(Comment).filter(Comment.novel_pk == novel_pk).options(joinedload(Comment.user)).all()
@@ -378,9 +1076,10 @@ def create_comment(comment_info: novel_schema.CommentBase, novel_pk: int, ep_pk:
         ep_pk=ep_pk,
         user_pk=user_pk,
         content=comment_info.content,
-        likes=comment_info.likes
+        likes=0,  # 좋아요 수는 toggle_like가 관리하는 카운터 (클라이언트 값 무시)
     )
     db.add(comment)
+    bump_counter(db, Episode.comment_cnt, ep_pk, 1)
     db.commit()
     db.refresh(comment)
     return comment
@@ -408,7 +1107,8 @@ def delete_comment(comment_pk: int, user_pk: int, db: Session):
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="댓글을 찾을 수 없습니다.")
     
-    db.delete(comment)
+    db.delete(comment)  # 대댓글은 cascade로 함께 삭제
+    bump_counter(db, Episode.comment_cnt, comment.ep_pk, -1)
     db.commit()
     return HTTPException(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -418,24 +1118,11 @@ def delete_comment(comment_pk: int, user_pk: int, db: Session):
 
 # 댓글 좋아요 및 좋아요 취소
 def like_comment(comment_pk: int,user_pk : int,db: Session):
-    comment = db.query(Comment).filter(Comment.comment_pk == comment_pk).first()
-    user = db.query(User).filter(User.user_pk == user_pk).first()
-    if not comment:
+    if not _exists(db, Comment.comment_pk, comment_pk):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="댓글을 찾을 수 없습니다.")
-    if not user : 
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail= "해당 유저를 찾을 수 없습니다.")
 
-    if user in comment.liked_users:
-        comment.liked_users.remove(user)
-        comment.likes -= 1
-    else:
-        comment.liked_users.append(user)
-        comment.likes += 1
-
-    db.commit()
-    db.refresh(comment)  # 변경된 comment 객체를 DB에서 다시 로드
-
-    return comment
+    liked, delta, _ = toggle_like(db, user_comment_like_table, Comment, comment_pk, user_pk)
+    return liked, delta, db.get(Comment, comment_pk)  # 갱신된 좋아요 수 포함
 
 
 # 대댓글 작성
@@ -452,33 +1139,24 @@ def create_cocoment(comment_pk: int, user_pk: int, cocoment_info: novel_schema.C
         user_pk=user_pk,
         comment_pk=comment_pk,
         content=cocoment_info.content,
-        likes=cocoment_info.likes
+        likes=0,  # 좋아요 수는 toggle_like가 관리하는 카운터 (클라이언트 값 무시)
     )
     db.add(cocoment)
+    bump_counter(db, Comment.cocomment_cnt, comment_pk, 1)
     db.commit()
     db.refresh(cocoment)
     return cocoment
 
 # 대댓글 좋아요
 def like_cocomment(cocomment_pk: int, user_pk: int, db: Session):
-    cocomment = db.query(CoComment).filter(CoComment.cocomment_pk == cocomment_pk).first()
-    if not cocomment:
+    if not _exists(db, CoComment.cocomment_pk, cocomment_pk):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대댓글을 찾을 수 없습니다.")
 
-    user = db.query(User).filter(User.user_pk == user_pk).first()
-    if not user:
+    if not _exists(db, User.user_pk, user_pk):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
 
-    if user in cocomment.liked_users:
-        cocomment.liked_users.remove(user)
-        cocomment.likes -= 1
-    else:
-        cocomment.liked_users.append(user)
-        cocomment.likes += 1
-
-    db.commit()
-    db.refresh(cocomment)
-    return cocomment
+    liked, _, _ = toggle_like(db, user_cocomment_like_table, CoComment, cocomment_pk, user_pk)
+    return liked, db.get(CoComment, cocomment_pk)
 
 # 대댓글 수정
 def update_cocomment(content: str, cocoment_pk: int, db: Session):
@@ -493,15 +1171,14 @@ def update_cocomment(content: str, cocoment_pk: int, db: Session):
 
 
 
-# 대댓글 삭제
-# 여기에 그 소설 댓글의 대댓글 갯수를 -1하는걸 만들어야 함
-# 흠 왜 안될까?
+# 대댓글 삭제 (댓글의 대댓글 수 -1)
 def delete_cocomment(cocomment_pk: int, db: Session):
     cocomment = db.query(CoComment).filter(CoComment.cocomment_pk == cocomment_pk).first()
     if not cocomment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대댓글을 찾을 수 없습니다.")
     
     db.delete(cocomment)
+    bump_counter(db, Comment.cocomment_cnt, cocomment.comment_pk, -1)
     db.commit()
     return HTTPException(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -526,6 +1203,7 @@ def save_character(novel_pk: int, character_info : novel_schema.CharacterBase, d
         profile=character_info.profile,
     )
     db.add(new_character)
+    touch_novel(novel_pk, db)
     db.commit()
     return new_character
 
@@ -541,6 +1219,7 @@ def update_character(character_pk : int, update_data: novel_schema.CharacterUpda
     for key, value in update_data_dict.items():
         setattr(character, key, value)  # 필드 업데이트
 
+    touch_novel(character.novel_pk, db)
     db.commit()
     db.refresh(character)
     return character
@@ -552,6 +1231,7 @@ def delete_character(character_pk : int, db: Session) :
         return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않는 캐릭터입니다.")
     else :
         db.delete(character)
+        touch_novel(character.novel_pk, db)
         db.commit()
         return HTTPException(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -678,13 +1358,12 @@ async def image_upload(file: UploadFile = File(...)) :
 
 def get_previous_chapters(db: Session, novel_pk: int) -> str:
     """DB에서 해당 소설의 모든 챕터 내용을 불러와 하나의 문자열로 합칩니다."""
-    episodes = (
-        db.query(Episode)
-        .filter(Episode.novel_pk == novel_pk)
+    contents = db.execute(
+        select(Episode.ep_content)
+        .where(Episode.novel_pk == novel_pk)
         .order_by(Episode.ep_pk.asc())  # 챕터 순서대로 정렬
-        .all()
-    )
-    return "\n\n---\n\n".join([ep.ep_content for ep in episodes]) if episodes else ""
+    ).scalars().all()
+    return "\n\n---\n\n".join(contents) if contents else ""
 
 IMGUR_CLIENT_ID = os.environ.get("IMGUR_CLIENT_ID")
 
@@ -737,7 +1416,7 @@ def get_episode_detail(novel_pk: int, ep_pk: int, db: Session):
             detail="Novel not found"
         )
     
-    episode = db.query(Episode).filter(
+    episode = db.query(Episode).options(undefer(Episode.ep_content)).filter(
         Episode.novel_pk == novel_pk,
         Episode.ep_pk == ep_pk
     ).first()
@@ -747,9 +1426,5 @@ def get_episode_detail(novel_pk: int, ep_pk: int, db: Session):
             detail="Episode not found"
         )
     
-    # Increment view count
-    episode.views += 1
-    db.commit()
-    db.refresh(episode)
-    
+    # 조회수는 utils.view_counter에서 Redis에 누적 후 주기적으로 반영
     return novel, episode
\ No newline at end of file
@@ -0,0 +1,204 @@
+import io
+import json
+import os
+import re
+import zipfile
+from pathlib import PurePosixPath
+from typing import BinaryIO, Iterator, Optional
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from models import Novel, Episode
+from . import novel_schema
+from .novel_crud import bump_counter
+
+# 에피소드 일괄 등록 설정
+IMPORT_BATCH_SIZE = int(os.getenv("EPISODE_IMPORT_BATCH_SIZE", "200"))  # executemany 한 번에 넣을 에피소드 수
+IMPORT_MAX_EPISODES = int(os.getenv("EPISODE_IMPORT_MAX_EPISODES", "5000"))
+IMPORT_MAX_EPISODE_BYTES = 1024 * 1024  # 에피소드 1개 최대 크기
+IMPORT_TEXT_SUFFIXES = {".txt", ".md"}
+IMPORT_JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+EP_TITLE_MAX_LENGTH = Episode.__table__.c.ep_title.type.length
+
+# (위치, 에피소드 데이터, 파싱 오류)
+ParsedRow = tuple[str, Optional[dict], Optional[str]]
+
+
+def _natural_key(name: str) -> list:
+    """'2화.txt'가 '10화.txt'보다 앞에 오도록 숫자 부분은 숫자로 비교"""
+    return [int(token) if token.isdigit() else token for token in re.split(r"(\d+)", name)]
+
+
+def iter_jsonl(stream: BinaryIO, source: str) -> Iterator[ParsedRow]:
+    """
+    JSONL을 한 줄씩 파싱 (파일 전체를 메모리에 올리지 않음)
+    각 줄: {"ep_title": "...", "ep_content": "..."}
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig")
+    try:
+        for line_no, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            location = f"{source}:{line_no}"
+            if len(line.encode("utf-8")) > IMPORT_MAX_EPISODE_BYTES:
+                yield location, None, "에피소드 크기가 너무 큽니다."
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield location, None, f"JSON 형식 오류: {e.msg}"
+                continue
+            if not isinstance(data, dict):
+                yield location, None, "각 줄은 JSON 객체여야 합니다."
+                continue
+            yield location, data, None
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{source}: UTF-8 텍스트가 아닙니다.")
+    finally:
+        text.detach()  # 원본 스트림은 호출한 쪽에서 닫음
+
+
+def iter_zip(stream: BinaryIO) -> Iterator[ParsedRow]:
+    """
+    zip 안의 .txt/.md(파일 이름 = 에피소드 제목)와 .jsonl 파일을 이름 순으로 파싱
+    """
+    try:
+        archive = zipfile.ZipFile(stream)
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="올바른 zip 파일이 아닙니다.")
+
+    with archive:
+        entries = [
+            info for info in archive.infolist()
+            if not info.is_dir()
+            and not info.filename.startswith("__MACOSX/")
+            and not PurePosixPath(info.filename).name.startswith(".")
+        ]
+        for info in sorted(entries, key=lambda info: _natural_key(info.filename)):
+            path = PurePosixPath(info.filename)
+            suffix = path.suffix.lower()
+
+            if suffix in IMPORT_JSONL_SUFFIXES:
+                with archive.open(info) as entry:
+                    yield from iter_jsonl(entry, info.filename)
+            elif suffix in IMPORT_TEXT_SUFFIXES:
+                if info.file_size > IMPORT_MAX_EPISODE_BYTES:
+                    yield info.filename, None, "에피소드 크기가 너무 큽니다."
+                    continue
+                try:
+                    content = archive.read(info).decode("utf-8-sig")
+                except UnicodeDecodeError:
+                    yield info.filename, None, "UTF-8 텍스트가 아닙니다."
+                    continue
+                yield info.filename, {"ep_title": path.stem, "ep_content": content}, None
+            else:
+                yield info.filename, None, "지원하지 않는 파일 형식입니다. (.txt, .md, .jsonl)"
+
+
+def parse_upload(filename: str, stream: BinaryIO) -> Iterator[ParsedRow]:
+    """업로드 형식(zip / jsonl)에 맞는 파서 선택"""
+    suffix = PurePosixPath(filename or "").suffix.lower()
+    if suffix == ".zip" or zipfile.is_zipfile(stream):
+        stream.seek(0)
+        return iter_zip(stream)
+    stream.seek(0)
+    if suffix in IMPORT_JSONL_SUFFIXES or suffix == ".json":
+        return iter_jsonl(stream, filename)
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="JSONL 또는 zip 파일만 업로드할 수 있습니다.")
+
+
+def _validate(data: dict) -> tuple[Optional[novel_schema.EpisodeCreateBase], Optional[str]]:
+    try:
+        episode = novel_schema.EpisodeCreateBase.model_validate(data)
+    except ValidationError as e:
+        return None, "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+    if len(episode.ep_title) > EP_TITLE_MAX_LENGTH:
+        return None, f"ep_title은 {EP_TITLE_MAX_LENGTH}자 이하여야 합니다."
+    return episode, None
+
+
+def import_episodes(
+    db: Session,
+    novel_pk: int,
+    user_pk: int,
+    filename: str,
+    stream: BinaryIO,
+    skip_invalid: bool = False,
+) -> novel_schema.EpisodeImportResponse:
+    """
+    업로드된 에피소드들을 한 트랜잭션으로 일괄 등록
+    - 파싱/검증하면서 IMPORT_BATCH_SIZE개씩 executemany INSERT, 배치마다 num_episode 갱신
+    - 잘못된 행이 있으면 skip_invalid가 아닌 한 전체 롤백 (행별 결과는 그대로 반환)
+    """
+    owner_pk = db.execute(select(Novel.user_pk).where(Novel.novel_pk == novel_pk)).scalar_one_or_none()
+    if owner_pk is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="소설을 찾을 수 없습니다.")
+    if owner_pk != user_pk:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="작가만 에피소드를 등록할 수 있습니다.")
+
+    results: list[novel_schema.EpisodeImportRow] = []
+    batch: list[dict] = []
+    batch_results: list[novel_schema.EpisodeImportRow] = []
+
+    def flush():
+        db.execute(insert(Episode), batch)
+        bump_counter(db, Novel.num_episode, novel_pk, len(batch), keep_updated_date=False)
+        for result in batch_results:
+            result.status = "inserted"
+        batch.clear()
+        batch_results.clear()
+
+    try:
+        for index, (location, data, error) in enumerate(parse_upload(filename, stream), start=1):
+            if index > IMPORT_MAX_EPISODES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"한 번에 최대 {IMPORT_MAX_EPISODES}개 에피소드까지 등록할 수 있습니다."
+                )
+
+            episode = None
+            if error is None:
+                episode, error = _validate(data)
+            title = (data or {}).get("ep_title")
+            result = novel_schema.EpisodeImportRow(
+                row=index,
+                source=location,
+                ep_title=title if isinstance(title, str) else None,
+                status="invalid" if error else "pending",
+                error=error,
+            )
+            results.append(result)
+            if error:
+                continue
+
+            batch.append({"novel_pk": novel_pk, "ep_title": episode.ep_title, "ep_content": episode.ep_content})
+            batch_results.append(result)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                flush()
+        if batch:
+            flush()
+
+        invalid = sum(result.status == "invalid" for result in results)
+        committed = not invalid or skip_invalid
+        if committed:
+            db.commit()
+        else:
+            db.rollback()
+            for result in results:
+                if result.status == "inserted":
+                    result.status = "rolled_back"
+    except Exception:
+        db.rollback()
+        raise
+
+    return novel_schema.EpisodeImportResponse(
+        novel_pk=novel_pk,
+        committed=committed,
+        total=len(results),
+        inserted=sum(result.status == "inserted" for result in results),
+        invalid=invalid,
+        results=results,
+    )
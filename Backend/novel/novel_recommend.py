@@ -0,0 +1,147 @@
+import asyncio
+import json
+import os
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from redis import Redis
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from database import run_with_session
+from models import Novel, Genre, novel_genre_table, user_like_table, user_recent_novel_table
+
+# 추천 결과 저장 설정
+RECOMMEND_KEY_PREFIX = "recommend"
+RECOMMEND_DEFAULT_KEY = f"{RECOMMEND_KEY_PREFIX}:default"  # 기록이 없는 사용자용
+RECOMMEND_TOP_K = int(os.getenv("RECOMMEND_TOP_K", "30"))
+RECOMMEND_REFRESH_SECONDS = int(os.getenv("RECOMMEND_REFRESH_SECONDS", "3600"))  # 0이면 주기 실행 안 함
+RECOMMEND_TTL = max(RECOMMEND_REFRESH_SECONDS * 3, 86400)
+
+# 점수 가중치
+VIEW_WEIGHT = 1.0  # 최근 본 소설
+LIKE_WEIGHT = 3.0  # 선호작
+POPULARITY_WEIGHT = 0.3  # 조회수 대비 선호작 비율
+USER_CHUNK_SIZE = 1024  # 한 번에 점수를 계산할 사용자 수
+
+
+def recommend_key(user_pk: int) -> str:
+    """사용자별 추천 목록 키"""
+    return f"{RECOMMEND_KEY_PREFIX}:{user_pk}"
+
+
+def _index(values) -> dict:
+    return {value: i for i, value in enumerate(values)}
+
+
+def build_recommendations(db: Session, top_k: int = RECOMMEND_TOP_K) -> tuple[dict[int, list[int]], list[int]]:
+    """
+    최근 본 소설, 선호작, 소설 장르로 사용자별 추천 목록 생성
+
+    1. 소설 x 장르 행렬 G
+    2. 사용자 x 장르 선호 벡터 A = (최근 본 소설 + 선호작 가중합) @ G
+    3. 점수 = 정규화된 A @ G.T (장르 일치도) + 조회수 대비 선호작 비율
+    4. 이미 보거나 선호작한 소설을 제외한 상위 K개
+
+    :return: ({user_pk: [novel_pk, ...]}, 기본 추천 목록)
+    """
+    novels = db.execute(select(Novel.novel_pk, Novel.likes, Novel.views).order_by(Novel.novel_pk)).all()
+    if not novels:
+        return {}, []
+
+    novel_pks = np.array([row.novel_pk for row in novels])
+    novel_idx = _index(novel_pks.tolist())
+    genre_idx = _index(db.execute(select(Genre.genre_pk).order_by(Genre.genre_pk)).scalars().all())
+
+    # 소설 x 장르 (행 단위 L2 정규화)
+    G = np.zeros((len(novel_pks), max(len(genre_idx), 1)), dtype=np.float32)
+    for novel_pk, genre_pk in db.execute(select(novel_genre_table.c.novel_pk, novel_genre_table.c.genre_pk)).all():
+        if novel_pk in novel_idx and genre_pk in genre_idx:
+            G[novel_idx[novel_pk], genre_idx[genre_pk]] = 1.0
+    G_norm = G / np.maximum(np.linalg.norm(G, axis=1, keepdims=True), 1e-6)
+
+    # 조회수 대비 선호작 비율 (스무딩 후 0~1 스케일)
+    likes = np.array([row.likes or 0 for row in novels], dtype=np.float32)
+    views = np.array([row.views or 0 for row in novels], dtype=np.float32)
+    popularity = (likes + 1.0) / (views + 10.0)
+    popularity /= max(float(popularity.max()), 1e-6)
+    default = novel_pks[np.argsort(-popularity, kind="stable")[:top_k]].tolist()
+
+    # 사용자 상호작용 (user_pk, novel_pk, weight)
+    interactions = [
+        (user_pk, novel_pk, VIEW_WEIGHT)
+        for user_pk, novel_pk in db.execute(select(user_recent_novel_table.c.user_pk, user_recent_novel_table.c.novel_pk)).all()
+    ] + [
+        (user_pk, novel_pk, LIKE_WEIGHT)
+        for user_pk, novel_pk in db.execute(select(user_like_table.c.user_pk, user_like_table.c.novel_pk)).all()
+    ]
+    interactions = [row for row in interactions if row[1] in novel_idx]
+    if not interactions:
+        return {}, default
+
+    user_pks = sorted({user_pk for user_pk, _, _ in interactions})
+    user_idx = _index(user_pks)
+    rows = np.array([user_idx[user_pk] for user_pk, _, _ in interactions])
+    cols = np.array([novel_idx[novel_pk] for _, novel_pk, _ in interactions])
+    weights = np.array([weight for _, _, weight in interactions], dtype=np.float32)
+
+    # 사용자 x 장르 선호 벡터
+    A = np.zeros((len(user_pks), G.shape[1]), dtype=np.float32)
+    np.add.at(A, rows, weights[:, None] * G[cols])
+    A /= np.maximum(np.linalg.norm(A, axis=1, keepdims=True), 1e-6)
+
+    k = min(top_k, len(novel_pks))
+    recommendations = {}
+    for start in range(0, len(user_pks), USER_CHUNK_SIZE):
+        end = min(start + USER_CHUNK_SIZE, len(user_pks))
+        scores = A[start:end] @ G_norm.T + POPULARITY_WEIGHT * popularity
+
+        # 이미 본 소설, 선호작 제외
+        in_chunk = (rows >= start) & (rows < end)
+        scores[rows[in_chunk] - start, cols[in_chunk]] = -np.inf
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        for offset in range(end - start):
+            picked = top[offset][np.isfinite(top_scores[offset])]
+            recommendations[user_pks[start + offset]] = novel_pks[picked].tolist()
+
+    return recommendations, default
+
+
+async def store_recommendations(redis_client: Redis, recommendations: dict[int, list[int]], default: list[int]):
+    """추천 목록을 사용자별 Redis 키에 저장"""
+    items = list(recommendations.items())
+    for start in range(0, len(items), USER_CHUNK_SIZE):
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for user_pk, novel_pks in items[start:start + USER_CHUNK_SIZE]:
+                pipe.setex(recommend_key(user_pk), RECOMMEND_TTL, json.dumps(novel_pks))
+            await pipe.execute()
+    await redis_client.setex(RECOMMEND_DEFAULT_KEY, RECOMMEND_TTL, json.dumps(default))
+
+
+async def refresh_recommendations(redis_client: Redis) -> int:
+    """
+    추천 목록 재계산 후 저장 (계산은 스레드 풀에서 실행)
+    :return: 추천 목록이 생성된 사용자 수
+    """
+    recommendations, default = await run_in_threadpool(run_with_session, build_recommendations)
+    await store_recommendations(redis_client, recommendations, default)
+    return len(recommendations)
+
+
+async def run_recommend_worker(redis_client: Redis, interval: int = RECOMMEND_REFRESH_SECONDS):
+    """lifespan에서 실행되는 주기적 추천 목록 갱신 작업"""
+    while True:
+        try:
+            count = await refresh_recommendations(redis_client)
+            print(f"✅ 추천 목록 갱신 완료 ({count}명)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ 추천 목록 갱신 실패: {e}")
+        await asyncio.sleep(interval)
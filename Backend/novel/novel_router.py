@@ -1,11 +1,19 @@
-from fastapi import Depends, HTTPException, status, APIRouter
+from fastapi import Depends, HTTPException, status, APIRouter, Query, Request
 from sqlalchemy.orm import Session
-from database import get_db
-from novel import novel_crud, novel_schema
+from database import get_db, get_read_db, get_async_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from novel import novel_crud, novel_schema, novel_recommend, novel_import, genre_registry
 from models import Novel, User, Discussion
-from typing import List, Optional
+from typing import List, Optional, Literal
 from utils.auth_utils import get_optional_user
-from user.user_crud import save_recent_novel
+from user.user_schema import AuthUser
+from utils.redis_utils import get_redis
+from utils import cache_utils, view_counter, http_cache, recent_history, deferred_cleanup, principal_cache, jwt_cache
+from redis import Redis
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+import orjson
+import asyncio
 from fastapi import File, UploadFile # 삭제 예정 
 import os
 from dotenv import load_dotenv
@@ -47,49 +55,116 @@ router.mount("/static", StaticFiles(directory="static"), name="static")
 # router.py
 @router.get("/main", response_model=novel_schema.MainPageResponse)
 async def main_page(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis)
 ):
     """
     메인 페이지: 최근 인기 소설, 최근 본 소설 정보 반환
+    공통 섹션(인기 순위 캐시)과 사용자별 섹션(Redis 최근 본 기록)을 동시에 조회
     """
+    best, recent_novels = await asyncio.gather(
+        novel_crud.get_main_best(redis_client),
+        novel_crud.load_recent_novels(redis_client, current_user.user_pk),
+    )
+    recent_top, month_top = best["recent_top"], best["month_top"]
+
     response_data = {
         "user": {
             "user_pk": current_user.user_pk,
             "name": current_user.name,
             "nickname": current_user.nickname,
-            "recent_novels": novel_crud.get_recent_novels(db, current_user.user_pk)
+            "recent_novels": recent_novels
         },
-        "recent_best": novel_crud.recent_hit(2, db),
-        "month_best": novel_crud.recent_hit(30, db)
+        "recent_best": recent_top[0] if recent_top else None,
+        "month_best": month_top[0] if month_top else None,
+        "recent_top": recent_top,
+        "month_top": month_top,
     }
     
     return response_data
 
 
+# 메인 화면 개인화 추천 피드 (주기적으로 미리 계산된 결과 조회)
+@router.get("/main/feed", response_model=List[novel_schema.NovelShowBase])
+async def main_feed(
+    limit: int = Query(20, ge=1, le=novel_recommend.RECOMMEND_TOP_K),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis)
+):
+    return await novel_crud.momoso_recommend(current_user.user_pk, db, redis_client, limit)
+
+
 # 소설(Novel) CRUD
 print("router has started")
 
 # 모든 소설을 가져오기 에러 잡는 중
 # 장르도 같이 제공해줘야 함.
-@router.get("/novels", response_model=List[novel_schema.NovelShowBase])
-def all_novel(db: Session = Depends(get_db)):
-    return novel_crud.get_all_novel(db) 
-
-# 디테일 페이지, 아직 미완
+@router.get("/novels", response_model=novel_schema.NovelListResponse)
+def all_novel(
+    sort: str = Query("updated", description="정렬 기준: updated(최근 수정순) | likes(선호작순)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=novel_crud.NOVEL_PAGE_MAX_LIMIT),
+    genre: Optional[str] = Query(None, description="장르 이름 필터"),
+    is_completed: Optional[bool] = Query(None, description="완결 여부 필터"),
+    db: Session = Depends(get_read_db),
+):
+    return novel_crud.get_all_novel(db, sort=sort, cursor=cursor, limit=limit, genre=genre, is_completed=is_completed)
+
+# 장르 목록 (DB 조회 없이 메모리의 장르 레지스트리에서 반환)
+@router.get("/genres", response_model=List[novel_schema.GenreGetBase])
+def get_genres():
+    return genre_registry.list_genres()
+
+# 소설 전문 검색 (제목, 소개, 시놉시스, 에피소드 본문)
+@router.get("/novels/search", response_model=novel_schema.NovelSearchResponse)
+def search_novels(
+    q: str = Query(..., min_length=2, max_length=100, description="검색어"),
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=novel_crud.SEARCH_MAX_SIZE),
+    db: Session = Depends(get_read_db),
+):
+    return novel_crud.search_novels(db, q.strip(), page, size)
+
+# 캐시 적중률 조회 (principal, jwt_claims는 이 워커 프로세스의 값)
+@router.get("/cache/stats")
+async def cache_stats(redis_client: Redis = Depends(get_redis)):
+    stats = await cache_utils.get_cache_stats(redis_client)
+    stats["principal"] = principal_cache.get_principal_stats()
+    stats["jwt_claims"] = jwt_cache.get_jwt_cache_stats()
+    return stats
+
+# 디테일 페이지 (Redis에 직렬화된 payload 캐싱, 소설 관련 쓰기 시 태그로 무효화)
+# ETag는 payload 해시라 변경이 없으면 304
+# 캐시를 채울 때는 primary에서 읽음 (복제 지연된 replica 값이 무효화 이후 TTL 동안 캐시에 남지 않도록)
 @router.get("/novel/{novel_pk}/detail")
-def novel_detail(novel_pk : int, db : Session = Depends(get_db)) : 
-    episode = novel_crud.novel_episode(novel_pk, db)
-    novel_info  = novel_crud.search_novel(novel_pk, db)
-    discussion = db.query(Discussion).filter(Discussion.novel_pk == novel_pk).all()
-    comment = novel_crud.get_novel_comment(novel_pk, db)
-    novel = novel_info[0]
-    author = db.query(User).filter(User.user_pk == novel.user_pk).first()
-    #, "author" : author
-    return {"episode" : episode, "novel_info" : novel_info, "discussion": discussion, "comment" : comment, "author" : author.nickname} 
+async def novel_detail(novel_pk : int, request: Request, db : Session = Depends(get_db), redis_client: Redis = Depends(get_redis)) : 
+    cache_key = cache_utils.novel_detail_key(novel_pk)
+    payload = await cache_utils.get_cached(redis_client, "novel_detail", cache_key)
+
+    if payload is None:
+        detail = await run_in_threadpool(novel_crud.get_novel_detail, novel_pk, db)
+        payload = orjson.dumps(jsonable_encoder(detail)).decode()
+        await cache_utils.set_cached(
+            redis_client, cache_key, payload,
+            ttl=cache_utils.NOVEL_DETAIL_CACHE_TTL,
+            tags=(cache_utils.novel_tag(novel_pk),)
+        )
+
+    headers = http_cache.validator_headers(http_cache.payload_etag(payload))
+    if http_cache.is_not_modified(request, headers["ETag"]):
+        return http_cache.not_modified(headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 @router.get("/novel/{novel_pk}") 
-def get_novel_info(novel_pk : int, db: Session = Depends(get_db)) :
+def get_novel_info(novel_pk : int, request: Request, response: Response, db: Session = Depends(get_read_db)) :
+    validator = novel_crud.get_novel_info_validator(novel_pk, db)
+    if validator:
+        headers = http_cache.validator_headers(*validator)
+        if http_cache.is_not_modified(request, *validator):
+            return http_cache.not_modified(headers)
+        response.headers.update(headers)
+
     # novel정보 
     novel = novel_crud.search_novel(novel_pk, db)
     # 등장인물 정보
@@ -97,7 +172,7 @@ def get_novel_info(novel_pk : int, db: Session = Depends(get_db)) :
     return {"novel" : novel, "character" : character} 
 
 @router.get("/novel/character/{novel_pk}")
-def get_character_info(novel_pk : int, db: Session = Depends(get_db)) : 
+def get_character_info(novel_pk : int, db: Session = Depends(get_read_db)) : 
     return novel_crud.get_character(novel_pk, db)
 
 #등장인물 CUD
@@ -117,63 +192,91 @@ def delete_character(character_pk : int, db: Session = Depends(get_db)) :
 
 # 수정한 소설 저장하기
 @router.put("/novel/{novel_pk}")
-def update_novel(novel_pk: int, update_data: novel_schema.NovelUpdateBase,db: Session = Depends(get_db)):
-    novel = novel_crud.update_novel(novel_pk, update_data, db)
+async def update_novel(novel_pk: int, update_data: novel_schema.NovelUpdateBase,db: Session = Depends(get_db), redis_client: Redis = Depends(get_redis)):
+    novel = await run_in_threadpool(novel_crud.update_novel, novel_pk, update_data, db)
+    await cache_utils.invalidate_novel(redis_client, novel_pk)
     return novel
 
 # 소설 생성
 @router.post("/novel", response_model=novel_schema.NovelShowBaseCreate)
-def create_novel(novel_info: novel_schema.NovelCreateBase, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def create_novel(novel_info: novel_schema.NovelCreateBase, user: AuthUser = Depends(get_current_user), db: Session = Depends(get_db)):
     novel = novel_crud.create_novel(novel_info, user.user_pk, db)
     return novel
 
 @router.delete("/novel/{novel_pk}")
-def delete_novel(
+async def delete_novel(
     novel_pk: int, 
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
 ):
-    return novel_crud.delete_novel(novel_pk=novel_pk, user=current_user, db=db)
+    cleanup = await run_in_threadpool(novel_crud.delete_novel, novel_pk, current_user.user_pk, db)
+    # 파일/캐시 정리는 백그라운드 작업에서 처리
+    await deferred_cleanup.enqueue_cleanup(redis_client, **cleanup)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 #소설 좋아요 
 @router.put("/novel/{novel_pk}/like")
 async def like_novel(
     novel_pk: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis)
 ):
-    return await novel_crud.like_novel(novel_pk, current_user.user_pk, db)
+    return await novel_crud.like_novel(novel_pk, current_user.user_pk, db, redis_client)
 
 # 에피소드 CRUD
 
 # 특정 소설의 에피소드 조회
-@router.get("/novel/{novel_pk}/episodes")
-def novel_episode(novel_pk: int, db: Session = Depends(get_db)):
+@router.get("/novel/{novel_pk}/episodes", response_model=List[novel_schema.EpisodeTocItem])
+def novel_episode(novel_pk: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
+    validator = novel_crud.get_episode_list_validator(novel_pk, db)
+    if validator:
+        headers = http_cache.validator_headers(*validator)
+        if http_cache.is_not_modified(request, *validator):
+            return http_cache.not_modified(headers)
+        response.headers.update(headers)
     return novel_crud.novel_episode(novel_pk, db)
 
 @router.get("/novel/{novel_pk}/title", response_model=novel_schema.NovelTitleResponse)
 def get_novel_title(
     novel_pk: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     novel = novel_crud.get_novel(novel_pk, db)
     return novel_schema.NovelTitleResponse(
         novel_title=novel.title
     )
 
+async def record_episode_view(novel_pk: int, ep_pk: int, current_user: Optional[AuthUser], redis_client: Redis):
+    # 조회수는 Redis에 누적 (DB 반영은 view_counter 백그라운드 작업)
+    await view_counter.record_view(redis_client, novel_pk, ep_pk)
+
+    # 로그인한 사용자인 경우에만 최근 본 소설 저장 (Redis 기록, DB 반영은 recent_history 백그라운드 작업)
+    if current_user:
+        await recent_history.record_recent_view(redis_client, current_user.user_pk, novel_pk)
+
 @router.get("/novel/{novel_pk}/episodes/{ep_pk}", response_model=novel_schema.EpisodeDetailResponse)
-def get_episode_detail(
+async def get_episode_detail(
     novel_pk: int,
     ep_pk: int,
-    current_user: Optional[User] = Depends(get_optional_user),  # 변경
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    current_user: Optional[AuthUser] = Depends(get_optional_user),  # 변경
+    db: Session = Depends(get_read_db),
+    redis_client: Redis = Depends(get_redis)
 ):
-    novel, episode = novel_crud.get_episode_detail(novel_pk, ep_pk, db)
-    
-    # 로그인한 사용자인 경우에만 최근 본 소설 저장
-    if current_user:
-        save_recent_novel(db, current_user.user_pk, novel_pk)
+    # 변경이 없으면 본문을 읽지 않고 304 (조회수, 최근 본 소설은 그대로 기록)
+    validator = await run_in_threadpool(novel_crud.get_episode_validator, novel_pk, ep_pk, db)
+    if validator and http_cache.is_not_modified(request, *validator):
+        await record_episode_view(novel_pk, ep_pk, current_user, redis_client)
+        return http_cache.not_modified(http_cache.validator_headers(*validator))
+
+    novel, episode = await run_in_threadpool(novel_crud.get_episode_detail, novel_pk, ep_pk, db)
+    await record_episode_view(novel_pk, ep_pk, current_user, redis_client)
+    if validator:
+        response.headers.update(http_cache.validator_headers(*validator))
     
     return novel_schema.EpisodeDetailResponse(
         novel_title=novel.title,
@@ -186,83 +289,161 @@ def get_episode_detail(
 
 # 특정 소설에 에피소드 추가
 @router.post("/novel/{novel_pk}/episode", response_model=novel_schema.EpisodeCreateBase)
-def save_episode(novel_pk: int, episode_data: novel_schema.EpisodeCreateBase, db: Session = Depends(get_db)):
-    return novel_crud.save_episode(novel_pk, episode_data, db)
+async def save_episode(novel_pk: int, episode_data: novel_schema.EpisodeCreateBase, db: Session = Depends(get_db), redis_client: Redis = Depends(get_redis)):
+    episode = await run_in_threadpool(novel_crud.save_episode, novel_pk, episode_data, db)
+    await cache_utils.invalidate_novel(redis_client, novel_pk)
+    return episode
+
+# 에피소드 일괄 등록 (JSONL 또는 zip 업로드, 한 트랜잭션)
+@router.post("/novel/{novel_pk}/episodes/import", response_model=novel_schema.EpisodeImportResponse)
+async def import_episodes(
+    novel_pk: int,
+    file: UploadFile = File(..., description="JSONL(줄마다 ep_title, ep_content) 또는 .txt/.md/.jsonl 파일을 담은 zip"),
+    skip_invalid: bool = Query(False, description="잘못된 행은 건너뛰고 나머지만 등록"),
+    current_user: AuthUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
+):
+    result = await run_in_threadpool(
+        novel_import.import_episodes, db, novel_pk, current_user.user_pk, file.filename, file.file, skip_invalid
+    )
+    if result.inserted:
+        await cache_utils.invalidate_novel(redis_client, novel_pk)
+    return result
 
 # 에피소드 변경
 @router.post("/novel/{novel_pk}/{ep_pk}",response_model=novel_schema.EpisodeCreateBase)
-def change_episode(novel_pk: int, update_data: novel_schema.EpisodeUpdateBase, ep_pk : int, db: Session = Depends(get_db)) : 
-    return novel_crud.change_episode(novel_pk, update_data, ep_pk, db)
+async def change_episode(novel_pk: int, update_data: novel_schema.EpisodeUpdateBase, ep_pk : int, db: Session = Depends(get_db), redis_client: Redis = Depends(get_redis)) : 
+    episode = await run_in_threadpool(novel_crud.change_episode, novel_pk, update_data, ep_pk, db)
+    await cache_utils.invalidate_novel(redis_client, novel_pk)
+    return episode
 
 #에피소드 삭제
 @router.delete("/novel/{novel_pk}/{ep_pk}")
-def delete_episode(
+async def delete_episode(
     novel_pk: int, 
     ep_pk: int, 
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
 ) : 
-    return novel_crud.delete_episode(novel_pk, ep_pk, current_user, db)
+    result = await run_in_threadpool(novel_crud.delete_episode, novel_pk, ep_pk, current_user, db)
+    await cache_utils.invalidate_novel(redis_client, novel_pk)
+    return result
 
 # 특정 에피소드의 댓글 조회
 @router.get("/novel/{novel_pk}/episode/{ep_pk}/comments")
-def ep_comment(novel_pk: int, ep_pk: int, db: Session = Depends(get_db)):
+def ep_comment(novel_pk: int, ep_pk: int, db: Session = Depends(get_read_db)):
     all_ep_comment = novel_crud.get_all_ep_comment(novel_pk, ep_pk, db)
     return all_ep_comment
 
+# 댓글 스레드 (키셋 페이지네이션, 댓글별 앞쪽 대댓글 포함)
+@router.get("/novel/{novel_pk}/episode/{ep_pk}/comments/thread", response_model=novel_schema.CommentThreadResponse)
+def comment_thread(
+    novel_pk: int,
+    ep_pk: int,
+    sort: str = Query("newest", description="정렬 기준: newest(최신순) | likes(좋아요순)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=novel_crud.COMMENT_PAGE_MAX_LIMIT),
+    replies: int = Query(3, ge=0, le=novel_crud.THREAD_MAX_REPLIES, description="댓글별로 함께 보낼 대댓글 수"),
+    db: Session = Depends(get_read_db),
+):
+    return novel_crud.get_comment_thread(db, ep_pk, sort=sort, cursor=cursor, limit=limit, replies=replies)
+
 # 댓글 작성
 @router.post("/novel/{novel_pk}/episode/{ep_pk}/comment", response_model=novel_schema.CommentBase)
-def save_comment(
+async def save_comment(
     comment_info: novel_schema.CommentBase, 
     novel_pk: int, 
     ep_pk: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis)
 ):
     # current_user의 user_pk를 사용
-    comment = novel_crud.create_comment(comment_info, novel_pk, ep_pk, current_user.user_pk, db)
+    comment = await run_in_threadpool(novel_crud.create_comment, comment_info, novel_pk, ep_pk, current_user.user_pk, db)
     if not comment:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="댓글 작성에 실패했습니다.")
+    await cache_utils.invalidate_novel(redis_client, novel_pk)
     return comment
 
 # 댓글 수정
 @router.put("/novel/{novel_pk}/episode/{ep_pk}/comment/{comment_pk}")
-def change_comment(
+async def change_comment(
+    novel_pk: int,
     content: str, 
     comment_pk: int, 
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis)
 ):
-    comment = novel_crud.update_comment(content, comment_pk, current_user.user_pk, db)
+    comment = await run_in_threadpool(novel_crud.update_comment, content, comment_pk, current_user.user_pk, db)
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="댓글을 찾을 수 없습니다.")
+    await cache_utils.invalidate_novel(redis_client, novel_pk)
     return comment
 
 # 댓글 삭제
 @router.delete("/novel/{novel_pk}/episode/{ep_pk}/comment/{comment_pk}")
-def delete_comment(
+async def delete_comment(
+    novel_pk: int,
     comment_pk: int, 
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis)
 ):
-    return novel_crud.delete_comment(comment_pk, current_user.user_pk, db)
+    result = await run_in_threadpool(novel_crud.delete_comment, comment_pk, current_user.user_pk, db)
+    await cache_utils.invalidate_novel(redis_client, novel_pk)
+    return result
 
 
 # 댓글 좋아요
 @router.put("/novel/comment/{comment_pk}/like")
-def like_comment(
+async def like_comment(
     comment_pk: int, 
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis)
 ): 
-    return novel_crud.like_comment(comment_pk, current_user.user_pk, db)
+    liked, delta, comment = await db.run_sync(lambda session: novel_crud.like_comment(comment_pk, current_user.user_pk, session))
+    await novel_crud.update_liked_cache(redis_client, "comment", current_user.user_pk, comment_pk, liked)
+    if delta:  # 캐시된 상세 payload의 댓글 좋아요 수 무효화
+        await cache_utils.invalidate_novel(redis_client, comment.novel_pk)
+    return comment
+
+# 내가 좋아요한 소설/댓글/대댓글 일괄 조회 (예: /likes/me?target=comment&ids=1&ids=2)
+@router.get("/likes/me", response_model=novel_schema.LikedByMeResponse)
+async def liked_by_me(
+    target: Literal["novel", "comment", "cocomment"] = Query(..., description="novel | comment | cocomment"),
+    ids: List[int] = Query(..., description=f"조회할 id 목록 (최대 {novel_crud.LIKED_LOOKUP_MAX_IDS}개)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis)
+):
+    if len(ids) > novel_crud.LIKED_LOOKUP_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"id는 최대 {novel_crud.LIKED_LOOKUP_MAX_IDS}개까지 조회할 수 있습니다."
+        )
+    liked = await novel_crud.liked_by_me(db, redis_client, target, current_user.user_pk, ids)
+    return novel_schema.LikedByMeResponse(target=target, liked=liked)
 
 # 대댓글 CRUD
 
 # 대댓글 작성
 @router.post("/novel/{novel_pk}/episode/{ep_pk}/comment/{comment_pk}/cocomment", response_model=novel_schema.CoComentBase)
-def create_cocoment(comment_pk: int, user_pk: int, cocoment_info: novel_schema.CoComentBase, db: Session = Depends(get_db)):
-    return novel_crud.create_cocoment(comment_pk, user_pk, cocoment_info, db)
+async def create_cocoment(
+    novel_pk: int,
+    comment_pk: int,
+    user_pk: int,
+    cocoment_info: novel_schema.CoComentBase,
+    db: Session = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
+):
+    cocoment = await run_in_threadpool(novel_crud.create_cocoment, comment_pk, user_pk, cocoment_info, db)
+    # 캐시된 상세 payload의 댓글 cocomment_cnt가 바뀜
+    await cache_utils.invalidate_novel(redis_client, novel_pk)
+    return cocoment
 
 # 대댓글 수정
 @router.put("/novel/{novel_pk}/episode/{ep_pk}/comment/{comment_pk}/cocomment")
@@ -274,18 +455,31 @@ def update_cocomment(content: str, cocoment_pk: int, db: Session = Depends(get_d
 
 # 대댓글 삭제
 @router.delete("/novel/{novel_pk}/episode/{ep_pk}/comment/{comment_pk}/cocomment")
-def delete_cocomment(cocomment_pk: int, db: Session = Depends(get_db)):
-    novel_crud.delete_cocomment(cocomment_pk, db)
+async def delete_cocomment(
+    novel_pk: int,
+    cocomment_pk: int,
+    db: Session = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
+):
+    await run_in_threadpool(novel_crud.delete_cocomment, cocomment_pk, db)
+    await cache_utils.invalidate_novel(redis_client, novel_pk)
     return HTTPException(status_code=status.HTTP_204_NO_CONTENT)
 
 
 # 대댓글 좋아요
 @router.put("/novel/{novel_pk}/episode/{ep_pk}/comment/{comment_pk}/cocomment/like")
-def like_cocomment(cocomment_pk: int, user_pk: int, db: Session = Depends(get_db)):
-    return novel_crud.like_cocomment(cocomment_pk, user_pk, db)
+async def like_cocomment(
+    cocomment_pk: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: AuthUser = Depends(get_current_user),
+    redis_client: Redis = Depends(get_redis)
+):
+    liked, cocomment = await db.run_sync(lambda session: novel_crud.like_cocomment(cocomment_pk, current_user.user_pk, session))
+    await novel_crud.update_liked_cache(redis_client, "cocomment", current_user.user_pk, cocomment_pk, liked)
+    return cocomment
 
 @router.get("/novel/{novel_pk}/episode/{ep_pk}/comment/{comment_pk}/cocomment")
-def get_cocoment(comment_pk : int, db: Session = Depends(get_db) ) : 
+def get_cocoment(comment_pk : int, db: Session = Depends(get_read_db) ) : 
     return novel_crud.get_cocoment(comment_pk,db)
 
 
@@ -355,7 +549,7 @@ def recommend_characters(request: CharacterRequest):
     return {"characters": updated_characters}
 
 @router.post("/ai/episode")
-def create_episode(request: CreateChapterRequest, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def create_episode(request: CreateChapterRequest, current_user: AuthUser = Depends(get_current_user), db: Session = Depends(get_db)):
     novel = None
     if request.novel_pk:
         novel = db.query(Novel).filter(Novel.novel_pk == request.novel_pk).first()
@@ -16,11 +16,14 @@ class UserRecentNovel(BaseModel):
 class NovelInfo(BaseModel):
     title: str
     pk: int
+    likes: Optional[int] = None  # 집계 기간 동안 늘어난 선호작 수
 
 class MainPageResponse(BaseModel):
     user: UserRecentNovel
     recent_best: Optional[NovelInfo] = None
     month_best: Optional[NovelInfo] = None
+    recent_top: List[NovelInfo] = []  # 최근 2일 인기 순위
+    month_top: List[NovelInfo] = []  # 최근 30일 인기 순위
 
     class Config:
         from_attributes = True
@@ -59,6 +62,39 @@ class NovelShowBase(BaseModel) :
     class Config:
         from_attributes = True
 
+# 소설 목록 (키셋 페이지네이션)
+class NovelListResponse(BaseModel) :
+    novels : List[NovelShowBase]
+    next_cursor : Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달, 마지막 페이지면 None
+
+# 소설 검색 결과
+class SearchSnippet(BaseModel) :
+    text : str
+    highlights : List[List[int]] = []  # text 안에서 검색어가 나타나는 [시작, 끝) 위치
+
+class SearchEpisodeHit(BaseModel) :
+    ep_pk : int
+    ep_title : str
+    snippet : SearchSnippet
+
+class NovelSearchHit(BaseModel) :
+    novel : NovelShowBase
+    score : float
+    snippet : Optional[SearchSnippet] = None  # 제목/소개/시놉시스 일치 부분
+    episode : Optional[SearchEpisodeHit] = None  # 가장 관련도 높은 에피소드
+
+class NovelSearchResponse(BaseModel) :
+    query : str
+    total : int
+    page : int
+    size : int
+    results : List[NovelSearchHit]
+
+# 내가 좋아요한 항목 일괄 조회
+class LikedByMeResponse(BaseModel) :
+    target : str  # novel | comment | cocomment
+    liked : Dict[int, bool]  # 요청한 id별 좋아요 여부
+
 class NovelShowBaseCreate(BaseModel) : 
     novel_pk : int
     title: str
@@ -161,6 +197,36 @@ class EpisodeBase(EpisodeCreateBase):
         from_attributes = True
 
 
+# 에피소드 일괄 등록 결과
+class EpisodeImportRow(BaseModel):
+    row: int  # 업로드 내 순번 (1부터)
+    source: str  # 파일명:줄번호 또는 zip 내 파일명
+    ep_title: Optional[str] = None
+    status: str  # inserted | invalid | rolled_back
+    error: Optional[str] = None
+
+class EpisodeImportResponse(BaseModel):
+    novel_pk: int
+    committed: bool  # False면 잘못된 행 때문에 전체 롤백됨
+    total: int
+    inserted: int
+    invalid: int
+    results: List[EpisodeImportRow]
+
+
+# 에피소드 목차 (본문 제외)
+class EpisodeTocItem(BaseModel):
+    ep_pk: int
+    novel_pk: int
+    ep_title: str
+    created_date: datetime
+    views: int = 0
+    comment_cnt: int = 0
+
+    class Config:
+        from_attributes = True
+
+
 class EpisodeUpdateBase(BaseModel) : 
     ep_title: Optional[str] = None
     ep_content: Optional[str] = None
@@ -178,6 +244,37 @@ class CommentBase(BaseModel):
             raise ValueError("댓글 내용을 입력하세요.")
         return v
 
+# 댓글 스레드 (댓글 + 앞쪽 대댓글)
+class CommentAuthor(BaseModel):
+    user_pk: int
+    nickname: Optional[str] = None
+    user_img: Optional[str] = None
+
+class ThreadReply(BaseModel):
+    cocomment_pk: int
+    comment_pk: int
+    user_pk: int
+    content: str
+    created_date: datetime
+    likes: int = 0
+    user: CommentAuthor
+
+class ThreadComment(BaseModel):
+    comment_pk: int
+    novel_pk: int
+    ep_pk: int
+    user_pk: int
+    content: str
+    created_date: datetime
+    likes: int = 0
+    cocomment_cnt: int = 0  # 전체 대댓글 수
+    user: CommentAuthor
+    replies: List[ThreadReply] = []  # 앞쪽 대댓글 (오래된 순)
+
+class CommentThreadResponse(BaseModel):
+    comments: List[ThreadComment]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달, 마지막 페이지면 None
+
 # 대댓글 생성 요청
 class CoComentBase(BaseModel):
     content: str
@@ -0,0 +1,139 @@
+"""
+async 라우트의 DB 접근 방식별 이벤트 루프 지연 / 처리량 벤치마크
+
+- blocking  : async 함수 안에서 동기 Session으로 바로 조회 (기존 get_current_user, main_feed 등)
+- threadpool: run_in_threadpool로 동기 Session 조회
+- async     : AsyncEngine(aiomysql) + AsyncSession.run_sync로 같은 CRUD 함수 실행 (get_async_db)
+
+동시 작업자들이 읽기 위주의 혼합 쿼리(소설 목록, 소설 카드, 좋아요 목록, 최근 본 소설)를 반복하는 동안
+10ms 주기로 깨어나는 코루틴의 지연(loop lag)을 함께 측정한다.
+
+사용법 (Backend 디렉토리에서, 데이터가 있는 DB 필요 - scripts.bench_search로 합성 코퍼스 생성 가능):
+    python -m scripts.bench_async_db --db-url "mysql+pymysql://user:pw@localhost:3306/momoso_bench?charset=utf8mb4" \
+        --concurrency 50 --duration 10
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from models import Novel, User
+from novel import novel_crud
+
+PROBE_INTERVAL = 0.01  # loop lag 측정 주기 (초)
+
+
+def make_operations(novel_pks: list[int], user_pks: list[int]):
+    """(이름, fn(db)) 목록 - 메인/목록 화면에서 나가는 읽기 쿼리 혼합"""
+    return [
+        ("novel_list", lambda db, rng: novel_crud.get_all_novel(db, limit=20)),
+        ("novel_cards", lambda db, rng: novel_crud.get_novel_cards(db, rng.sample(novel_pks, min(20, len(novel_pks))))),
+        ("liked_ids", lambda db, rng: novel_crud.get_liked_ids(db, "novel", rng.choice(user_pks))),
+        ("recent_novels", lambda db, rng: novel_crud.get_recent_novels(db, rng.choice(user_pks))),
+    ]
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def probe_loop_lag(stop: asyncio.Event, lags: list[float]):
+    """PROBE_INTERVAL마다 깨어나며 예정 시각보다 늦은 만큼을 기록"""
+    while not stop.is_set():
+        expected = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - expected) * 1000)
+
+
+async def run_mode(mode: str, args, Session, AsyncSession, operations) -> dict:
+    stop = asyncio.Event()
+    lags: list[float] = []
+    latencies: list[float] = []
+
+    async def execute(fn, rng):
+        if mode == "blocking":
+            with Session() as db:
+                return fn(db, rng)
+        if mode == "threadpool":
+            def call():
+                with Session() as db:
+                    return fn(db, rng)
+            return await run_in_threadpool(call)
+        async with AsyncSession() as db:
+            return await db.run_sync(fn, rng)
+
+    async def worker(seed: int):
+        rng = random.Random(seed)
+        while not stop.is_set():
+            _, fn = rng.choice(operations)
+            started = time.perf_counter()
+            await execute(fn, rng)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    probe = asyncio.create_task(probe_loop_lag(stop, lags))
+    workers = [asyncio.create_task(worker(i)) for i in range(args.concurrency)]
+    started = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(probe, *workers)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "ops": len(latencies) / elapsed,
+        "op_p50": statistics.median(latencies) if latencies else 0.0,
+        "op_p99": percentile(latencies, 0.99),
+        "lag_p50": statistics.median(lags) if lags else 0.0,
+        "lag_p99": percentile(lags, 0.99),
+        "lag_max": max(lags, default=0.0),
+    }
+
+
+async def main_async(args):
+    engine = create_engine(args.db_url, pool_size=args.pool_size, max_overflow=0)
+    async_engine = create_async_engine(args.db_url.replace("+pymysql", "+aiomysql"), pool_size=args.pool_size, max_overflow=0)
+    Session = sessionmaker(bind=engine)
+    AsyncSession = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    with Session() as db:
+        novel_pks = db.execute(select(Novel.novel_pk).limit(5000)).scalars().all()
+        user_pks = db.execute(select(User.user_pk).limit(5000)).scalars().all()
+    if not novel_pks or not user_pks:
+        raise SystemExit("소설/사용자 데이터가 없습니다. scripts.bench_search로 먼저 데이터를 생성하세요.")
+    operations = make_operations(novel_pks, user_pks)
+
+    print(f"concurrency={args.concurrency} duration={args.duration}s pool={args.pool_size}")
+    print(f"{'mode':<11} {'ops/s':>8} {'op p50':>9} {'op p99':>9} {'lag p50':>9} {'lag p99':>9} {'lag max':>9}")
+    for mode in args.modes:
+        result = await run_mode(mode, args, Session, AsyncSession, operations)
+        print(
+            f"{mode:<11} {result['ops']:8.0f} {result['op_p50']:7.1f}ms {result['op_p99']:7.1f}ms "
+            f"{result['lag_p50']:7.1f}ms {result['lag_p99']:7.1f}ms {result['lag_max']:7.1f}ms"
+        )
+
+    await async_engine.dispose()
+    engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db-url", required=True, help="벤치마크 MySQL URL (pymysql, async는 aiomysql로 자동 변환)")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0, help="모드별 측정 시간 (초)")
+    parser.add_argument("--pool-size", type=int, default=15, help="DB_POOL_SIZE + DB_MAX_OVERFLOW 기본값과 같게")
+    parser.add_argument("--modes", nargs="+", default=["blocking", "threadpool", "async"],
+                        choices=["blocking", "threadpool", "async"])
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+인증(validate_token_and_get_user) 요청당 오버헤드 벤치마크
+
+DB의 사용자들로 access token을 만든 뒤 principal 캐시 상태별로 토큰 검증 + 사용자 조회 시간과 SQL 수를 측정한다.
+- db    : 매 요청 전 메모리/Redis 캐시를 비움 (캐시 도입 전과 같은 경로)
+- redis : 매 요청 전 메모리 캐시만 비움 (다른 워커가 채운 Redis 캐시 사용)
+- local : 캐시를 그대로 둠 (일반적인 경우)
+
+.env의 DB/Redis 설정을 그대로 사용하므로 사용자 데이터가 있는 DB 필요
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.bench_auth --users 200 --requests 5000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import event, select
+
+from database import AsyncSessionLocal, async_engine
+from models import User
+from utils import principal_cache
+from utils.auth_utils import create_access_token, validate_token_and_get_user
+from utils.redis_utils import create_redis_client
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def run_mode(mode: str, args, redis_client, tokens: list[tuple[str, str]], sql_count: list[int]) -> dict:
+    rng = random.Random(0)
+    latencies = []
+    sql_count[0] = 0
+    for _ in range(args.requests):
+        email, token = rng.choice(tokens)
+        if mode in ("db", "redis"):
+            principal_cache.clear_local()
+        if mode == "db":
+            await redis_client.delete(principal_cache.principal_key(email))
+
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            user = await validate_token_and_get_user(token, None, None, db, redis_client)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+        assert user.email == email
+
+    return {
+        "mean": statistics.fmean(latencies),
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 0.99),
+        "sql": sql_count[0] / args.requests,
+    }
+
+
+async def main_async(args):
+    redis_client = await create_redis_client()
+    sql_count = [0]
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def count_sql(*_):
+        sql_count[0] += 1
+
+    async with AsyncSessionLocal() as db:
+        emails = (await db.execute(select(User.email).limit(args.users))).scalars().all()
+    if not emails:
+        raise SystemExit("사용자 데이터가 없습니다.")
+    tokens = [(email, create_access_token({"sub": email})) for email in emails]
+
+    # 모든 사용자를 캐시에 한 번 채움
+    for email, token in tokens:
+        async with AsyncSessionLocal() as db:
+            await validate_token_and_get_user(token, None, None, db, redis_client)
+
+    print(f"users={len(tokens)} requests={args.requests}")
+    print(f"{'mode':<6} {'mean':>10} {'p50':>10} {'p99':>10} {'SQL/req':>8}")
+    for mode in args.modes:
+        result = await run_mode(mode, args, redis_client, tokens, sql_count)
+        print(f"{mode:<6} {result['mean']:8.0f}us {result['p50']:8.0f}us {result['p99']:8.0f}us {result['sql']:8.2f}")
+    print(f"principal stats: {principal_cache.get_principal_stats()}")
+
+    for email, _ in tokens:
+        await principal_cache.invalidate_principal(redis_client, email)
+    await redis_client.aclose()
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200, help="토큰을 만들 사용자 수")
+    parser.add_argument("--requests", type=int, default=5000, help="모드별 요청 수")
+    parser.add_argument("--modes", nargs="+", default=["db", "redis", "local"], choices=["db", "redis", "local"])
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
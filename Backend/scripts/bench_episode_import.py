@@ -0,0 +1,93 @@
+"""
+에피소드 일괄 등록 벤치마크 (JSONL / zip, 기존 1화씩 save_episode 호출과 비교)
+
+주의: 전달한 DB에 테이블을 생성하고 테스트용 사용자/소설을 넣으므로 반드시 벤치마크용 MySQL 스키마를 사용할 것
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.bench_episode_import --db-url "mysql+pymysql://user:pw@localhost:3306/momoso_bench?charset=utf8mb4" \
+        --episodes 1000
+"""
+import argparse
+import io
+import json
+import random
+import time
+import uuid
+import zipfile
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, User, Novel
+from novel import novel_crud, novel_import, novel_schema
+from scripts.bench_search import sentence
+
+
+def make_episodes(count: int) -> list[dict]:
+    rng = random.Random(42)
+    return [
+        {"ep_title": f"{i}화", "ep_content": "\n".join(sentence(rng, 40) for _ in range(25))}  # 약 5천자
+        for i in range(1, count + 1)
+    ]
+
+
+def make_jsonl(episodes: list[dict]) -> io.BytesIO:
+    return io.BytesIO("".join(json.dumps(ep, ensure_ascii=False) + "\n" for ep in episodes).encode("utf-8"))
+
+
+def make_zip(episodes: list[dict]) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for ep in episodes:
+            archive.writestr(f"{ep['ep_title']}.txt", ep["ep_content"])
+    buffer.seek(0)
+    return buffer
+
+
+def create_novel(session) -> tuple[int, int]:
+    tag = uuid.uuid4().hex[:8]
+    user_pk = session.execute(
+        insert(User).values(email=f"import-{tag}@momoso.dev", name="bench", nickname=f"i{tag}", password="x")
+    ).inserted_primary_key[0]
+    novel_pk = session.execute(
+        insert(Novel).values(user_pk=user_pk, title=f"import-{tag}", worldview="-", synopsis="-")
+    ).inserted_primary_key[0]
+    session.commit()
+    return user_pk, novel_pk
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db-url", required=True, help="벤치마크 MySQL URL")
+    parser.add_argument("--episodes", type=int, default=1000)
+    parser.add_argument("--baseline", type=int, default=100, help="1화씩 등록으로 측정할 에피소드 수 (0이면 생략)")
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url)
+    Session = sessionmaker(bind=engine)
+    Base.metadata.create_all(engine)
+    episodes = make_episodes(args.episodes)
+
+    with Session() as session:
+        for label, upload, filename in (("jsonl", make_jsonl(episodes), "episodes.jsonl"), ("zip", make_zip(episodes), "episodes.zip")):
+            user_pk, novel_pk = create_novel(session)
+            started = time.perf_counter()
+            result = novel_import.import_episodes(session, novel_pk, user_pk, filename, upload)
+            elapsed = time.perf_counter() - started
+            num_episode = session.execute(select(Novel.num_episode).where(Novel.novel_pk == novel_pk)).scalar_one()
+            print(f"{label:<6} {result.inserted} episodes in {elapsed:.2f}s (num_episode={num_episode})")
+
+        if args.baseline:
+            _, novel_pk = create_novel(session)
+            started = time.perf_counter()
+            for ep in episodes[:args.baseline]:
+                novel_crud.save_episode(novel_pk, novel_schema.EpisodeCreateBase(**ep), session)
+            elapsed = time.perf_counter() - started
+            print(
+                f"single {args.baseline} episodes in {elapsed:.2f}s "
+                f"(estimated {elapsed / args.baseline * args.episodes:.1f}s for {args.episodes})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+에피소드 목록 응답 크기/지연 비교 (본문 포함 전체 행 vs 목차)
+
+before: 기존 novel_episode와 같이 Episode 전체 행(ep_content 포함)을 조회해 직렬화
+after : 현재 novel_crud.novel_episode (목차 컬럼만 조회)
+
+주의: --seed 사용 시 전달한 DB에 테이블을 생성하고 합성 데이터를 넣으므로 벤치마크용 MySQL 스키마를 사용할 것
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.bench_episode_payload --db-url "mysql+pymysql://user:pw@localhost:3306/momoso_bench?charset=utf8mb4" \
+        --seed --novels 200 --episodes 20000 --samples 100
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.orm import sessionmaker, undefer
+
+from models import Base, Novel, Episode
+from novel import novel_crud
+from scripts.bench_search import seed
+
+
+def full_rows(db, novel_pk: int) -> list[Episode]:
+    """기존 방식: ep_content까지 모두 로드"""
+    return db.query(Episode).options(undefer(Episode.ep_content)).filter(Episode.novel_pk == novel_pk).all()
+
+
+def measure(session, fn, novel_pks: list[int]) -> tuple[list[float], list[int]]:
+    timings, sizes = [], []
+    for novel_pk in novel_pks:
+        started = time.perf_counter()
+        payload = json.dumps(jsonable_encoder(fn(session, novel_pk)), ensure_ascii=False).encode()
+        timings.append((time.perf_counter() - started) * 1000)
+        sizes.append(len(payload))
+        session.expunge_all()  # identity map에 남은 본문 재사용 방지
+    return sorted(timings), sizes
+
+
+def report(label: str, timings: list[float], sizes: list[int]):
+    print(
+        f"{label:<7} payload avg {statistics.mean(sizes) / 1024:8.1f} KB | max {max(sizes) / 1024:8.1f} KB | "
+        f"p50 {statistics.median(timings):6.1f} ms | p95 {timings[int(len(timings) * 0.95) - 1]:6.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db-url", required=True, help="벤치마크 MySQL URL")
+    parser.add_argument("--seed", action="store_true", help="합성 코퍼스 생성 (빈 DB에서만)")
+    parser.add_argument("--novels", type=int, default=200)
+    parser.add_argument("--episodes", type=int, default=20000)
+    parser.add_argument("--samples", type=int, default=100, help="측정할 소설 수")
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url)
+    Session = sessionmaker(bind=engine)
+    Base.metadata.create_all(engine)
+
+    with Session() as session:
+        if args.seed:
+            if session.execute(select(func.count()).select_from(Episode)).scalar_one():
+                raise SystemExit("벤치마크 DB가 비어있지 않습니다. --seed 없이 기존 데이터를 사용하세요.")
+            seed(session, args.novels, args.episodes)
+
+        novel_pks = session.execute(select(Novel.novel_pk)).scalars().all()
+        if not novel_pks:
+            raise SystemExit("소설 데이터가 없습니다. --seed로 합성 데이터를 생성하세요.")
+        sample = random.Random(7).choices(novel_pks, k=args.samples)
+
+        # 커넥션/캐시 예열
+        measure(session, full_rows, sample[:5])
+        measure(session, lambda db, pk: novel_crud.novel_episode(pk, db), sample[:5])
+
+        report("before", *measure(session, full_rows, sample))
+        report("after", *measure(session, lambda db, pk: novel_crud.novel_episode(pk, db), sample))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+access token 검증 마이크로 벤치마크 (jwt.decode vs jwt_cache)
+
+활성 사용자 수만큼 access token을 만든 뒤, 요청마다 한 토큰을 골라(일부 사용자에게 요청이 몰리도록 zipf 분포) 검증한다.
+- uncached: 매번 jwt.decode (서명 검증)
+- cached  : auth_utils.decode_access_token (claims 캐시, 토큰 exp까지 유지)
+캐시는 이벤트 루프에서만 쓰이므로(스레드 안전하지 않음) 단일 스레드로 측정한다.
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.bench_jwt_cache --tokens 2000 --requests 200000 --zipf 1.1
+"""
+import argparse
+import random
+import statistics
+import time
+
+from jose import jwt
+
+from utils import jwt_cache
+from utils.auth_utils import ALGORITHM, SECRET_KEY, create_access_token, decode_access_token
+
+BATCH = 100  # 지연 측정 단위 (요청 BATCH개를 묶어 1건당 평균)
+
+
+def uncached(token: str) -> dict:
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def run(decode, picks: list[str]) -> list[float]:
+    """BATCH 단위 요청당 지연 (us)"""
+    latencies = []
+    for i in range(0, len(picks), BATCH):
+        batch = picks[i:i + BATCH]
+        started = time.perf_counter()
+        for token in batch:
+            decode(token)
+        latencies.append((time.perf_counter() - started) * 1_000_000 / len(batch))
+    return latencies
+
+
+def bench(decode, picks: list[str]) -> dict:
+    started = time.perf_counter()
+    latencies = run(decode, picks)
+    elapsed = time.perf_counter() - started
+    return {
+        "rps": len(picks) / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 0.99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=2000, help="활성 사용자(토큰) 수")
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--zipf", type=float, default=1.1, help="요청 편중 정도 (0이면 균등)")
+    args = parser.parse_args()
+
+    tokens = [create_access_token({"sub": f"bench-{i}@momoso.dev"}) for i in range(args.tokens)]
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(args.tokens)]
+    picks = rng.choices(tokens, weights=weights, k=args.requests)
+
+    print(f"tokens={args.tokens} requests={args.requests} zipf={args.zipf} cache_size={jwt_cache.JWT_CLAIM_CACHE_SIZE}")
+    print(f"{'mode':<9} {'req/s':>10} {'p50':>9} {'p99':>9} {'hit rate':>9}")
+    result = bench(uncached, picks)
+    print(f"{'uncached':<9} {result['rps']:10.0f} {result['p50']:7.1f}us {result['p99']:7.1f}us {'-':>9}")
+
+    jwt_cache.clear()
+    result = bench(decode_access_token, picks)
+    hit_rate = jwt_cache.get_jwt_cache_stats()["hit_rate"]
+    print(f"{'cached':<9} {result['rps']:10.0f} {result['p50']:7.1f}us {result['p99']:7.1f}us {hit_rate:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+동시 로그인 비밀번호 검증 처리량 벤치마크 (DB 없이 bcrypt 검증만)
+
+동시 사용자들이 로그인(bcrypt verify)을 반복하는 동안 10ms 주기 코루틴의 지연(loop lag)도 함께 측정한다.
+- inline    : 요청 처리 코루틴 안에서 바로 검증 (기존 /auth/login)
+- threadpool: run_in_threadpool로 검증 (기존 사용자 삭제 라우트)
+- process   : PasswordHasher (lifespan 프로세스 풀, 대기열 제한 초과 시 503)
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.bench_login --users 50 --duration 10
+    python -m scripts.bench_login --modes process --workers 8 --max-pending 16 --queue-timeout 0.5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from utils.password_hasher import BCRYPT_ROUNDS, PasswordHasher, hash_password_sync, verify_password_sync
+
+PROBE_INTERVAL = 0.01  # loop lag 측정 주기 (초)
+PASSWORD = "momoso-bench-password"
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def probe_loop_lag(stop: asyncio.Event, lags: list[float]):
+    while not stop.is_set():
+        expected = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - expected) * 1000)
+
+
+async def run_mode(mode: str, args, hashed: str, hasher: PasswordHasher) -> dict:
+    stop = asyncio.Event()
+    lags: list[float] = []
+    latencies: list[float] = []
+    rejected = 0
+
+    async def verify():
+        if mode == "inline":
+            return verify_password_sync(PASSWORD, hashed)
+        if mode == "threadpool":
+            return await run_in_threadpool(verify_password_sync, PASSWORD, hashed)
+        return await hasher.verify(PASSWORD, hashed)
+
+    async def user():
+        nonlocal rejected
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                verified, _ = await verify()
+                assert verified
+                latencies.append((time.perf_counter() - started) * 1000)
+            except HTTPException:
+                rejected += 1
+                await asyncio.sleep(0.1)
+
+    probe = asyncio.create_task(probe_loop_lag(stop, lags))
+    users = [asyncio.create_task(user()) for _ in range(args.users)]
+    started = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(probe, *users)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "logins": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "p99": percentile(latencies, 0.99),
+        "lag_p99": percentile(lags, 0.99),
+        "lag_max": max(lags, default=0.0),
+        "rejected": rejected,
+    }
+
+
+async def main_async(args):
+    hashed = hash_password_sync(PASSWORD)
+    hasher = PasswordHasher(workers=args.workers, max_pending=args.max_pending, queue_timeout=args.queue_timeout)
+    await hasher.warm_up()
+
+    print(f"rounds={BCRYPT_ROUNDS} users={args.users} duration={args.duration}s "
+          f"workers={args.workers} max_pending={args.max_pending}")
+    print(f"{'mode':<11} {'login/s':>8} {'p50':>9} {'p99':>9} {'lag p99':>9} {'lag max':>9} {'503':>6}")
+    for mode in args.modes:
+        result = await run_mode(mode, args, hashed, hasher)
+        print(
+            f"{mode:<11} {result['logins']:8.1f} {result['p50']:7.0f}ms {result['p99']:7.0f}ms "
+            f"{result['lag_p99']:7.1f}ms {result['lag_max']:7.1f}ms {result['rejected']:6d}"
+        )
+    hasher.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=50, help="동시 로그인 사용자 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="모드별 측정 시간 (초)")
+    parser.add_argument("--workers", type=int, default=4, help="프로세스 풀 크기")
+    parser.add_argument("--max-pending", type=int, default=64)
+    parser.add_argument("--queue-timeout", type=float, default=2.0)
+    parser.add_argument("--modes", nargs="+", default=["inline", "threadpool", "process"],
+                        choices=["inline", "threadpool", "process"])
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+소설 전문 검색 벤치마크 (합성 코퍼스)
+
+주의: 전달한 DB에 테이블을 생성하고 합성 데이터를 넣으므로 반드시 비어있는 벤치마크용 MySQL 스키마를 사용할 것
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.bench_search --db-url "mysql+pymysql://user:pw@localhost:3306/momoso_bench?charset=utf8mb4" \
+        --episodes 100000 --novels 2000 --queries 200
+"""
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine, insert, select, func
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, User, Novel, Episode
+from novel import novel_crud
+
+WORDS = [
+    "마법사", "기사", "왕국", "용", "검", "학원", "회귀", "복수", "황제", "공작",
+    "계약", "전쟁", "던전", "헌터", "각성", "마탑", "성녀", "악역", "영애", "제국",
+    "모험", "동료", "비밀", "운명", "전설", "마왕", "용사", "시간", "기억", "약속",
+    "바다", "하늘", "숲", "도시", "밤", "새벽", "눈물", "웃음", "편지", "그림자",
+]
+QUERIES = ["마법사", "회귀 복수", "황제의 계약", "던전 헌터", "악역 영애", "마왕 용사", "새벽 편지", "제국 전쟁"]
+
+
+def sentence(rng: random.Random, length: int) -> str:
+    return " ".join(rng.choice(WORDS) + rng.choice(["은", "는", "이", "가", "을", "를", "의", "와", ""]) for _ in range(length)) + "."
+
+
+def seed(session, novels: int, episodes: int, batch: int = 1000):
+    rng = random.Random(42)
+    user_pk = session.execute(
+        insert(User).values(email="bench@momoso.dev", name="bench", nickname="bench", password="x")
+    ).inserted_primary_key[0]
+
+    for start in range(0, novels, batch):
+        session.execute(insert(Novel), [
+            {
+                "user_pk": user_pk,
+                "title": " ".join(rng.sample(WORDS, 2)),
+                "worldview": sentence(rng, 30),
+                "synopsis": sentence(rng, 60),
+                "summary": sentence(rng, 15),
+            }
+            for _ in range(start, min(start + batch, novels))
+        ])
+    novel_pks = session.execute(select(Novel.novel_pk)).scalars().all()
+
+    for start in range(0, episodes, batch):
+        session.execute(insert(Episode), [
+            {
+                "novel_pk": rng.choice(novel_pks),
+                "ep_title": f"{i}화 " + rng.choice(WORDS),
+                "ep_content": "\n".join(sentence(rng, 40) for _ in range(25)),  # 약 5천자
+            }
+            for i in range(start, min(start + batch, episodes))
+        ])
+        session.commit()
+        print(f"  seeded {min(start + batch, episodes)}/{episodes} episodes")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db-url", required=True, help="벤치마크 전용 MySQL URL")
+    parser.add_argument("--novels", type=int, default=2000)
+    parser.add_argument("--episodes", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--skip-seed", action="store_true", help="이미 생성된 코퍼스 재사용")
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url)
+    Session = sessionmaker(bind=engine)
+    Base.metadata.create_all(engine)
+
+    with Session() as session:
+        if not args.skip_seed:
+            if session.execute(select(func.count()).select_from(Episode)).scalar_one():
+                raise SystemExit("벤치마크 DB가 비어있지 않습니다. --skip-seed로 기존 코퍼스를 재사용하세요.")
+            started = time.perf_counter()
+            seed(session, args.novels, args.episodes)
+            print(f"seed: {time.perf_counter() - started:.1f}s")
+
+        episode_count = session.execute(select(func.count()).select_from(Episode)).scalar_one()
+        print(f"corpus: {episode_count} episodes")
+
+        rng = random.Random(7)
+        timings = []
+        for _ in range(args.queries):
+            q = rng.choice(QUERIES)
+            page = rng.randint(1, 3)
+            started = time.perf_counter()
+            result = novel_crud.search_novels(session, q, page=page, size=20)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+
+    print(f"queries: {len(timings)}, last total hits: {result.total}")
+    print(f"p50 {statistics.median(timings):.1f} ms | p95 {timings[int(len(timings) * 0.95) - 1]:.1f} ms | max {timings[-1]:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+응답 직렬화/압축 벤치마크 (표준 json vs orjson, 무압축 vs gzip vs brotli)
+
+대상 응답: get_all_novel(/novels), novel_detail(/novel/{pk}/detail), get_episode_detail(/novel/{pk}/episodes/{ep_pk})
+
+사용법 (Backend 디렉토리에서, 데이터가 있는 DB 필요 - scripts.bench_search로 합성 코퍼스 생성 가능):
+    python -m scripts.bench_serialization --db-url "mysql+pymysql://user:pw@localhost:3306/momoso_bench?charset=utf8mb4" \
+        --repeat 200
+"""
+import argparse
+import gzip
+import statistics
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.orm import sessionmaker
+
+from models import Episode
+from novel import novel_crud, novel_schema
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = 9  # starlette GZipMiddleware 기본값
+BROTLI_QUALITY = 4  # brotli-asgi 기본값
+
+
+def load_payloads(session) -> dict:
+    """측정할 응답 데이터 (라우터가 반환하는 형태 그대로)"""
+    # 에피소드가 가장 많은 소설
+    novel_pk, ep_pk = session.execute(
+        select(Episode.novel_pk, func.max(Episode.ep_pk))
+        .group_by(Episode.novel_pk)
+        .order_by(func.count().desc())
+        .limit(1)
+    ).one()
+
+    novel, episode = novel_crud.get_episode_detail(novel_pk, ep_pk, session)
+    episode_detail = novel_schema.EpisodeDetailResponse(
+        novel_title=novel.title,
+        ep_pk=episode.ep_pk,
+        ep_title=episode.ep_title,
+        ep_content=episode.ep_content,
+        created_date=episode.created_date,
+        updated_date=episode.updated_date,
+    )
+    return {
+        "get_all_novel": jsonable_encoder(novel_crud.get_all_novel(session, limit=novel_crud.NOVEL_PAGE_MAX_LIMIT)),
+        "novel_detail": jsonable_encoder(novel_crud.get_novel_detail(novel_pk, session)),
+        "get_episode_detail": jsonable_encoder(episode_detail),
+    }
+
+
+def time_render(response_class, content, repeat: int) -> tuple[float, bytes]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = response_class(content).body
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), body
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db-url", required=True, help="벤치마크 MySQL URL")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    Session = sessionmaker(bind=create_engine(args.db_url))
+    with Session() as session:
+        payloads = load_payloads(session)
+
+    if brotli is None:
+        print("brotli 미설치: br 크기는 생략합니다.")
+
+    for name, content in payloads.items():
+        print(f"\n[{name}]")
+        for label, response_class in (("json", JSONResponse), ("orjson", ORJSONResponse)):
+            render_ms, body = time_render(response_class, content, args.repeat)
+            gzip_size = len(gzip.compress(body, compresslevel=GZIP_LEVEL))
+            br_size = f"{len(brotli.compress(body, quality=BROTLI_QUALITY)) / 1024:8.1f} KB" if brotli else "       -"
+            print(
+                f"  {label:<6} render p50 {render_ms:7.3f} ms | raw {len(body) / 1024:8.1f} KB | "
+                f"gzip {gzip_size / 1024:8.1f} KB | br {br_size}"
+            )
+
+
+if __name__ == "__main__":
+    main()
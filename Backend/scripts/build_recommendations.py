@@ -0,0 +1,24 @@
+"""
+개인화 추천 목록을 한 번 계산해 Redis에 저장하는 스크립트 (cron 등 외부 스케줄러용)
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.build_recommendations
+"""
+import asyncio
+
+from novel import novel_recommend
+from utils.redis_utils import create_redis_client
+
+
+async def build():
+    redis_client = await create_redis_client()
+    try:
+        count = await novel_recommend.refresh_recommendations(redis_client)
+    finally:
+        await redis_client.aclose()
+
+    print(f"✅ 추천 목록 생성 완료 ({count}명)")
+
+
+if __name__ == "__main__":
+    asyncio.run(build())
@@ -0,0 +1,88 @@
+"""
+인증 라우트의 요청당 SQL 수 확인
+
+auth 라우터만 올린 앱에 TestClient로 /api/v1/auth/me를 호출하고 DB 엔진(sync, async)에서 실행된 쿼리를 센다.
+- principal 캐시를 비운 첫 요청: 쿼리 1개 이하 (AuthUser 컬럼 조회, 관계 로드 없음)
+- 캐시가 채워진 뒤 요청: 쿼리 0개
+
+.env의 DB/Redis 설정을 그대로 사용하므로 사용자 데이터가 있는 DB 필요
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.check_auth_queries
+    python -m scripts.check_auth_queries --email user@example.com --requests 20
+"""
+import argparse
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+
+from auth import auth_router
+from database import SessionLocal, engine, async_engine
+from models import User
+from utils import principal_cache
+from utils.auth_utils import create_access_token
+from utils.redis_utils import create_redis_client
+
+ME_URL = "/api/v1/auth/me"
+MAX_COLD_QUERIES = 1
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.redis = await create_redis_client()
+    yield
+    await app.state.redis.aclose()
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--email", help="토큰을 만들 사용자 (생략 시 첫 번째 사용자)")
+    parser.add_argument("--requests", type=int, default=10, help="캐시가 채워진 뒤 보낼 요청 수")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        email = args.email or db.execute(select(User.email).order_by(User.user_pk).limit(1)).scalar()
+    if not email:
+        raise SystemExit("사용자 데이터가 없습니다.")
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *_):
+        statements.append(statement)
+
+    for target in (engine, async_engine.sync_engine):
+        event.listen(target, "before_cursor_execute", record)
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(auth_router.router)
+    cookies = {"access_token": create_access_token({"sub": email})}
+
+    failed = False
+    with TestClient(app, cookies=cookies) as client:
+        client.portal.call(principal_cache.invalidate_principal, app.state.redis, email)
+
+        statements.clear()
+        response = client.get(ME_URL)
+        response.raise_for_status()
+        cold = list(statements)
+        print(f"cold: {len(cold)} queries (<= {MAX_COLD_QUERIES})")
+        for statement in cold:
+            print(f"  {' '.join(statement.split())}")
+        failed |= len(cold) > MAX_COLD_QUERIES
+
+        statements.clear()
+        for _ in range(args.requests):
+            client.get(ME_URL).raise_for_status()
+        print(f"warm: {len(statements)} queries / {args.requests} requests (== 0)")
+        failed |= bool(statements)
+
+    if failed:
+        raise SystemExit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+읽기 복제본 라우팅 동작 확인 (SQLite 파일 또는 로컬 MySQL 여러 개)
+
+각 DB에 자신의 이름을 담은 node 테이블을 만들고, ReplicaRouter로 연 읽기 세션이 어느 DB로 갔는지 확인한다.
+- 라운드 로빈 분배, 연결 실패한 복제본 제외 후 재시도, 복제본이 모두 죽었을 때 primary
+- read-your-writes 쿠키가 있으면 primary
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.check_read_replicas                      # 임시 디렉토리의 SQLite 파일 사용
+    python -m scripts.check_read_replicas --primary "mysql+pymysql://user:pw@localhost:3306/momoso_a" \
+        --replica "mysql+pymysql://user:pw@localhost:3307/momoso_b"
+    (MySQL을 쓰면 각 DB에 node 테이블을 만들고 지움)
+"""
+import argparse
+import os
+import tempfile
+import time
+from collections import Counter
+
+from sqlalchemy import create_engine, text
+from starlette.requests import Request
+from starlette.responses import Response
+
+from database import ReplicaRouter, READ_STICKY_COOKIE, is_read_sticky, mark_read_sticky
+
+
+def make_node(url: str, name: str):
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS node"))
+        conn.execute(text("CREATE TABLE node (name VARCHAR(50))"))
+        conn.execute(text("INSERT INTO node (name) VALUES (:name)"), {"name": name})
+    return engine
+
+
+def read_node(router: ReplicaRouter, sticky: bool = False) -> str:
+    with router.read_session(sticky=sticky) as db:
+        return db.execute(text("SELECT name FROM node")).scalar_one()
+
+
+def check(label: str, ok: bool) -> bool:
+    print(f"  {'OK  ' if ok else 'FAIL'} {label}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--primary", help="primary URL (생략 시 SQLite 파일)")
+    parser.add_argument("--replica", action="append", default=[], help="복제본 URL (여러 번 지정 가능)")
+    parser.add_argument("--retry-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="momoso-replica-")
+    primary_url = args.primary or f"sqlite:///{os.path.join(tmpdir, 'primary.db')}"
+    replica_urls = args.replica or [f"sqlite:///{os.path.join(tmpdir, f'replica{i}.db')}" for i in (1, 2)]
+    # 연결할 수 없는 복제본 (존재하지 않는 디렉토리)
+    dead_url = f"sqlite:///{os.path.join(tmpdir, 'missing', 'replica.db')}"
+
+    primary = make_node(primary_url, "primary")
+    replicas = [make_node(url, f"replica{i}") for i, url in enumerate(replica_urls, start=1)]
+    router = ReplicaRouter(primary, [replicas[0], create_engine(dead_url), *replicas[1:]], args.retry_seconds)
+
+    results = []
+    print("[라운드 로빈 + 장애 복제본 제외]")
+    reads = Counter(read_node(router) for _ in range(len(replicas) * 10))
+    print(f"  reads: {dict(reads)}")
+    results.append(check("primary로 가지 않음", "primary" not in reads))
+    results.append(check("살아 있는 복제본에 고르게 분배", len(reads) == len(replicas) and max(reads.values()) - min(reads.values()) <= 1))
+    results.append(check("죽은 복제본은 제외 목록에 있음", 1 not in router.healthy_replicas()))
+
+    print("[재시도 시간 경과 후 다시 시도]")
+    time.sleep(args.retry_seconds)
+    results.append(check("제외 시간이 지나면 다시 후보", 1 in router.healthy_replicas()))
+    for _ in range(len(router.replicas)):  # 순회 시작점이 한 바퀴 돌면 죽은 복제본도 한 번은 시도됨
+        read_node(router)
+    results.append(check("다시 실패하면 또 제외", 1 not in router.healthy_replicas()))
+
+    print("[복제본 전체 장애]")
+    for index in range(len(router.replicas)):
+        router.mark_down(index)
+    results.append(check("primary로 대체", read_node(router) == "primary"))
+
+    print("[read-your-writes]")
+    response = Response()
+    mark_read_sticky(response)
+    cookie = response.headers["set-cookie"]
+    results.append(check(f"쓰기 응답에 쿠키 설정 ({cookie.split(';')[0]})", cookie.startswith(f"{READ_STICKY_COOKIE}=")))
+    request = Request({"type": "http", "headers": [(b"cookie", f"{READ_STICKY_COOKIE}=1".encode())]})
+    results.append(check("쿠키가 있으면 sticky", is_read_sticky(request)))
+    time.sleep(args.retry_seconds)
+    results.append(check("sticky 세션은 primary", read_node(router, sticky=is_read_sticky(request)) == "primary"))
+
+    if args.primary or args.replica:
+        for engine in (primary, *replicas):
+            with engine.begin() as conn:
+                conn.execute(text("DROP TABLE IF EXISTS node"))
+
+    if not all(results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
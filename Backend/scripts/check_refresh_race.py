@@ -0,0 +1,104 @@
+"""
+refresh token 회전 경쟁 상태 확인
+
+같은 refresh token으로 동시에 여러 재발급 요청을 보내 결과가 결정적인지 확인한다.
+- 정확히 한 요청만 jti를 회전시키고, 나머지는 grace 시간 안이므로 승자의 jti로 함께 성공
+- grace 시간이 지난 뒤 교체된 토큰을 다시 쓰면 재사용으로 보고 family 전체 폐기 (최신 토큰도 401)
+
+.env의 Redis 설정을 사용하며 테스트용 키(refresh_token:race-*)만 만들고 지움
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.check_refresh_race --concurrency 20 --rounds 50
+"""
+import argparse
+import asyncio
+import uuid
+from datetime import timedelta
+from http.cookies import SimpleCookie
+
+from fastapi import HTTPException, Response
+from jose import jwt
+
+from utils import auth_utils
+from utils.redis_utils import create_redis_client
+
+
+def refresh_cookie(response: Response) -> str:
+    for header in response.headers.getlist("set-cookie"):
+        cookie = SimpleCookie(header)
+        if "refresh_token" in cookie:
+            return cookie["refresh_token"].value
+    raise AssertionError("refresh_token 쿠키 없음")
+
+
+def claims(token: str) -> dict:
+    return jwt.get_unverified_claims(token)
+
+
+async def refresh(redis_client, token: str):
+    """:return: (새 refresh token 또는 None, 실패 시 status code)"""
+    response = Response()
+    try:
+        await auth_utils.rotate_refresh_token(redis_client, token, response)
+        return refresh_cookie(response), None
+    except HTTPException as e:
+        return None, e.status_code
+
+
+async def race_round(redis_client, args) -> list[str]:
+    errors = []
+    email = f"race-{uuid.uuid4().hex[:8]}@momoso.dev"
+    key = auth_utils.refresh_key(email)
+    token = await auth_utils.start_refresh_family(redis_client, email, timedelta(minutes=5))
+    original_jti = claims(token)["jti"]
+
+    results = await asyncio.gather(*(refresh(redis_client, token) for _ in range(args.concurrency)))
+    state = await redis_client.hgetall(key)
+    new_tokens = [new for new, _ in results if new]
+    jtis = {claims(new)["jti"] for new in new_tokens}
+
+    if len(new_tokens) != args.concurrency:
+        errors.append(f"동시 재발급 중 실패 {args.concurrency - len(new_tokens)}건: {[code for _, code in results if code]}")
+    if jtis != {state.get("jti")}:
+        errors.append(f"발급된 jti {jtis} != 저장된 jti {state.get('jti')}")
+    if state.get("prev") != original_jti:
+        errors.append("회전이 한 번이 아님 (prev가 원래 jti가 아님)")
+
+    # grace 이후 교체된 토큰 재사용 -> family 폐기
+    await asyncio.sleep(args.grace_ms / 1000 + 0.05)
+    _, reused = await refresh(redis_client, token)
+    _, latest = await refresh(redis_client, new_tokens[0]) if new_tokens else (None, None)
+    if reused != 401 or latest != 401 or await redis_client.exists(key):
+        errors.append(f"재사용 감지 실패 (reused={reused}, latest={latest})")
+
+    await redis_client.delete(key)
+    return errors
+
+
+async def main_async(args):
+    auth_utils.REFRESH_REUSE_GRACE_MS = args.grace_ms
+    redis_client = await create_redis_client()
+    failures = 0
+    for i in range(args.rounds):
+        errors = await race_round(redis_client, args)
+        if errors:
+            failures += 1
+            print(f"round {i}: " + "; ".join(errors))
+    await redis_client.aclose()
+
+    print(f"{args.rounds - failures}/{args.rounds} rounds OK (concurrency={args.concurrency})")
+    if failures:
+        raise SystemExit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=20, help="같은 토큰으로 동시에 보낼 재발급 수")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--grace-ms", type=int, default=200, help="테스트용 grace 시간 (짧게)")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
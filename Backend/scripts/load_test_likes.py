@@ -0,0 +1,116 @@
+"""
+좋아요 토글 동시성 부하 테스트
+
+여러 스레드가 각자 세션으로 같은 소설/댓글/대댓글에 좋아요 토글을 동시에 보낸 뒤
+likes 카운터가 연결 테이블 행 수와 일치하는지 확인한다.
+
+주의: 전달한 DB에 테이블을 생성하고 테스트용 사용자/소설/댓글을 넣으므로 반드시 테스트용 MySQL 스키마를 사용할 것
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.load_test_likes --db-url "mysql+pymysql://user:pw@localhost:3306/momoso_bench?charset=utf8mb4" \
+        --users 200 --workers 32 --clicks 5000
+"""
+import argparse
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, insert, select, func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from models import (
+    Base, User, Novel, Episode, Comment, CoComment,
+    user_like_table, user_comment_like_table, user_cocomment_like_table,
+)
+from novel import novel_crud
+
+
+def seed(session, users: int) -> tuple[list[int], dict]:
+    tag = uuid.uuid4().hex[:8]
+    session.execute(insert(User), [
+        {"email": f"like-{tag}-{i}@momoso.dev", "name": "load", "nickname": f"l{tag}{i}", "password": "x"}
+        for i in range(users)
+    ])
+    user_pks = session.execute(select(User.user_pk).where(User.email.like(f"like-{tag}-%"))).scalars().all()
+
+    novel_pk = session.execute(
+        insert(Novel).values(user_pk=user_pks[0], title=f"like-{tag}", worldview="-", synopsis="-")
+    ).inserted_primary_key[0]
+    ep_pk = session.execute(
+        insert(Episode).values(novel_pk=novel_pk, ep_title="1화", ep_content="-")
+    ).inserted_primary_key[0]
+    comment_pk = session.execute(
+        insert(Comment).values(novel_pk=novel_pk, ep_pk=ep_pk, user_pk=user_pks[0], content="-")
+    ).inserted_primary_key[0]
+    cocomment_pk = session.execute(
+        insert(CoComment).values(comment_pk=comment_pk, user_pk=user_pks[0], content="-")
+    ).inserted_primary_key[0]
+    session.commit()
+
+    targets = {
+        "novel": (user_like_table, Novel, novel_pk),
+        "comment": (user_comment_like_table, Comment, comment_pk),
+        "cocomment": (user_cocomment_like_table, CoComment, cocomment_pk),
+    }
+    return user_pks, targets
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db-url", required=True, help="테스트용 MySQL URL")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--clicks", type=int, default=5000, help="대상별 토글 요청 수")
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url, pool_size=args.workers, max_overflow=0)
+    Session = sessionmaker(bind=engine)
+    Base.metadata.create_all(engine)
+
+    with Session() as session:
+        user_pks, targets = seed(session, args.users)
+
+    # 적은 사용자 수로 같은 (사용자, 대상) 조합의 동시 토글이 자주 겹치도록 함
+    rng = random.Random(42)
+    jobs = [(name, rng.choice(user_pks)) for name in targets for _ in range(args.clicks)]
+    rng.shuffle(jobs)
+
+    def click(job):
+        name, user_pk = job
+        link_table, target, target_pk = targets[name]
+        with Session() as session:
+            try:
+                novel_crud.toggle_like(session, link_table, target, target_pk, user_pk)
+                return True
+            except OperationalError:  # 데드락 등으로 롤백된 토글 (카운터와 연결 테이블 모두 반영 안 됨)
+                return False
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(click, jobs))
+    elapsed = time.perf_counter() - started
+    print(f"{len(jobs)} toggles in {elapsed:.1f}s ({len(jobs) / elapsed:.0f}/s), rolled back: {results.count(False)}")
+
+    failed = False
+    with Session() as session:
+        for name, (link_table, target, target_pk) in targets.items():
+            target_table = target.__table__
+            pk_name = target_table.primary_key.columns.values()[0].name
+            counter = session.execute(
+                select(target_table.c.likes).where(target_table.c[pk_name] == target_pk)
+            ).scalar_one()
+            rows = session.execute(
+                select(func.count()).select_from(link_table).where(link_table.c[pk_name] == target_pk)
+            ).scalar_one()
+            ok = counter == rows
+            failed |= not ok
+            print(f"  {name:<9} likes={counter:<5} rows={rows:<5} {'OK' if ok else 'MISMATCH'}")
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+userlike 테이블로 실시간 인기(트렌딩) Redis 버킷을 다시 생성하는 스크립트
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.rebuild_trending
+"""
+import asyncio
+
+from database import SessionLocal
+from novel import novel_crud
+from utils import trending_utils
+from utils.redis_utils import create_redis_client
+
+
+async def rebuild():
+    db = SessionLocal()
+    try:
+        daily_counts = novel_crud.get_daily_like_counts(db, trending_utils.MAX_WINDOW_DAYS)
+    finally:
+        db.close()
+
+    redis_client = await create_redis_client()
+    try:
+        await trending_utils.rebuild_buckets(redis_client, daily_counts)
+    finally:
+        await redis_client.aclose()
+
+    print(f"✅ 트렌딩 버킷 재생성 완료 ({len(daily_counts)}개 일별 집계)")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild())
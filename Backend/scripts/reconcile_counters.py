@@ -0,0 +1,25 @@
+"""
+비정규화 카운터(num_episode, comment_cnt, cocomment_cnt, likes)를 실제 행 수로 다시 계산하는 스크립트
+배포 직후 1회, 이후 필요할 때 실행
+
+사용법 (Backend 디렉토리에서):
+    python -m scripts.reconcile_counters
+"""
+from database import SessionLocal
+from novel import novel_crud
+
+
+def main():
+    db = SessionLocal()
+    try:
+        fixed = novel_crud.reconcile_counters(db)
+    finally:
+        db.close()
+
+    for name, count in fixed.items():
+        print(f"  {name:<26} {count}행 보정")
+    print("✅ 카운터 재계산 완료")
+
+
+if __name__ == "__main__":
+    main()
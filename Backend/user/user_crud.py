@@ -1,17 +1,16 @@
 from fastapi import HTTPException, UploadFile
+from sqlalchemy import select, update, delete
 from sqlalchemy.sql import func
 from sqlalchemy.orm import joinedload, Session
-from passlib.context import CryptContext
 
 import models
 from models import User, Novel, Comment, CoComment, Episode, user_comment_like_table
 
+from novel import novel_crud
 from . import user_schema
 from typing import Optional
 import requests
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 def get_users(db: Session):
     """
     데이터베이스에서 전체 사용자 조회
@@ -33,8 +32,9 @@ def get_user_profile(db: Session, user: User):
     """
     데이터베이스에서 현재 로그인된 사용자 프로필 정보 조회
     :param db: SQLAlchemy 세션 
-    :param user: 현재 로그인된 사용자 객체
+    :param user: 현재 로그인된 사용자 객체 (get_current_user_model)
     """
+    user = db.get(User, user.user_pk)  # 다른 세션의 User가 넘어와도 이 세션에서 관계 컬렉션을 로드하도록
     # 작성한 소설 조회
     novels_written = db.query(Novel).filter(Novel.user_pk == user.user_pk).all()
 
@@ -188,6 +188,7 @@ def update_user(db: Session, user: User, updated_user: user_schema.UpdateUserFor
     :param updated_user: 사용자가 입력한 수정 정보
     :return: User 객체 또는 None
     """
+    user = db.get(User, user.user_pk)  # 같은 세션의 User면 identity map에서 바로 반환
     # 닉네임 수정
     if updated_user.nickname:
         # 닉네임 중복 확인
@@ -214,44 +215,67 @@ def update_user(db: Session, user: User, updated_user: user_schema.UpdateUserFor
     db.refresh(user)
     return user
 
-def delete_user(db: Session, user: models.User):
+def release_user_counters(db: Session, user_pk: int):
     """
-    데이터베이스에서 사용자 삭제
-    :param db: SQLAlchemy 세션
-    :param user: 삭제할 유저
+    사용자 삭제 시 CASCADE로 함께 지워지는 좋아요/댓글/대댓글만큼 다른 행의 비정규화 카운터 차감
+    (행을 로드하지 않고 UPDATE 문으로 처리, 커밋은 호출한 쪽에서)
     """
-    db.delete(user)
-    db.commit()
+    for link_table, target in (
+        (models.user_like_table, Novel),
+        (user_comment_like_table, Comment),
+        (models.user_cocomment_like_table, CoComment),
+    ):
+        table = target.__table__
+        pk_column = table.primary_key.columns.values()[0]
+        values = {"likes": table.c.likes - 1}
+        if "updated_date" in table.c:
+            values["updated_date"] = table.c.updated_date
+        db.execute(
+            update(table)
+            .where(pk_column.in_(select(link_table.c[pk_column.name]).where(link_table.c.user_pk == user_pk)))
+            .values(values)
+        )
 
-def save_recent_novel(db: Session, user_pk: int, novel_pk: int):
-    """
-    로그인한 사용자가 조회한 소설을 최근 본 소설 목록에 저장
-    """
-    # 해당 소설이 존재하는지 확인
-    novel = db.query(Novel).filter(Novel.novel_pk == novel_pk).first()
-    if not novel:
-        raise HTTPException(status_code=404, detail="Novel not found")
+    user_comments = (
+        select(func.count())
+        .where(Comment.ep_pk == Episode.ep_pk, Comment.user_pk == user_pk)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(Episode)
+        .where(Episode.ep_pk.in_(select(Comment.ep_pk).where(Comment.user_pk == user_pk)))
+        .values(comment_cnt=Episode.comment_cnt - user_comments, updated_date=Episode.updated_date)
+        .execution_options(synchronize_session=False)
+    )
 
-    # 이미 최근 본 소설 목록에 있는지 확인
-    existing_entry = db.execute(
-        models.user_recent_novel_table.select()
-        .where(models.user_recent_novel_table.c.user_pk == user_pk)
-        .where(models.user_recent_novel_table.c.novel_pk == novel_pk)
-    ).fetchone()
+    user_cocomments = (
+        select(func.count())
+        .where(CoComment.comment_pk == Comment.comment_pk, CoComment.user_pk == user_pk)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(Comment)
+        .where(Comment.comment_pk.in_(select(CoComment.comment_pk).where(CoComment.user_pk == user_pk)))
+        .values(cocomment_cnt=Comment.cocomment_cnt - user_cocomments)
+        .execution_options(synchronize_session=False)
+    )
 
-    if existing_entry:
-        # 기존 조회 기록이 있다면, viewed_date 갱신
-        db.execute(
-            models.user_recent_novel_table.update()
-            .where(models.user_recent_novel_table.c.user_pk == user_pk)
-            .where(models.user_recent_novel_table.c.novel_pk == novel_pk)
-            .values(viewed_date=func.now())
-        )
-    else:
-        # 새로운 조회 기록을 추가
-        db.execute(
-            models.user_recent_novel_table.insert().values(user_pk=user_pk, novel_pk=novel_pk, viewed_date=func.now())
-        )
 
+def delete_user(db: Session, user_pk: int) -> dict:
+    """
+    데이터베이스에서 사용자 삭제
+    작성한 소설, 댓글, 좋아요, OAuth 계정 등은 DB의 ON DELETE CASCADE로 함께 삭제 (관계 컬렉션을 로드하지 않음)
+    :param db: SQLAlchemy 세션
+    :param user_pk: 삭제할 유저 pk
+    :return: deferred_cleanup.enqueue_cleanup에 넘길 정리 작업
+    """
+    user_img = db.execute(select(User.user_img).where(User.user_pk == user_pk)).scalar_one_or_none()
+    cleanup = novel_crud.collect_novel_cleanup(db, Novel.user_pk == user_pk)
+    image_path = novel_crud.local_image_path(user_img)
+    if image_path:
+        cleanup["files"].append(image_path)
+
+    release_user_counters(db, user_pk)
+    db.execute(delete(User).where(User.user_pk == user_pk).execution_options(synchronize_session=False))
     db.commit()
-    return {"message": "Recent novel updated successfully"}
\ No newline at end of file
+    return {**cleanup, "user_pks": [user_pk]}
@@ -1,19 +1,23 @@
 
 from fastapi import Depends, HTTPException, APIRouter
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
 from models import User, Novel
-from utils.auth_utils import get_current_user
+from utils.auth_utils import get_current_user, get_current_user_model
 from auth.auth_router import check_verified
 
 from . import user_crud, user_schema
+from .user_schema import AuthUser
 from utils.redis_utils import get_redis
-from database import get_db
+from utils.password_hasher import PasswordHasher, get_password_hasher
+from database import get_db, get_async_db
+from novel import novel_crud
+from utils import recent_history, deferred_cleanup, principal_cache
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
 from typing import List
 from redis import Redis
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 router = APIRouter(
     prefix='/api/v1/users',
 )
@@ -25,12 +29,12 @@ def get_users(db:Session=Depends(get_db)):
     return users
 
 @router.get('/logged-in', description="현재 사용자 정보 조회", response_model=user_schema.User)
-def get_user(current_user: User = Depends(get_current_user)):
+def get_user(current_user: AuthUser = Depends(get_current_user)):
     return current_user
 
 @router.get('/detail', description="현재 로그인된 사용자 상세 조회(마이 페이지 데이터 출력용)", response_model=user_schema.UserDetail)
 def get_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_model),
     db: Session = Depends(get_db)
 ):
     return user_crud.get_user_profile(db, user=current_user)
@@ -39,8 +43,8 @@ def get_profile(
 @router.put('/', description="현재 사용자 정보 수정", response_model=user_schema.User)
 async def update_user(
     updated_user: user_schema.UpdateUserForm,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: AuthUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
     redis_client: Redis = Depends(get_redis)
 ):
     
@@ -51,18 +55,21 @@ async def update_user(
             except Exception as e:
                 raise
 
-    updated_user = user_crud.update_user(db, current_user, updated_user)
+    updated_user = await db.run_sync(user_crud.update_user, current_user, updated_user)
+    await principal_cache.invalidate_principal(redis_client, updated_user.email)
     return updated_user
 
 
 @router.delete('/{user_id}', description='사용자 계정 삭제')
-def delete_user(
+async def delete_user(
     user_id: int,
     credentials: user_schema.DeleteUserForm,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    redis_client: Redis = Depends(get_redis),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ):
     # 사용자 조회
-    user = user_crud.get_user(db, user_id)
+    user = await run_in_threadpool(user_crud.get_user, db, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not Found")
 
@@ -71,53 +78,51 @@ def delete_user(
         raise HTTPException(status_code=401, detail="Invalid email")
 
     # 비밀번호 검증
-    if not pwd_context.verify(credentials.password, user.password):
+    verified, _ = await password_hasher.verify(credentials.password, user.password)
+    if not verified:
         raise HTTPException(status_code=401, detail="Invalid password")
 
-    # 사용자 삭제
-    user_crud.delete_user(db, user)
+    # 사용자 삭제 (파일/캐시 정리는 백그라운드 작업에서 처리)
+    cleanup = await run_in_threadpool(user_crud.delete_user, db, user.user_pk)
+    await principal_cache.invalidate_principal(redis_client, user.email)
+    await deferred_cleanup.enqueue_cleanup(redis_client, **cleanup)
     return {"message": "User deleted successfully"}
 
 
 
 @router.get("/novels-written", description="로그인한 사용자가 작성한 소설 목록 조회", response_model=List[user_schema.UserWrittenNovel])
-async def get_novels_written(current_user: User = Depends(get_current_user), db:Session=Depends(get_db)):
+async def get_novels_written(current_user: AuthUser = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     """
     사용자가 작성한 소설 목록을 가져옴
     """
-    novels_written = db.query(Novel).filter(Novel.user_pk == current_user.user_pk).all()
+    novels_written = (await db.execute(select(Novel).where(Novel.user_pk == current_user.user_pk))).scalars().all()
     return novels_written
 
 
 @router.get("/recent-novels", description="로그인한 사용자가 최근 본 소설 목록 조회")
-async def get_recent_novels(current_user: User = Depends(get_current_user)):
+async def get_recent_novels(current_user: AuthUser = Depends(get_current_user), redis_client: Redis = Depends(get_redis)):
     """
-    사용자가 최근에 조회한 소설 목록을 가져옴
+    사용자가 최근에 조회한 소설 목록을 가져옴 (최근 기록은 Redis에서 읽음)
     """
-    if not current_user.recent_novels:
+    recent_novels = await novel_crud.load_recent_novels(redis_client, current_user.user_pk)
+    if not recent_novels:
         return {"message": "Recently seen novels do not exist"}
 
-    return {
-        "recent_novels": [
-            {
-                "novel_pk": novel.novel_pk,
-                "title": novel.title,
-                "synopsis": novel.synopsis,
-                "novel_img": novel.novel_img,
-            }
-            for novel in current_user.recent_novels
-        ]
-    }
+    return {"recent_novels": recent_novels}
 
 
 # episode 정보를 조회할 때 로직과 합쳐야 할 듯.
 @router.post("/recent-novel/{novel_pk}", description="로그인한 사용자가 조회한 소설 저장")
 async def save_recent_novel(
     novel_pk: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: AuthUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: Redis = Depends(get_redis),
 ):
     """
     로그인한 사용자가 조회한 소설을 최근 본 소설 목록에 저장
     """
-    return user_crud.save_recent_novel(db, current_user.user_pk, novel_pk)
\ No newline at end of file
+    if (await db.execute(select(Novel.novel_pk).where(Novel.novel_pk == novel_pk))).first() is None:
+        raise HTTPException(status_code=404, detail="Novel not found")
+    await recent_history.record_recent_view(redis_client, current_user.user_pk, novel_pk)
+    return {"message": "Recent novel updated successfully"}
\ No newline at end of file
@@ -15,6 +15,20 @@ class User(BaseModel):
     class Config:
         from_attributes = True
 
+# 인증 의존성(get_current_user, get_optional_user)이 반환하는 사용자
+# 컬럼만 담으므로 관계 컬렉션 로드가 일어나지 않음 (ORM User가 필요하면 get_current_user_model)
+class AuthUser(BaseModel):
+    user_pk: int
+    email: str
+    name: str
+    nickname: str
+    phone: Optional[str] = None
+    user_img: Optional[str] = None
+    is_oauth_user: bool = False
+
+    class Config:
+        from_attributes = True
+
 # 사용자 정보 수정
 class UpdateUserForm(BaseModel):
     nickname: str = Field(None, min_length=1, max_length=50, description="수정할 닉네임")
@@ -1,18 +1,25 @@
 from fastapi import HTTPException, Depends, status, Header, Response, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError, ExpiredSignatureError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import get_db
+from database import get_db, get_async_db
 from models import User
-from user import user_crud
+from user.user_schema import AuthUser
 import os
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+import hashlib
 import random
 import string
+import time
+import uuid
 from twilio.rest import Client
 from redis import Redis
+from redis.exceptions import NoScriptError
 from utils.redis_utils import get_redis  # utils.redis_utils에서 get_redis 함수 import
+from utils import principal_cache, jwt_cache
 
 # Twilio 설정
 TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
@@ -204,204 +211,229 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 
 
+async def load_principal(db: AsyncSession, email: str) -> Optional[AuthUser]:
+    """AuthUser 컬럼만 조회 (ORM 객체를 만들지 않으므로 관계 로드 없이 쿼리 1번)"""
+    columns = [getattr(User, field) for field in principal_cache.PRINCIPAL_FIELDS]
+    row = (await db.execute(select(*columns).where(User.email == email))).first()
+    return AuthUser(**row._mapping) if row else None
+
+
+async def resolve_principal(db: AsyncSession, redis_client: Redis, email: str) -> Optional[AuthUser]:
+    """토큰 subject(email)로 사용자 조회 - 메모리/Redis 캐시에 있으면 SQL 없이 반환"""
+    user = await principal_cache.get_principal(redis_client, email)
+    if user is None:
+        user = await load_principal(db, email)
+        if user is not None:
+            await principal_cache.store_principal(redis_client, user)
+    return user
+
+
 async def get_refresh_token(request: Request) -> str:
     """요청 헤더에서 refresh_token을 추출 (Swagger에서 감춤)"""
     return request.headers.get("refresh_token")  # 없으면 None 반환
 
 
 
+def decode_access_token(access_token: str) -> dict:
+    """
+    access token 검증 후 claims 반환
+    같은 토큰은 exp까지 jwt_cache에 저장된 claims를 재사용 (만료되면 캐시에서 빠져 jwt.decode가 ExpiredSignatureError)
+    """
+    claims = jwt_cache.get_claims(access_token)
+    if claims is None:
+        claims = jwt.decode(access_token, SECRET_KEY, algorithms=[ALGORITHM])
+        jwt_cache.store_claims(access_token, claims)
+    return claims
+
+
+# ================================== refresh token 회전 ===============================================
+
+# refresh token은 로그인마다 새 family(fam)를 만들고, 재발급할 때마다 jti를 바꿈 (rotation)
+# refresh_token:{email} (hash): fam, jti(현재), prev(직전), rotated_at(ms)
+REFRESH_KEY_PREFIX = "refresh_token"
+# 같은 refresh token으로 거의 동시에 들어온 재발급(탭 여러 개 등)은 승자의 jti로 함께 성공시키는 시간
+# (이 시간 안의 재사용은 탈취로 잡지 못하므로 동시 요청이 겹칠 정도로만 짧게)
+REFRESH_REUSE_GRACE_MS = int(os.getenv("REFRESH_REUSE_GRACE_MS", "2000"))
+
+# 비교 -> 회전 -> TTL 갱신을 한 번의 왕복으로 원자적으로 처리
+# :return: {"rotated", 새 jti} | {"grace", 현재 jti} | {"reused"} (family 폐기) | {"invalid"}
+ROTATE_REFRESH_LUA = """
+local key = KEYS[1]
+local fam, jti, new_jti = ARGV[1], ARGV[2], ARGV[3]
+local ttl, now, grace = tonumber(ARGV[4]), tonumber(ARGV[5]), tonumber(ARGV[6])
+if redis.call('TYPE', key).ok ~= 'hash' then
+    return {'invalid'}
+end
+local state = redis.call('HMGET', key, 'fam', 'jti', 'prev', 'rotated_at')
+if state[1] ~= fam then
+    return {'invalid'}
+end
+if state[2] == jti then
+    redis.call('HSET', key, 'jti', new_jti, 'prev', jti, 'rotated_at', now)
+    redis.call('EXPIRE', key, ttl)
+    return {'rotated', new_jti}
+end
+if state[3] == jti and now - tonumber(state[4]) <= grace then
+    return {'grace', state[2]}
+end
+redis.call('DEL', key)
+return {'reused'}
+"""
+ROTATE_REFRESH_SHA = hashlib.sha1(ROTATE_REFRESH_LUA.encode()).hexdigest()  # EVALSHA용, 모듈 로드 시 한 번 계산
+
+
+def refresh_key(email: str) -> str:
+    return f"{REFRESH_KEY_PREFIX}:{email}"
+
+
+async def run_rotate_script(redis_client: Redis, key: str, *args):
+    """EVALSHA 한 번 (Redis 재시작 등으로 스크립트 캐시가 비어 있을 때만 EVAL로 다시 등록)"""
+    try:
+        return await redis_client.evalsha(ROTATE_REFRESH_SHA, 1, key, *args)
+    except NoScriptError:
+        return await redis_client.eval(ROTATE_REFRESH_LUA, 1, key, *args)
+
+
+def auth_cookie_holder(request: Request) -> Response:
+    """
+    재발급한 인증 쿠키를 담아둘 요청별 Response
+    의존성의 response는 라우트가 Response를 직접 반환(304 등)하거나 예외가 나면 버려지므로
+    main.AuthCookieMiddleware가 실제 응답에 set-cookie를 복사
+    """
+    holder = getattr(request.state, "auth_cookies", None)
+    if holder is None:
+        holder = request.state.auth_cookies = Response()
+    return holder
+
+
+async def start_refresh_family(redis_client: Redis, email: str, expires_delta: timedelta) -> str:
+    """
+    로그인 시 새 refresh token family 시작 (이전 로그인의 refresh token은 무효화)
+    :return: refresh token
+    """
+    family, jti = uuid.uuid4().hex, uuid.uuid4().hex
+    key = refresh_key(email)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(key)
+        pipe.hset(key, mapping={"fam": family, "jti": jti, "prev": "", "rotated_at": 0})
+        pipe.expire(key, int(expires_delta.total_seconds()))
+        await pipe.execute()
+    return create_refresh_token({"sub": email, "fam": family, "jti": jti}, expires_delta=expires_delta)
+
+
+async def revoke_refresh_family(redis_client: Redis, refresh_token: str):
+    """로그아웃 - 요청한 refresh token의 family가 현재 family면 삭제"""
+    try:
+        payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return
+    email, family = payload.get("sub"), payload.get("fam")
+    if email and family and await redis_client.hget(refresh_key(email), "fam") == family:
+        await redis_client.delete(refresh_key(email))
+
+
+async def rotate_refresh_token(redis_client: Redis, refresh_token: str, response: Optional[Response]) -> str:
+    """
+    refresh token으로 access token을 재발급하고 refresh token도 새 jti로 교체 (쿠키 갱신)
+    이미 교체된 refresh token이 grace 시간 이후 다시 쓰이면 탈취로 보고 family 전체를 폐기
+    :return: 토큰 subject(email)
+    """
+    try:
+        payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token")
+
+    email, family, jti = payload.get("sub"), payload.get("fam"), payload.get("jti")
+    if not (email and family and jti):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+
+    refresh_token_expires = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    result = await run_rotate_script(
+        redis_client, refresh_key(email),
+        family, jti, uuid.uuid4().hex, int(refresh_token_expires.total_seconds()),
+        int(time.time() * 1000), REFRESH_REUSE_GRACE_MS,
+    )
+    if result[0] == "reused":
+        print(f"⚠️ 이미 교체된 refresh token 재사용 감지 - family 폐기 ({email})")
+    if result[0] not in ("rotated", "grace"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token")
+
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    if response:
+        set_auth_cookies(
+            response=response,
+            access_token=create_access_token(data={"sub": email}, expires_delta=access_token_expires),
+            refresh_token=create_refresh_token(
+                {"sub": email, "fam": family, "jti": result[1]}, expires_delta=refresh_token_expires
+            ),
+            access_token_expires_delta=access_token_expires,
+            refresh_token_expires_delta=refresh_token_expires
+        )
+    return email
+
+
 async def validate_token_and_get_user(
     access_token: Optional[str],
     refresh_token: Optional[str],
     response: Optional[Response],
-    db: Session,
+    db: AsyncSession,
     redis_client: Redis,
     allow_unauthorized: bool = False
-) -> Optional[User]:
+) -> Optional[AuthUser]:
     """
     토큰을 검증하고 사용자 정보를 반환하는 중앙화된 함수
-    access token이 없고 refresh token만 있는 경우 자동으로 access token을 재발급
-    
+    access token이 없거나 만료되었고 refresh token이 있으면 refresh token을 회전하며 access token을 재발급
+
     Args:
         access_token (Optional[str]): Access token (없을 수 있음)
         refresh_token (Optional[str]): Refresh token
         response (Optional[Response]): FastAPI response object for setting cookies
-        db (Session): Database session
+        db (AsyncSession): Database session
         redis_client (Redis): Redis client
         allow_unauthorized (bool): 비로그인 사용자 허용 여부
 
     Returns:
-        Optional[User]: 검증된 사용자 객체 또는 None (allow_unauthorized=True인 경우)
-    """
-    # access token이 없고 refresh token이 있는 경우
-    if not access_token and refresh_token:
-        try:
-            # Refresh Token 검증
-            payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
-            email = payload.get("sub")
-
-            if email is None:
-                if allow_unauthorized:
-                    return None
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid refresh token"
-                )
-
-            # Redis에 저장된 refresh token과 비교
-            stored_token = await redis_client.get(f"refresh_token:{email}")
-            if isinstance(stored_token, bytes):
-                stored_token = stored_token.decode('utf-8')
-
-            if stored_token != refresh_token:
-                if allow_unauthorized:
-                    return None
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid or expired refresh token"
-                )
-
-            # 새로운 Access Token 발급
-            access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-            access_token = create_access_token(
-                data={"sub": email},
-                expires_delta=access_token_expires
-            )
-
-            # 새 Access Token을 쿠키에 저장
-            if response:
-                set_auth_cookies(
-                    response=response,
-                    access_token=access_token,
-                    refresh_token=refresh_token,
-                    access_token_expires_delta=access_token_expires,
-                    refresh_token_expires_delta=timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-                )
-        except JWTError:
-            if allow_unauthorized:
-                return None
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid refresh token"
-            )
-
-    # access token이 없고 refresh token도 없는 경우
-    if not access_token:
-        if allow_unauthorized:
-            return None
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Access token is missing"
-        )
-
+        Optional[AuthUser]: 검증된 사용자 또는 None (allow_unauthorized=True인 경우)
+    """
     try:
-        # Access Token 검증
-        payload = jwt.decode(access_token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-
+        email = None
+        if access_token:
+            try:
+                email = decode_access_token(access_token).get("sub")
+                if email is None:
+                    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
+            except ExpiredSignatureError:
+                if not refresh_token:
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="Access token expired. Please login again."
+                    )
+            except JWTError:
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid access token")
+        elif not refresh_token:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Access token is missing")
+
+        # access token이 없거나 만료된 경우 refresh token으로 재발급
         if email is None:
-            if allow_unauthorized:
-                return None
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token payload"
-            )
-
-        # DB에서 사용자 정보 가져오기
-        user = user_crud.get_user_by_email(db, email)
-        if not user:
-            if allow_unauthorized:
-                return None
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
+            email = await rotate_refresh_token(redis_client, refresh_token, response)
 
+        # 사용자 정보 가져오기 (캐시 -> DB)
+        user = await resolve_principal(db, redis_client, email)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         return user
 
-    except ExpiredSignatureError:
-        # Access Token 만료 시 Refresh Token으로 재발급 시도
-        if not refresh_token:
-            if allow_unauthorized:
-                return None
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Access token expired. Please login again."
-            )
-
-        try:
-            # Refresh Token 검증
-            payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
-            email = payload.get("sub")
-
-            if email is None:
-                if allow_unauthorized:
-                    return None
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid refresh token"
-                )
-
-            stored_token = await redis_client.get(f"refresh_token:{email}")
-            if isinstance(stored_token, bytes):
-                stored_token = stored_token.decode('utf-8')
-
-            if stored_token != refresh_token:
-                if allow_unauthorized:
-                    return None
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid or expired refresh token"
-                )
-
-            # 새로운 Access Token 발급
-            access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-            new_access_token = create_access_token(
-                data={"sub": email},
-                expires_delta=access_token_expires
-            )
-
-            # 새 Access Token을 쿠키에 저장
-            if response:
-                set_auth_cookies(
-                    response=response,
-                    access_token=new_access_token,
-                    refresh_token=refresh_token,
-                    access_token_expires_delta=access_token_expires,
-                    refresh_token_expires_delta=timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-                )
-
-            user = user_crud.get_user_by_email(db, email)
-            if not user and not allow_unauthorized:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="User not found"
-                )
-            return user
-
-        except JWTError:
-            if allow_unauthorized:
-                return None
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired refresh token"
-            )
-
-    except JWTError:
+    except HTTPException:
         if allow_unauthorized:
             return None
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid access token"
-        )
+        raise
 
 async def get_current_user(
     request: Request,
-    response: Response = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     refresh_token: str = Depends(get_refresh_token),
     redis_client: Redis = Depends(get_redis)
-) -> User:
+) -> AuthUser:
     """
     현재 로그인된 사용자 검증 (unauthorized 불가)
     """
@@ -409,7 +441,7 @@ async def get_current_user(
     user = await validate_token_and_get_user(
         access_token=access_token,
         refresh_token=refresh_token,
-        response=response,
+        response=auth_cookie_holder(request),
         db=db,
         redis_client=redis_client,
         allow_unauthorized=False
@@ -420,10 +452,9 @@ async def get_current_user(
 
 async def get_optional_user(
     request: Request,
-    response: Response = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     redis_client: Redis = Depends(get_redis)
-) -> Optional[User]:
+) -> Optional[AuthUser]:
     """
     현재 로그인된 사용자 검증 (unauthorized 허용)
     """
@@ -432,9 +463,23 @@ async def get_optional_user(
     user = await validate_token_and_get_user(
         access_token=access_token,
         refresh_token=refresh_token,
-        response=response,
+        response=auth_cookie_holder(request),
         db=db,
         redis_client=redis_client,
         allow_unauthorized=True
     )
+    return user
+
+
+def get_current_user_model(
+    current_user: AuthUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    현재 로그인된 사용자의 ORM User (요청 세션에 속함)
+    관계 컬렉션이나 User 객체 수정이 필요한 라우트에서만 사용
+    """
+    user = db.get(User, current_user.user_pk)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return user
\ No newline at end of file
@@ -0,0 +1,79 @@
+import hashlib
+import os
+from typing import Optional
+from redis import Redis
+from redis.exceptions import NoScriptError
+
+# 응답 캐시 설정
+NOVEL_DETAIL_CACHE_TTL = int(os.getenv("NOVEL_DETAIL_CACHE_TTL", "300"))
+CACHE_STATS_KEY = "cache_stats"
+
+# GET과 hit/miss 카운트를 한 번의 왕복으로 (카운트할 필드가 GET 결과에 달려 있어 파이프라인 대신 스크립트)
+GET_COUNTED_LUA = """
+local payload = redis.call('GET', KEYS[1])
+redis.call('HINCRBY', KEYS[2], ARGV[1] .. (payload and ':hit' or ':miss'), 1)
+return payload
+"""
+GET_COUNTED_SHA = hashlib.sha1(GET_COUNTED_LUA.encode()).hexdigest()
+
+
+def novel_detail_key(novel_pk: int) -> str:
+    """소설 상세 페이지 캐시 키"""
+    return f"novel_detail:{novel_pk}"
+
+
+def novel_tag(novel_pk: int) -> str:
+    """특정 소설에 묶인 캐시 키들을 모아두는 태그(set) 키"""
+    return f"cache_tag:novel:{novel_pk}"
+
+
+async def get_cached(redis_client: Redis, name: str, key: str) -> Optional[str]:
+    """
+    캐시에 저장된 직렬화 payload 조회 및 hit/miss 카운트
+    :param name: 통계용 캐시 이름 (예: novel_detail)
+    """
+    try:
+        return await redis_client.evalsha(GET_COUNTED_SHA, 2, key, CACHE_STATS_KEY, name)
+    except NoScriptError:
+        return await redis_client.eval(GET_COUNTED_LUA, 2, key, CACHE_STATS_KEY, name)
+
+
+async def set_cached(redis_client: Redis, key: str, payload: str, ttl: int, tags: tuple[str, ...] = ()):
+    """
+    직렬화된 payload를 저장하고 태그 set에 키를 등록 (태그 단위로 무효화하기 위함)
+    """
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.setex(key, ttl, payload)
+        for tag in tags:
+            pipe.sadd(tag, key)
+            pipe.expire(tag, ttl)
+        await pipe.execute()
+
+
+async def invalidate_tags(redis_client: Redis, *tags: str):
+    """태그에 등록된 모든 캐시 키와 태그 자체를 삭제"""
+    for tag in tags:
+        keys = await redis_client.smembers(tag)
+        await redis_client.delete(tag, *keys)
+
+
+async def invalidate_novel(redis_client: Redis, novel_pk: int):
+    """소설 관련 캐시 무효화 (에피소드/댓글/토론/소설 정보 변경 시 호출)"""
+    await invalidate_tags(redis_client, novel_tag(novel_pk))
+
+
+async def get_cache_stats(redis_client: Redis) -> dict:
+    """
+    캐시별 hit/miss 횟수와 적중률 반환
+    :return: {"novel_detail": {"hit": 10, "miss": 2, "hit_rate": 0.833}, ...}
+    """
+    raw = await redis_client.hgetall(CACHE_STATS_KEY)
+    stats = {}
+    for field, count in raw.items():
+        name, kind = field.rsplit(":", 1)
+        stats.setdefault(name, {"hit": 0, "miss": 0})[kind] = int(count)
+
+    for counts in stats.values():
+        total = counts["hit"] + counts["miss"]
+        counts["hit_rate"] = round(counts["hit"] / total, 3) if total else 0.0
+    return stats
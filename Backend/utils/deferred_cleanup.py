@@ -0,0 +1,90 @@
+import asyncio
+import json
+import os
+
+from fastapi.concurrency import run_in_threadpool
+from redis import Redis
+
+from novel.novel_crud import LIKE_TABLES, liked_cache_key
+from novel.novel_recommend import recommend_key
+from utils import cache_utils, trending_utils
+from utils.recent_history import recent_key
+from utils.view_counter import NOVEL_VIEWS_KEY
+
+# 소설/사용자 삭제 후 처리할 정리 작업 큐 (list: JSON job)
+CLEANUP_QUEUE_KEY = "cleanup:jobs"
+CLEANUP_PROCESSING_KEY = f"{CLEANUP_QUEUE_KEY}:processing"  # 처리 중인 job (실패/재시작 시 다시 처리)
+CLEANUP_POLL_SECONDS = 5
+
+# 삭제해도 되는 파일 위치 (토론용 txt, 로컬 이미지)
+CLEANUP_DIRS = (
+    os.path.abspath("./document_path"),
+    os.path.abspath(os.path.join(os.getcwd(), "static")),
+)
+
+
+async def enqueue_cleanup(redis_client: Redis, novel_pks=(), user_pks=(), files=()):
+    """DB 삭제가 커밋된 뒤 남은 파일/Redis 데이터 정리를 큐에 추가 (요청은 바로 반환)"""
+    job = {"novel_pks": list(novel_pks), "user_pks": list(user_pks), "files": list(files)}
+    if any(job.values()):
+        await redis_client.rpush(CLEANUP_QUEUE_KEY, json.dumps(job, ensure_ascii=False))
+
+
+def remove_files(paths: list[str]) -> int:
+    """정리 대상 디렉토리 안의 파일만 삭제 (이미 없는 파일은 무시)"""
+    removed = 0
+    for path in paths:
+        path = os.path.abspath(path)
+        if os.path.dirname(path) not in CLEANUP_DIRS:
+            continue
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+async def cleanup_redis(redis_client: Redis, novel_pks: list[int], user_pks: list[int]):
+    """삭제된 소설/사용자에 묶인 캐시, 선호작 순위, 조회수 버퍼, 사용자별 키 삭제"""
+    for novel_pk in novel_pks:
+        await cache_utils.invalidate_novel(redis_client, novel_pk)
+
+    async with redis_client.pipeline(transaction=False) as pipe:
+        if novel_pks:
+            for key in trending_utils.bucket_keys(trending_utils.MAX_WINDOW_DAYS + 1):
+                pipe.zrem(key, *novel_pks)
+            pipe.hdel(NOVEL_VIEWS_KEY, *novel_pks)
+        for user_pk in user_pks:
+            pipe.delete(
+                recent_key(user_pk),
+                recommend_key(user_pk),
+                *[liked_cache_key(target, user_pk) for target in LIKE_TABLES],
+            )
+        await pipe.execute()
+
+
+async def run_cleanup_job(redis_client: Redis, job: dict):
+    if job["files"]:
+        await run_in_threadpool(remove_files, job["files"])
+    await cleanup_redis(redis_client, job["novel_pks"], job["user_pks"])
+
+
+async def run_cleanup_worker(redis_client: Redis, timeout: int = CLEANUP_POLL_SECONDS):
+    """lifespan에서 실행되는 삭제 후 정리 작업"""
+    # 이전 실행에서 끝내지 못한 job을 다시 큐 앞으로
+    while await redis_client.lmove(CLEANUP_PROCESSING_KEY, CLEANUP_QUEUE_KEY, "RIGHT", "LEFT"):
+        pass
+
+    while True:
+        try:
+            raw = await redis_client.blmove(CLEANUP_QUEUE_KEY, CLEANUP_PROCESSING_KEY, timeout, "LEFT", "RIGHT")
+            if raw is None:
+                continue
+            await run_cleanup_job(redis_client, json.loads(raw))
+            await redis_client.lrem(CLEANUP_PROCESSING_KEY, 1, raw)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ 삭제 후 정리 작업 실패: {e}")
+            await asyncio.sleep(timeout)
@@ -0,0 +1,65 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+# 조건부 요청 응답 헤더 (매번 서버에 재검증, 변경 없으면 304)
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """검증값 구성 요소(updated_date, 카운트 등)로 weak ETag 생성"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def payload_etag(payload: str) -> str:
+    """직렬화된 응답 본문 해시로 ETag 생성 (캐시된 payload용)"""
+    return f'W/"{hashlib.sha1(payload.encode()).hexdigest()[:20]}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # DB의 naive datetime은 UTC로 간주 (서버가 보낸 값끼리만 비교하므로 일관성만 유지하면 됨)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> dict[str, str]:
+    """ETag, Last-Modified, Cache-Control 헤더"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    클라이언트 사본이 유효한지 확인
+    If-None-Match가 있으면 ETag만 비교하고, 없을 때만 If-Modified-Since 비교 (RFC 9110)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # weak 비교: W/ 접두어 무시
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return _as_utc(last_modified) <= since
+    return False
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """304 Not Modified 응답 (본문 없음)"""
+    return Response(status_code=304, headers=headers)
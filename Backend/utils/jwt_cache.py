@@ -0,0 +1,53 @@
+import hashlib
+import os
+import time
+from collections import Counter
+from typing import Optional
+
+from cachetools import TLRUCache
+
+# 서명 검증을 마친 access token claims 캐시 (프로세스 메모리)
+# 같은 토큰은 만료(exp)까지 매 요청 jwt.decode를 다시 하지 않음, 키는 토큰 원문 대신 sha256 digest
+JWT_CLAIM_CACHE_SIZE = int(os.getenv("JWT_CLAIM_CACHE_SIZE", "10000"))
+
+
+def _expires_at(key: bytes, claims: dict, now: float) -> float:
+    """항목 만료 시각 = 토큰의 exp (time.time 기준)"""
+    return float(claims["exp"])
+
+
+_claims: TLRUCache = TLRUCache(maxsize=JWT_CLAIM_CACHE_SIZE, ttu=_expires_at, timer=time.time)
+_stats: Counter = Counter()  # 프로세스별 hit / miss
+
+
+def token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_claims(token: str) -> Optional[dict]:
+    """캐시된 claims (없거나 exp가 지났으면 None)"""
+    claims = _claims.get(token_key(token))
+    _stats["hit" if claims is not None else "miss"] += 1
+    return claims
+
+
+def store_claims(token: str, claims: dict):
+    """검증된 claims 저장 (exp가 없는 토큰은 만료 시점을 알 수 없으므로 저장하지 않음)"""
+    if "exp" in claims:
+        _claims[token_key(token)] = claims
+
+
+def clear():
+    _claims.clear()
+    _stats.clear()
+
+
+def get_jwt_cache_stats() -> dict:
+    """현재 프로세스의 claims 캐시 hit/miss와 적중률"""
+    total = _stats["hit"] + _stats["miss"]
+    return {
+        "hit": _stats["hit"],
+        "miss": _stats["miss"],
+        "hit_rate": round(_stats["hit"] / total, 3) if total else 0.0,
+        "size": len(_claims),
+    }
@@ -0,0 +1,89 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+from passlib.context import CryptContext
+
+# bcrypt 해싱/검증은 요청당 수백 ms의 CPU를 쓰므로 lifespan이 소유한 프로세스 풀에서 실행
+# (이벤트 루프와 스레드풀, GIL을 붙잡지 않음)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))  # 풀에 들어갈 수 있는 최대 작업 수
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "2"))  # 자리가 안 나면 503
+PASSWORD_HASH_RETRY_AFTER = 1
+
+# min_rounds보다 낮은 비용으로 저장된 해시는 로그인 시 verify_and_update가 새 해시를 돌려줌
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+)
+
+
+def hash_password_sync(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password_sync(password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """:return: (일치 여부, 비용이 바뀌어 다시 만든 해시 또는 None)"""
+    if not hashed_password:
+        return False, None
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+class PasswordHasher:
+    """
+    프로세스 풀 기반 비밀번호 해싱/검증
+    동시에 풀에 넣을 수 있는 작업 수를 세마포어로 제한하고, PASSWORD_HASH_QUEUE_TIMEOUT 안에 자리가 나지 않으면
+    503 + Retry-After로 거절해 로그인 폭주가 다른 요청까지 밀리게 하지 않음
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING,
+                 queue_timeout: float = PASSWORD_HASH_QUEUE_TIMEOUT):
+        # fork는 이벤트 루프/스레드 상태까지 복사하므로 spawn으로 깨끗한 워커 생성
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        self.workers = workers
+        self.queue_timeout = queue_timeout
+        self._slots = asyncio.Semaphore(max_pending)
+
+    async def warm_up(self):
+        """워커 프로세스를 미리 띄워 첫 로그인이 프로세스 시작 시간을 기다리지 않도록 함"""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, _warm_up) for _ in range(self.workers)))
+
+    async def _run(self, fn, *args):
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER)},
+            )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, fn, *args)
+        finally:
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password_sync, password)
+
+    async def verify(self, password: str, hashed_password: Optional[str]) -> tuple[bool, Optional[str]]:
+        """:return: (일치 여부, 다시 저장해야 할 새 해시 또는 None)"""
+        return await self._run(verify_password_sync, password, hashed_password)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+
+def get_password_hasher(request: Request) -> PasswordHasher:
+    """lifespan에서 만든 PasswordHasher를 의존성으로 주입"""
+    return request.app.state.password_hasher
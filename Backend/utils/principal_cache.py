@@ -0,0 +1,97 @@
+import asyncio
+import json
+import os
+from collections import Counter
+from typing import Optional
+
+from cachetools import TTLCache
+from redis import Redis
+
+from user.user_schema import AuthUser
+
+# 인증된 사용자(principal) 캐시 - 토큰 subject(email) 기준 2단계
+# 1) 프로세스 메모리 TTL LRU  2) Redis (워커 간 공유)  3) 둘 다 없으면 DB 조회 후 채움
+PRINCIPAL_KEY_PREFIX = "principal"
+PRINCIPAL_INVALIDATE_CHANNEL = "principal:invalidate"  # 다른 워커의 메모리 캐시 삭제 알림 (pub/sub)
+PRINCIPAL_LOCAL_TTL = int(os.getenv("PRINCIPAL_LOCAL_TTL", "30"))
+PRINCIPAL_LOCAL_SIZE = int(os.getenv("PRINCIPAL_LOCAL_SIZE", "10000"))
+PRINCIPAL_REDIS_TTL = int(os.getenv("PRINCIPAL_REDIS_TTL", "300"))
+
+# AuthUser 컬럼만 보관 (비밀번호 해시, 관계 컬렉션은 캐시하지 않음)
+PRINCIPAL_FIELDS = tuple(AuthUser.model_fields)
+
+_local: TTLCache = TTLCache(maxsize=PRINCIPAL_LOCAL_SIZE, ttl=PRINCIPAL_LOCAL_TTL)
+_stats: Counter = Counter()  # 프로세스별 local / redis / db 조회 횟수
+
+
+def principal_key(email: str) -> str:
+    return f"{PRINCIPAL_KEY_PREFIX}:{email}"
+
+
+async def get_principal(redis_client: Redis, email: str) -> Optional[AuthUser]:
+    """메모리 -> Redis 순으로 조회 (없으면 None, DB 조회는 호출한 쪽에서)"""
+    record = _local.get(email)
+    if record is not None:
+        _stats["local"] += 1
+        return AuthUser(**record)
+
+    payload = await redis_client.get(principal_key(email))
+    if payload is not None:
+        _stats["redis"] += 1
+        record = json.loads(payload)
+        _local[email] = record
+        return AuthUser(**record)
+    return None
+
+
+async def store_principal(redis_client: Redis, principal: AuthUser):
+    """DB에서 읽은 사용자를 두 단계 캐시에 저장"""
+    _stats["db"] += 1
+    record = principal.model_dump()
+    _local[principal.email] = record
+    await redis_client.setex(principal_key(principal.email), PRINCIPAL_REDIS_TTL, json.dumps(record, ensure_ascii=False))
+
+
+async def invalidate_principal(redis_client: Redis, email: str):
+    """
+    사용자 정보 수정/삭제/비밀번호 변경 후 호출
+    Redis 키를 지우고 다른 워커에도 알려 메모리 캐시에서 제거 (알림을 놓쳐도 PRINCIPAL_LOCAL_TTL 후 만료)
+    """
+    _local.pop(email, None)
+    await redis_client.delete(principal_key(email))
+    await redis_client.publish(PRINCIPAL_INVALIDATE_CHANNEL, email)
+
+
+def clear_local():
+    _local.clear()
+
+
+def get_principal_stats() -> dict:
+    """현재 프로세스의 principal 캐시 조회 횟수와 적중률"""
+    total = sum(_stats.values())
+    hits = _stats["local"] + _stats["redis"]
+    return {
+        "local": _stats["local"],
+        "redis": _stats["redis"],
+        "db": _stats["db"],
+        "hit_rate": round(hits / total, 3) if total else 0.0,
+        "local_size": len(_local),
+    }
+
+
+async def run_principal_invalidation_listener(redis_client: Redis):
+    """lifespan에서 실행되는 principal 무효화 알림 구독 (다른 워커에서 수정된 사용자를 메모리 캐시에서 제거)"""
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(PRINCIPAL_INVALIDATE_CHANNEL)
+                # 구독이 끊긴 동안의 알림은 받을 수 없으므로 메모리 캐시를 비우고 다시 시작
+                clear_local()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        _local.pop(message["data"], None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ principal 무효화 구독 실패: {e}")
+            await asyncio.sleep(5)
@@ -0,0 +1,199 @@
+import asyncio
+import hashlib
+import os
+import time
+from datetime import datetime
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from redis import Redis
+from redis.exceptions import NoScriptError
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from database import SessionLocal, run_with_async_session
+from models import Novel, User, user_recent_novel_table
+
+# 최근 본 소설 (sorted set: member=novel_pk, score=조회 시각) - 읽기 경로는 Redis만 사용
+RECENT_KEY_PREFIX = "recent"
+RECENT_EVENTS_KEY = "recent:events"  # DB 반영 대기 이벤트 (list: "user_pk:novel_pk:timestamp")
+RECENT_HISTORY_LIMIT = int(os.getenv("RECENT_HISTORY_LIMIT", "50"))  # 사용자별 보관 개수 (Redis, DB 동일)
+RECENT_HISTORY_TTL = 30 * 86400
+RECENT_FLUSH_SECONDS = int(os.getenv("RECENT_FLUSH_SECONDS", "5"))
+
+# 이벤트 큐를 읽고 지우는 것을 한 번에 (여러 워커가 동시에 flush해도 같은 이벤트를 두 번 가져가지 않음)
+DRAIN_EVENTS_LUA = """
+local events = redis.call('LRANGE', KEYS[1], 0, -1)
+redis.call('DEL', KEYS[1])
+return events
+"""
+DRAIN_EVENTS_SHA = hashlib.sha1(DRAIN_EVENTS_LUA.encode()).hexdigest()
+
+recent_table = user_recent_novel_table
+
+# (user_pk, novel_pk) 단위 upsert, 늦게 도착한 이벤트가 더 최근 기록을 덮어쓰지 않도록 GREATEST
+_upsert = insert(recent_table)
+RECENT_UPSERT = _upsert.on_duplicate_key_update(
+    viewed_date=func.greatest(recent_table.c.viewed_date, _upsert.inserted.viewed_date)
+)
+
+
+def recent_key(user_pk: int) -> str:
+    """사용자별 최근 본 소설 키"""
+    return f"{RECENT_KEY_PREFIX}:{user_pk}"
+
+
+async def record_recent_view(redis_client: Redis, user_pk: int, novel_pk: int):
+    """
+    최근 본 소설을 Redis에 기록하고 DB 반영 이벤트를 큐에 추가
+    기록이 만료돼 키가 없으면 먼저 DB의 기록으로 채움 (방금 본 소설 하나만 남아 이전 기록이 가려지지 않도록)
+    """
+    key = recent_key(user_pk)
+    if not await redis_client.exists(key):
+        await warm_recent(redis_client, user_pk, await run_with_async_session(get_recent_history, user_pk))
+
+    now = time.time()
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zadd(key, {novel_pk: now})
+        pipe.zremrangebyrank(key, 0, -(RECENT_HISTORY_LIMIT + 1))
+        pipe.expire(key, RECENT_HISTORY_TTL)
+        pipe.rpush(RECENT_EVENTS_KEY, f"{user_pk}:{novel_pk}:{now}")
+        await pipe.execute()
+
+
+async def get_recent_novel_pks(redis_client: Redis, user_pk: int, limit: int) -> Optional[list[int]]:
+    """
+    최근 본 순서의 novel_pk 목록
+    :return: Redis에 기록이 없으면 None (DB에서 읽어 warm_recent로 채움)
+    """
+    key = recent_key(user_pk)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.exists(key)
+        pipe.zrevrange(key, 0, limit - 1)
+        exists, members = await pipe.execute()
+    if not exists:
+        return None
+    return [int(member) for member in members]
+
+
+async def warm_recent(redis_client: Redis, user_pk: int, rows: list[tuple[int, datetime]]):
+    """DB에서 읽은 (novel_pk, viewed_date)로 Redis 기록 채움 (그 사이 새로 본 기록은 덮어쓰지 않음)"""
+    if not rows:
+        return
+    key = recent_key(user_pk)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zadd(key, {novel_pk: viewed_date.timestamp() for novel_pk, viewed_date in rows}, nx=True)
+        pipe.zremrangebyrank(key, 0, -(RECENT_HISTORY_LIMIT + 1))
+        pipe.expire(key, RECENT_HISTORY_TTL)
+        await pipe.execute()
+
+
+def get_recent_history(db: Session, user_pk: int) -> list[tuple[int, datetime]]:
+    """DB에 반영된 최근 본 소설 기록 (novel_pk, viewed_date) 최신순"""
+    return [
+        (row.novel_pk, row.viewed_date)
+        for row in db.execute(
+            select(recent_table.c.novel_pk, recent_table.c.viewed_date)
+            .where(recent_table.c.user_pk == user_pk)
+            .order_by(recent_table.c.viewed_date.desc())
+            .limit(RECENT_HISTORY_LIMIT)
+        )
+    ]
+
+
+async def _drain(redis_client: Redis) -> list[str]:
+    """
+    이벤트 큐를 원자적으로 비우고 내용을 반환
+    가져간 이벤트는 이 flush만 소유하므로 DB 반영 후 지울 키가 남지 않음
+    """
+    try:
+        return await redis_client.evalsha(DRAIN_EVENTS_SHA, 1, RECENT_EVENTS_KEY)
+    except NoScriptError:
+        return await redis_client.eval(DRAIN_EVENTS_LUA, 1, RECENT_EVENTS_KEY)
+
+
+def apply_recent_views(events: list[str]):
+    """
+    이벤트를 (user_pk, novel_pk)별 최신 시각으로 합친 뒤
+    INSERT ... ON DUPLICATE KEY UPDATE로 일괄 반영하고, 사용자별 최근 N개만 남김
+    """
+    latest: dict[tuple[int, int], float] = {}
+    for event in events:
+        user_pk, novel_pk, viewed_at = event.split(":")
+        pair = (int(user_pk), int(novel_pk))
+        latest[pair] = max(latest.get(pair, 0.0), float(viewed_at))
+    if not latest:
+        return
+
+    user_pks = sorted({user_pk for user_pk, _ in latest})
+    novel_pks = sorted({novel_pk for _, novel_pk in latest})
+    ranked = (
+        select(
+            recent_table.c.user_pk,
+            recent_table.c.novel_pk,
+            func.row_number().over(
+                partition_by=recent_table.c.user_pk,
+                order_by=(recent_table.c.viewed_date.desc(), recent_table.c.novel_pk.desc()),
+            ).label("rank"),
+        )
+        .where(recent_table.c.user_pk.in_(user_pks))
+        .subquery()
+    )
+
+    db = SessionLocal()
+    try:
+        # 그 사이 삭제된 사용자/소설의 이벤트는 버림 (FK 오류로 배치 전체가 실패하지 않도록)
+        live_users = set(db.execute(select(User.user_pk).where(User.user_pk.in_(user_pks))).scalars())
+        live_novels = set(db.execute(select(Novel.novel_pk).where(Novel.novel_pk.in_(novel_pks))).scalars())
+        rows = [
+            {"user_pk": user_pk, "novel_pk": novel_pk, "viewed_date": datetime.fromtimestamp(viewed_at)}
+            for (user_pk, novel_pk), viewed_at in latest.items()
+            if user_pk in live_users and novel_pk in live_novels
+        ]
+        if rows:
+            db.execute(RECENT_UPSERT, rows)
+        # 사용자별 최근 N개 초과분 삭제
+        db.execute(
+            delete(recent_table).where(
+                recent_table.c.user_pk == ranked.c.user_pk,
+                recent_table.c.novel_pk == ranked.c.novel_pk,
+                ranked.c.rank > RECENT_HISTORY_LIMIT,
+            )
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def flush_recent_views(redis_client: Redis) -> int:
+    """
+    대기 중인 최근 본 소설 이벤트를 DB에 반영
+    반영 전에 프로세스가 죽으면 그 주기의 이벤트는 유실될 수 있으나 Redis 기록은 그대로 남음
+    :return: 반영된 이벤트 수
+    """
+    events = await _drain(redis_client)
+    if not events:
+        return 0
+    try:
+        await run_in_threadpool(apply_recent_views, events)
+    except Exception:
+        # 다음 flush에서 다시 반영 (같은 이벤트가 섞여도 upsert가 GREATEST라 결과는 같음)
+        await redis_client.rpush(RECENT_EVENTS_KEY, *events)
+        raise
+    return len(events)
+
+
+async def run_recent_flusher(redis_client: Redis, interval: int = RECENT_FLUSH_SECONDS):
+    """lifespan에서 실행되는 주기적 최근 본 소설 반영 작업"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_recent_views(redis_client)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ 최근 본 소설 반영 실패: {e}")
@@ -0,0 +1,74 @@
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
+from redis import Redis
+
+# 일별 선호작 버킷 (sorted set: member=novel_pk, score=해당 일자 선호작 증감)
+TRENDING_BUCKET_PREFIX = "trending:likes"
+TRENDING_WINDOW_PREFIX = "trending:window"
+MAX_WINDOW_DAYS = 30  # 가장 긴 집계 기간 (월간 베스트)
+WINDOW_CACHE_TTL = 60  # ZUNIONSTORE 결과 재사용 시간 (초)
+
+
+def bucket_key(day: date) -> str:
+    """일별 선호작 버킷 키"""
+    return f"{TRENDING_BUCKET_PREFIX}:{day:%Y%m%d}"
+
+
+def window_key(days: int) -> str:
+    """N일 집계 결과 키"""
+    return f"{TRENDING_WINDOW_PREFIX}:{days}"
+
+
+def bucket_keys(days: int, today: Optional[date] = None) -> list[str]:
+    """오늘을 포함한 최근 N일의 버킷 키 목록"""
+    today = today or datetime.now().date()
+    return [bucket_key(today - timedelta(days=i)) for i in range(days)]
+
+
+async def record_like(redis_client: Redis, novel_pk: int, liked: bool):
+    """
+    선호작 등록/취소를 오늘 버킷에 반영
+    버킷은 가장 긴 집계 기간이 지나면 자동 만료
+    """
+    key = bucket_key(datetime.now().date())
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zincrby(key, 1 if liked else -1, novel_pk)
+        pipe.expire(key, int(timedelta(days=MAX_WINDOW_DAYS + 1).total_seconds()))
+        await pipe.execute()
+
+
+async def top_novels(redis_client: Redis, days: int, limit: int = 10) -> list[tuple[int, int]]:
+    """
+    최근 N일 동안 선호작이 가장 많이 늘어난 소설 목록
+    :return: [(novel_pk, 선호작 증가 수), ...] 내림차순
+    """
+    key = window_key(days)
+    if not await redis_client.exists(key):
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.zunionstore(key, bucket_keys(days))
+            pipe.zremrangebyscore(key, "-inf", 0)  # 취소가 더 많은 소설 제외
+            pipe.expire(key, WINDOW_CACHE_TTL)
+            await pipe.execute()
+
+    rows = await redis_client.zrevrange(key, 0, limit - 1, withscores=True)
+    return [(int(member), int(score)) for member, score in rows]
+
+
+async def rebuild_buckets(redis_client: Redis, daily_counts: Iterable[tuple[date, int, int]]):
+    """
+    DB(userlike)에서 집계한 일별 선호작 수로 버킷을 다시 생성
+    :param daily_counts: (liked_day, novel_pk, count) 목록
+    """
+    today = datetime.now().date()
+    ttl = int(timedelta(days=MAX_WINDOW_DAYS + 1).total_seconds())
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(*bucket_keys(MAX_WINDOW_DAYS + 1, today))
+        pipe.delete(*[window_key(days) for days in range(1, MAX_WINDOW_DAYS + 1)])
+        for liked_day, novel_pk, count in daily_counts:
+            key = bucket_key(liked_day)
+            pipe.zadd(key, {novel_pk: count})
+            # 버킷 일자 기준으로 만료 시간을 맞춤
+            remaining = ttl - (today - liked_day).days * 86400
+            pipe.expire(key, max(remaining, 1))
+        await pipe.execute()
@@ -0,0 +1,120 @@
+import asyncio
+import hashlib
+import os
+
+from fastapi.concurrency import run_in_threadpool
+from redis import Redis
+from redis.exceptions import NoScriptError
+from sqlalchemy import update, bindparam
+
+from database import SessionLocal
+from models import Episode, Novel
+
+# 조회수 버퍼 (hash: field=pk, value=누적 조회수)
+EPISODE_VIEWS_KEY = "views:episode"
+NOVEL_VIEWS_KEY = "views:novel"
+VIEW_FLUSH_SECONDS = int(os.getenv("VIEW_FLUSH_SECONDS", "5"))
+
+# 버퍼를 읽고 지우는 것을 한 번에 (여러 워커가 동시에 flush해도 같은 조회수를 두 번 가져가지 않음)
+DRAIN_VIEWS_LUA = """
+local drained = {}
+for i, key in ipairs(KEYS) do
+    drained[i] = redis.call('HGETALL', key)
+    redis.call('DEL', key)
+end
+return drained
+"""
+DRAIN_VIEWS_SHA = hashlib.sha1(DRAIN_VIEWS_LUA.encode()).hexdigest()
+
+episode_table = Episode.__table__
+novel_table = Novel.__table__
+
+# pk별 조회수를 한 번의 executemany UPDATE로 반영 (updated_date는 갱신하지 않음)
+EPISODE_VIEWS_UPDATE = (
+    update(episode_table)
+    .where(episode_table.c.ep_pk == bindparam("b_pk"))
+    .values(views=episode_table.c.views + bindparam("b_views"), updated_date=episode_table.c.updated_date)
+)
+NOVEL_VIEWS_UPDATE = (
+    update(novel_table)
+    .where(novel_table.c.novel_pk == bindparam("b_pk"))
+    .values(views=novel_table.c.views + bindparam("b_views"), updated_date=novel_table.c.updated_date)
+)
+
+
+async def record_view(redis_client: Redis, novel_pk: int, ep_pk: int):
+    """에피소드 조회 1회를 Redis 버퍼에 누적 (DB 쓰기 없음)"""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hincrby(EPISODE_VIEWS_KEY, ep_pk, 1)
+        pipe.hincrby(NOVEL_VIEWS_KEY, novel_pk, 1)
+        await pipe.execute()
+
+
+async def _drain(redis_client: Redis, *keys: str) -> list[dict[int, int]]:
+    """
+    버퍼(hash)들을 원자적으로 비우고 키별 {pk: 조회수}를 반환
+    가져간 조회수는 이 flush만 소유하므로 DB 반영 후 지울 키가 남지 않음
+    """
+    try:
+        drained = await redis_client.evalsha(DRAIN_VIEWS_SHA, len(keys), *keys)
+    except NoScriptError:
+        drained = await redis_client.eval(DRAIN_VIEWS_LUA, len(keys), *keys)
+    return [
+        {int(pk): int(views) for pk, views in zip(flat[::2], flat[1::2]) if int(views)}
+        for flat in drained
+    ]
+
+
+async def _restore(redis_client: Redis, episode_counts: dict[int, int], novel_counts: dict[int, int]):
+    """DB 반영에 실패한 조회수를 버퍼에 되돌려 다음 flush에서 다시 반영"""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for ep_pk, views in episode_counts.items():
+            pipe.hincrby(EPISODE_VIEWS_KEY, ep_pk, views)
+        for novel_pk, views in novel_counts.items():
+            pipe.hincrby(NOVEL_VIEWS_KEY, novel_pk, views)
+        await pipe.execute()
+
+
+def apply_view_counts(episode_counts: dict[int, int], novel_counts: dict[int, int]):
+    """누적된 조회수를 Episode.views, Novel.views에 한 트랜잭션으로 반영"""
+    db = SessionLocal()
+    try:
+        if episode_counts:
+            db.execute(EPISODE_VIEWS_UPDATE, [{"b_pk": pk, "b_views": views} for pk, views in episode_counts.items()])
+        if novel_counts:
+            db.execute(NOVEL_VIEWS_UPDATE, [{"b_pk": pk, "b_views": views} for pk, views in novel_counts.items()])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def flush_views(redis_client: Redis) -> int:
+    """
+    Redis 버퍼의 조회수를 DB에 반영
+    반영 전에 프로세스가 죽으면 그 주기의 조회수는 유실될 수 있으나 중복 반영되지는 않음
+    :return: 반영된 에피소드 수
+    """
+    episode_counts, novel_counts = await _drain(redis_client, EPISODE_VIEWS_KEY, NOVEL_VIEWS_KEY)
+    if not (episode_counts or novel_counts):
+        return 0
+    try:
+        await run_in_threadpool(apply_view_counts, episode_counts, novel_counts)
+    except Exception:
+        await _restore(redis_client, episode_counts, novel_counts)
+        raise
+    return len(episode_counts)
+
+
+async def run_view_flusher(redis_client: Redis, interval: int = VIEW_FLUSH_SECONDS):
+    """lifespan에서 실행되는 주기적 조회수 반영 작업"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_views(redis_client)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ 조회수 반영 실패: {e}")
@@ -1,7 +1,7 @@
 import axios from 'axios'
 import { debounce } from 'lodash'
 
-import { useCallback, useEffect, useMemo, useState } from 'react'
+import { useCallback, useEffect, useRef, useState } from 'react'
 
 import { useNavigate } from 'react-router-dom'
 
@@ -9,6 +9,7 @@ import FavoriteIcon from '@mui/icons-material/Favorite'
 import SearchIcon from '@mui/icons-material/Search'
 import VisibilityIcon from '@mui/icons-material/Visibility'
 import Box from '@mui/material/Box'
+import Button from '@mui/material/Button'
 import Card from '@mui/material/Card'
 import CardActionArea from '@mui/material/CardActionArea'
 import CardContent from '@mui/material/CardContent'
@@ -32,39 +33,97 @@ const BACKEND_URL = `${import.meta.env.VITE_BACKEND_PROTOCOL}://${import.meta.en
 axios.defaults.baseURL = BACKEND_URL
 axios.defaults.withCredentials = true
 
+// 한 번에 불러오는 소설 수
+const PAGE_SIZE = 20
+// 검색 API 최소 글자 수
+const SEARCH_MIN_LENGTH = 2
+
 const NovelList = () => {
   const navigate = useNavigate()
   const [novels, setNovels] = useState([])
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [error, setError] = useState(null)
   const [searchQuery, setSearchQuery] = useState('')
-  const [sortBy, setSortBy] = useState('title')
+  const [sortBy, setSortBy] = useState('latest')
   const [genre, setGenre] = useState('all')
   const [genres, setGenres] = useState([])
   const [searchInputValue, setSearchInputValue] = useState('')
+  // 목록: 다음 페이지 cursor, 검색: 다음 페이지 번호 (null이면 마지막 페이지)
+  const [nextPage, setNextPage] = useState(null)
+  // 조건이 바뀐 뒤 도착한 이전 요청의 응답은 무시
+  const requestIdRef = useRef(0)
 
-  useEffect(() => {
-    const fetchNovels = async () => {
-      setLoading(true)
-      try {
-        const response = await axios.get(`${BACKEND_URL}/api/v1/novels`)
-        setNovels(response.data)
+  const isSearching = searchQuery.trim().length >= SEARCH_MIN_LENGTH
 
-        // 모든 소설의 장르를 추출하고 중복 제거
-        const allGenres = response.data.flatMap((novel) => novel.genre)
-        const uniqueGenres = Array.from(new Map(allGenres.map((g) => [g.genre_pk, g])).values()).sort((a, b) =>
-          a.genre.localeCompare(b.genre, 'ko')
-        )
+  useEffect(() => {
+    axios
+      .get(`${BACKEND_URL}/api/v1/genres`)
+      .then((response) => {
+        setGenres([...response.data].sort((a, b) => a.genre.localeCompare(b.genre, 'ko')))
+      })
+      .catch((err) => setError(err.message))
+  }, [])
 
-        setGenres(uniqueGenres)
-      } catch (err) {
-        setError(err.message)
+  // 정렬, 장르, 검색은 서버에서 처리하고 next_cursor(검색은 page)로 이어서 불러옴
+  const fetchPage = useCallback(
+    async (page) => {
+      if (isSearching) {
+        const pageNumber = page ?? 1
+        const response = await axios.get(`${BACKEND_URL}/api/v1/novels/search`, {
+          params: { q: searchQuery.trim(), page: pageNumber, size: PAGE_SIZE },
+        })
+        const { results, total, size } = response.data
+        return {
+          items: results.map((hit) => hit.novel),
+          next: pageNumber * size < total ? pageNumber + 1 : null,
+        }
       }
-      setLoading(false)
-    }
 
-    fetchNovels()
-  }, [])
+      const response = await axios.get(`${BACKEND_URL}/api/v1/novels`, {
+        params: {
+          sort: sortBy === 'popular' ? 'likes' : 'updated',
+          limit: PAGE_SIZE,
+          genre: genre === 'all' ? undefined : genre,
+          cursor: page ?? undefined,
+        },
+      })
+      return { items: response.data.novels, next: response.data.next_cursor }
+    },
+    [isSearching, searchQuery, sortBy, genre]
+  )
+
+  useEffect(() => {
+    const requestId = ++requestIdRef.current
+    setLoading(true)
+    setError(null)
+    fetchPage(null)
+      .then(({ items, next }) => {
+        if (requestId !== requestIdRef.current) return
+        setNovels(items)
+        setNextPage(next)
+      })
+      .catch((err) => {
+        if (requestId === requestIdRef.current) setError(err.message)
+      })
+      .finally(() => {
+        if (requestId === requestIdRef.current) setLoading(false)
+      })
+  }, [fetchPage])
+
+  const handleLoadMore = useCallback(async () => {
+    const requestId = requestIdRef.current
+    setLoadingMore(true)
+    try {
+      const { items, next } = await fetchPage(nextPage)
+      if (requestId !== requestIdRef.current) return
+      setNovels((prev) => [...prev, ...items])
+      setNextPage(next)
+    } catch (err) {
+      if (requestId === requestIdRef.current) setError(err.message)
+    }
+    setLoadingMore(false)
+  }, [fetchPage, nextPage])
 
   const debouncedSearch = useCallback(
     debounce((value) => {
@@ -102,42 +161,6 @@ const NovelList = () => {
     event.target.src = placeholderImage
   }
 
-  const filteredNovels = useMemo(() => {
-    return novels
-      .filter((novel) => {
-        // 검색어 필터링
-        if (searchQuery) {
-          const searchLower = searchQuery.toLowerCase()
-          const titleMatch = novel.title.toLowerCase().includes(searchLower)
-          return titleMatch
-        }
-        return true
-      })
-      .filter((novel) => {
-        // 장르 필터링
-        if (genre === 'all') return true
-        return novel.genre.some((g) => g.genre_pk === genre)
-      })
-      .sort((a, b) => {
-        // 정렬
-        switch (sortBy) {
-          case 'latest':
-            return new Date(b.created_date) - new Date(a.created_date)
-          case 'popular':
-            return b.likes - a.likes
-          case 'views':
-            return b.views - a.views
-          case 'title':
-            return a.title.localeCompare(b.title, 'ko')
-          default:
-            return 0
-        }
-      })
-  }, [novels, searchQuery, genre, sortBy])
-
-  if (loading) return <Typography sx={{ textAlign: 'center', mt: 4 }}>로딩 중...</Typography>
-  if (error) return <Typography sx={{ textAlign: 'center', mt: 4, color: 'red' }}>{error}</Typography>
-
   return (
     <Box sx={{ p: 3, maxWidth: 1200, mx: 'auto' }}>
       {/* 검색 및 필터 섹션 */}
@@ -165,19 +188,18 @@ const NovelList = () => {
         />
         <FormControl sx={{ minWidth: 120 }}>
           <InputLabel>정렬</InputLabel>
-          <Select value={sortBy} onChange={handleSortChange} label="정렬">
-            <MenuItem value="title">이름순</MenuItem>
+          {/* 검색 결과는 관련도순이라 정렬/장르 선택은 검색 중에는 비활성화 */}
+          <Select value={sortBy} onChange={handleSortChange} label="정렬" disabled={isSearching}>
             <MenuItem value="latest">최신순</MenuItem>
             <MenuItem value="popular">인기순</MenuItem>
-            <MenuItem value="views">조회순</MenuItem>
           </Select>
         </FormControl>
         <FormControl sx={{ minWidth: 120 }}>
           <InputLabel>장르</InputLabel>
-          <Select value={genre} onChange={handleGenreChange} label="장르">
+          <Select value={genre} onChange={handleGenreChange} label="장르" disabled={isSearching}>
             <MenuItem value="all">전체</MenuItem>
             {genres.map((g) => (
-              <MenuItem key={g.genre_pk} value={g.genre_pk}>
+              <MenuItem key={g.genre_pk} value={g.genre}>
                 {g.genre}
               </MenuItem>
             ))}
@@ -185,9 +207,13 @@ const NovelList = () => {
         </FormControl>
       </Stack>
 
+      {/* 검색어 입력 중 포커스를 잃지 않도록 필터는 그대로 두고 목록 자리에만 표시 */}
+      {loading && <Typography sx={{ textAlign: 'center', mt: 4 }}>로딩 중...</Typography>}
+      {error && <Typography sx={{ textAlign: 'center', mt: 4, color: 'red' }}>{error}</Typography>}
+
       {/* 소설 목록 그리드 */}
       <Grid container spacing={3}>
-        {filteredNovels.map((novel) => (
+        {novels.map((novel) => (
           <Grid size={{ xs: 12, sm: 6, md: 3 }} key={novel.novel_pk}>
             <Card
               sx={{
@@ -255,6 +281,14 @@ const NovelList = () => {
           </Grid>
         ))}
       </Grid>
+
+      {!loading && nextPage !== null && (
+        <Box sx={{ display: 'flex', justifyContent: 'center', mt: 4 }}>
+          <Button variant="outlined" onClick={handleLoadMore} disabled={loadingMore}>
+            {loadingMore ? '불러오는 중...' : '더 보기'}
+          </Button>
+        </Box>
+      )}
     </Box>
   )
 }